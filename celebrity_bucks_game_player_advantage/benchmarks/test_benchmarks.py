@@ -0,0 +1,142 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import replay
+import pytest
+import os
+
+
+#Benchmarks are timed with pytest-benchmark and skipped without it: poetry run pytest benchmarks --benchmark-only
+pytest.importorskip('pytest_benchmark')
+
+
+#Initializing parameter values for benchmarks
+fixtures_dir = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures')
+api_url = 'https://celebritybucks.com/developers/export/JSON'
+celebritybucks_url = 'https://celebritybucks.com/celebrity/2488/Barack-Obama'
+astroseek_url = 'https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope'
+
+SIZES = [10, 100, 1000, 10000]
+PIPELINE_SIZES = [10, 100, 1000]
+LOOKUPS = 100
+
+html_cb = replay.load_response(fixtures_dir, celebritybucks_url).content
+html_as = replay.load_response(fixtures_dir, astroseek_url).content
+soup_cb = create_celebrity_data_set.parse_page(html_cb, create_celebrity_data_set.CELEBRITYBUCKS_HOST)
+soup_as = create_celebrity_data_set.parse_page(html_as, create_celebrity_data_set.ASTROSEEK_HOST)
+
+
+def make_api_object(size):
+	return({'CelebrityValues':[{'celebId':str(num), 'name':f'Celebrity {num}', 'price':1000000 - num} for num in range(size)]})
+
+
+def make_lookup_names(size):
+	step = max(1, size // LOOKUPS)
+	return([f'Celebrity {num}' for num in range(0, size, step)][0:LOOKUPS])
+
+
+class FixtureSession:
+	"""
+	Answers every Celebrity Bucks and Astro Seek webpage request with the recorded Barack Obama webpage, so collection runs of any size are timed without network I/O.
+	"""
+	def __init__(self):
+		self.responses = {'/celebrity/':replay.load_response(fixtures_dir, celebritybucks_url),
+						  '/birth-chart/':replay.load_response(fixtures_dir, astroseek_url)}
+
+	def get(self, url, timeout=None, headers=None):
+		for path, response in self.responses.items():
+			if path in url:
+				return(response)
+		return(replay.load_response(fixtures_dir, api_url))
+
+
+#Celebrity Bucks API lookups
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_lookup_payload(benchmark, size):
+	api_object = make_api_object(size)
+	names = make_lookup_names(size)
+	benchmark(lambda: [create_celebrity_data_set.get_celebritybucks_price(api_object, name) for name in names])
+
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_lookup_index(benchmark, size):
+	index = create_celebrity_data_set.CelebrityIndex(make_api_object(size))
+	names = make_lookup_names(size)
+	benchmark(lambda: [create_celebrity_data_set.get_celebritybucks_price(index, name) for name in names])
+
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_lookup_batch(benchmark, size):
+	api_object = make_api_object(size)
+	names = make_lookup_names(size)
+	benchmark(create_celebrity_data_set.lookup_celebrities, api_object, names)
+
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_build_index(benchmark, size):
+	api_object = make_api_object(size)
+	benchmark(create_celebrity_data_set.CelebrityIndex, api_object)
+
+
+#Soup construction
+@pytest.mark.parametrize('parse_only', [False, True])
+@pytest.mark.parametrize('host, content', [(create_celebrity_data_set.CELEBRITYBUCKS_HOST, html_cb), (create_celebrity_data_set.ASTROSEEK_HOST, html_as)])
+def test_benchmark_parse_page(benchmark, host, content, parse_only):
+	benchmark(create_celebrity_data_set.parse_page, content, host, None, parse_only)
+
+
+#Extractors
+@pytest.mark.parametrize('extractor', [create_celebrity_data_set.get_gender,
+									   create_celebrity_data_set.get_age,
+									   create_celebrity_data_set.get_birth_date,
+									   create_celebrity_data_set.upcoming_birthday,
+									   create_celebrity_data_set.us_nationality,
+									   create_celebrity_data_set.living_status,
+									   create_celebrity_data_set.get_astroseek_attributes])
+def test_benchmark_astroseek_extractor(benchmark, extractor):
+	benchmark(extractor, soup_as)
+
+@pytest.mark.parametrize('extractor', [create_celebrity_data_set.get_avg_21_day_price,
+									   create_celebrity_data_set.get_all_time_high_price,
+									   create_celebrity_data_set.get_days_since_ath,
+									   create_celebrity_data_set.get_cb_rec,
+									   create_celebrity_data_set.get_celebritybucks_attributes])
+def test_benchmark_celebritybucks_extractor(benchmark, extractor):
+	benchmark(extractor, soup_cb)
+
+
+#Row assembly
+def test_benchmark_get_celeb_record(benchmark):
+	index = create_celebrity_data_set.CelebrityIndex(make_api_object(10))
+	session = FixtureSession()
+	benchmark(create_celebrity_data_set.get_celeb_record, index, 'Celebrity 0', session=session)
+
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_assemble_frame(benchmark, size):
+	record = create_celebrity_data_set.get_celeb_record(make_api_object(1), 'Celebrity 0', session=FixtureSession())
+	records = [dict(record, Celebrity=f'Celebrity {num}') for num in range(size)]
+
+	def assemble():
+		buffer = create_celebrity_data_set.CelebRecordBuffer(create_celebrity_data_set.CELEB_COLUMNS + create_celebrity_data_set.DERIVED_SOURCE_COLUMNS)
+		for record in records:
+			buffer.append(record)
+		return(create_celebrity_data_set.add_derived_metrics(buffer.to_frame())[create_celebrity_data_set.CELEB_COLUMNS])
+
+	assert len(benchmark(assemble)) == size
+
+
+#CSV output
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_write_csv(benchmark, tmp_path, size):
+	record = create_celebrity_data_set.get_celeb_record(make_api_object(1), 'Celebrity 0', session=FixtureSession())
+	buffer = create_celebrity_data_set.CelebRecordBuffer()
+	for num in range(size):
+		buffer.append(dict(record, Celebrity=f'Celebrity {num}'))
+	df = buffer.to_frame()
+	benchmark(create_celebrity_data_set.write_snapshot, df, str(tmp_path / 'celebrity_data_attributes.csv'))
+
+
+#Fetch, parse and assemble end to end
+@pytest.mark.parametrize('workers_per_host', [1, 4])
+@pytest.mark.parametrize('size', PIPELINE_SIZES)
+def test_benchmark_collect_celeb_data(benchmark, size, workers_per_host):
+	api_object = make_api_object(size)
+	session = FixtureSession()
+	df = benchmark.pedantic(create_celebrity_data_set.collect_celeb_data, args=(api_object,), kwargs={'workers_per_host':workers_per_host, 'progress':False, 'session':session}, rounds=1, iterations=1)
+	assert len(df) == size
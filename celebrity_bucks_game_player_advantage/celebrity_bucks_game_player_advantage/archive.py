@@ -0,0 +1,199 @@
+#Importing dependencies
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+from celebrity_bucks_game_player_advantage.response_cache import build_response
+
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+
+#File extensions of stored bodies for each compression
+_EXTENSIONS = {'zstd':'.zst', 'gzip':'.gz'}
+
+
+class PageArchive:
+	"""
+	A compressed, content-addressed archive of fetched API JSON and webpage bodies kept in a directory. Each body is stored once under the SHA-256 hash of its content, compressed with zstd when the zstandard package is installed and with gzip otherwise. Every crawl keeps an append-only manifest mapping the URLs it fetched to the stored bodies, so the extractors can be re-run over a past crawl without touching the network.
+
+	Parameters
+	----------
+	  path : str
+	    The archive directory.
+
+	  compression : str, optional
+	    Either 'zstd' or 'gzip'. Defaults to 'zstd' if the zstandard package is installed and 'gzip' otherwise.
+
+	Examples
+	--------
+	>>> archive = PageArchive('../data/archive')
+	>>> crawl_id = set_archive(archive)
+	>>> df = collect_celeb_data(get_celebritybucks_api_object())
+	>>> df_backfill = reextract_crawl(archive, crawl_id)
+	"""
+	def __init__(self, path, compression=None):
+		if compression is None:
+			compression = 'gzip' if zstandard is None else 'zstd'
+		assert compression in _EXTENSIONS, "Compression must be either 'zstd' or 'gzip'."
+		assert compression != 'zstd' or zstandard is not None, "zstd compression requires the zstandard package."
+
+		self.path = path
+		self.compression = compression
+		self._lock = threading.Lock()
+		os.makedirs(os.path.join(path, 'objects'), exist_ok=True)
+		os.makedirs(os.path.join(path, 'crawls'), exist_ok=True)
+
+	def store(self, content):
+		"""
+		Stores a body, unless a body with the same content is already stored, and returns its SHA-256 hash.
+		"""
+		digest = hashlib.sha256(content).hexdigest()
+		if self._find_object(digest) is not None:
+			return(digest)
+
+		object_path = self._get_object_path(digest, self.compression)
+		os.makedirs(os.path.dirname(object_path), exist_ok=True)
+		temporary_path = f'{object_path}.{threading.get_ident()}.tmp'
+		with open(temporary_path, 'wb') as object_file:
+			object_file.write(_compress(content, self.compression))
+		os.replace(temporary_path, object_path)
+		return(digest)
+
+	def load(self, digest):
+		"""
+		Returns the body stored under a SHA-256 hash, or None if it is not stored.
+		"""
+		found = self._find_object(digest)
+		if found is None:
+			return(None)
+
+		object_path, compression = found
+		with open(object_path, 'rb') as object_file:
+			return(_decompress(object_file.read(), compression))
+
+	def add_to_crawl(self, crawl_id, url, response):
+		"""
+		Stores the body of a response fetched during a crawl and records it in the crawl's manifest.
+		"""
+		digest = self.store(response.content)
+		entry = {'url':url,
+				 'status_code':response.status_code,
+				 'content_type':response.headers.get('Content-Type'),
+				 'digest':digest,
+				 'fetched_at':datetime.now().isoformat()}
+
+		with self._lock:
+			with open(self._get_manifest_path(crawl_id), 'a') as manifest_file:
+				manifest_file.write(json.dumps(entry) + '\n')
+		return(digest)
+
+	def get_crawls(self):
+		"""
+		Returns the IDs of the archived crawls, oldest first.
+		"""
+		return(sorted(file_name[:-len('.jsonl')] for file_name in os.listdir(os.path.join(self.path, 'crawls')) if file_name.endswith('.jsonl')))
+
+	def get_manifest(self, crawl_id):
+		"""
+		Returns a dictionary mapping every URL fetched during a crawl to its latest manifest entry.
+		"""
+		manifest = {}
+		with open(self._get_manifest_path(crawl_id)) as manifest_file:
+			for line in manifest_file:
+				if line.strip():
+					entry = json.loads(line)
+					manifest[entry['url']] = entry
+		return(manifest)
+
+	def get_response(self, crawl_id, url, manifest=None):
+		"""
+		Returns the archived response to a URL fetched during a crawl as a requests.Response, or None if the URL was not fetched.
+		"""
+		if manifest is None:
+			manifest = self.get_manifest(crawl_id)
+
+		entry = manifest.get(url)
+		if entry is None:
+			return(None)
+
+		content = self.load(entry['digest'])
+		headers = {} if entry.get('content_type') is None else {'Content-Type':entry['content_type']}
+		return(build_response(url, entry['status_code'], headers, content))
+
+	def _get_manifest_path(self, crawl_id):
+		return(os.path.join(self.path, 'crawls', f'{crawl_id}.jsonl'))
+
+	def _get_object_path(self, digest, compression):
+		return(os.path.join(self.path, 'objects', digest[0:2], f'{digest}{_EXTENSIONS[compression]}'))
+
+	def _find_object(self, digest):
+		for compression in _EXTENSIONS:
+			object_path = self._get_object_path(digest, compression)
+			if os.path.exists(object_path):
+				return(object_path, compression)
+		return(None)
+
+
+class ArchiveReplaySession:
+	"""
+	A session that answers requests from the responses archived during a past crawl without touching the network. Requests for URLs that were not fetched during the crawl are answered with an empty 404 response.
+
+	Parameters
+	----------
+	  archive : PageArchive
+	    The archive holding the crawl.
+
+	  crawl_id : str
+	    The ID of the crawl.
+
+	Examples
+	--------
+	>>> session = ArchiveReplaySession(PageArchive('../data/archive'), '2020-12-11_19_46_49')
+	>>> api_object = get_celebritybucks_api_object(session)
+	"""
+	def __init__(self, archive, crawl_id):
+		self.archive = archive
+		self.crawl_id = crawl_id
+		self.manifest = archive.get_manifest(crawl_id)
+
+	def get(self, url, timeout=None, headers=None):
+		response = self.archive.get_response(self.crawl_id, url, self.manifest)
+		if response is None:
+			return(build_response(url, 404, {}, b''))
+		return(response)
+
+
+def create_crawl_id():
+	"""
+	Returns a crawl ID for a crawl starting now.
+
+	Returns
+	-------
+	str
+	    The current time, formatted like the names of saved data sets
+
+	Examples
+	--------
+	>>> create_crawl_id()
+	'2020-12-11_19_46_49'
+	"""
+	return(datetime.now().strftime('%Y-%m-%d_%H_%M_%S'))
+
+
+def _compress(content, compression):
+	if compression == 'zstd':
+		return(zstandard.ZstdCompressor(level=10).compress(content))
+	return(gzip.compress(content, compresslevel=6))
+
+
+def _decompress(content, compression):
+	if compression == 'zstd':
+		assert zstandard is not None, "Reading zstd compressed bodies requires the zstandard package."
+		return(zstandard.ZstdDecompressor().decompress(content))
+	return(gzip.decompress(content))
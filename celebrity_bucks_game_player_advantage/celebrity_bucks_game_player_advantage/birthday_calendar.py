@@ -0,0 +1,127 @@
+#Importing dependencies
+import calendar
+from datetime import date, datetime, timedelta
+
+from celebrity_bucks_game_player_advantage.lazy_import import LazyModule
+
+pd = LazyModule('pandas')
+
+
+#Number of calendar days indexed, one per day of a leap year
+_DAYS_IN_INDEX = 366
+
+#First day of the leap year whose days of the year key the index
+_INDEX_YEAR_START = date(2000, 1, 1)
+
+#Day of the year of February 29 in the index
+_LEAP_DAY = (date(2000, 2, 29) - _INDEX_YEAR_START).days
+
+
+class BirthdayCalendar:
+	"""
+	An index of celebrity birth dates by day of the year, built once from collected records so that upcoming birthdays across every celebrity are found without scraping. Finding the birthdays in the next k days visits only those k days, whatever the number of celebrities. Windows wrap around the end of the year, and birthdays on February 29 are celebrated on February 28 outside leap years, as in `add_derived_metrics`.
+
+	Parameters
+	----------
+	  birth_dates : dict, optional
+	    A dictionary mapping celebrity names to their birth dates. 'NaN' and missing birth dates are skipped.
+
+	Examples
+	--------
+	>>> birthdays = BirthdayCalendar.from_frame(collect_celeb_data(api_object, birth_dates=True))
+	>>> birthdays.get_upcoming_birthdays(3, today=date(2020, 12, 11))
+	[('Hailee Steinfeld', 0), ('Jay-Z', 2)]
+	"""
+	def __init__(self, birth_dates=None):
+		self._days = [[] for day in range(_DAYS_IN_INDEX)]
+		self._birth_dates = {}
+
+		if birth_dates is not None:
+			for celebrity, birth_date in birth_dates.items():
+				self.add(celebrity, birth_date)
+
+	@classmethod
+	def from_frame(cls, df):
+		"""
+		Builds a calendar from a data frame with 'Celebrity' and 'Birth Date' columns, such as a data set returned by `collect_celeb_data` with `birth_dates=True`.
+		"""
+		return(cls(dict(zip(df['Celebrity'], df['Birth Date']))))
+
+	def __len__(self):
+		return(len(self._birth_dates))
+
+	def add(self, celebrity, birth_date):
+		"""
+		Adds or replaces the birth date of a celebrity. 'NaN' and missing birth dates are skipped.
+		"""
+		birth_date = _to_date(birth_date)
+		if birth_date is None:
+			return
+
+		if celebrity in self._birth_dates:
+			self._days[_day_of_year(self._birth_dates[celebrity])].remove(celebrity)
+		self._birth_dates[celebrity] = birth_date
+		self._days[_day_of_year(birth_date)].append(celebrity)
+
+	def get_birth_date(self, celebrity):
+		"""
+		Returns the birth date of a celebrity, or None if it is not in the calendar.
+		"""
+		return(self._birth_dates.get(celebrity))
+
+	def get_birthdays_on(self, day):
+		"""
+		Returns the celebrities whose birthday is celebrated on a given date, in the order they were added.
+		"""
+		day = _to_date(day)
+		celebrities = list(self._days[_day_of_year(day)])
+
+		#Birthdays on February 29 are celebrated on February 28 outside leap years
+		if day.month == 2 and day.day == 28 and not calendar.isleap(day.year):
+			celebrities += self._days[_LEAP_DAY]
+		return(celebrities)
+
+	def get_upcoming_birthdays(self, days=7, today=None):
+		"""
+		Returns the celebrities whose birthday falls within a number of days from today, inclusive, as (celebrity, days until the birthday) tuples, soonest first.
+		"""
+		assert days >= 0, "Number of days must be non-negative."
+		if today is None:
+			today = date.today()
+		today = _to_date(today)
+
+		#Stopping a day before the same date next year, so that every birthday is found at most once
+		offsets = min(days, (_add_year(today) - today).days - 1)
+
+		upcoming = []
+		for offset in range(offsets + 1):
+			upcoming += [(celebrity, offset) for celebrity in self.get_birthdays_on(today + timedelta(days=offset))]
+		return(upcoming)
+
+
+def _to_date(value):
+	if value is None or (isinstance(value, str) and value == 'NaN'):
+		return(None)
+	if isinstance(value, str):
+		value = pd.Timestamp(value)
+	#Missing values of any type, including pandas.NaT and pandas.NA, never equal themselves
+	try:
+		if value != value:
+			return(None)
+	except TypeError:
+		return(None)
+	#pandas.Timestamp subclasses datetime, so dates are read without importing pandas
+	if isinstance(value, datetime):
+		return(value.date())
+	return(value)
+
+
+def _add_year(day):
+	try:
+		return(day.replace(year=day.year+1))
+	except ValueError:
+		return(date(day.year+1, 2, 28))
+
+
+def _day_of_year(day):
+	return((date(2000, day.month, day.day) - _INDEX_YEAR_START).days)
@@ -1,872 +1,2956 @@
 #Importing dependencies
-import bs4
+import argparse
+import calendar
+import hashlib
 import json
+import multiprocessing
 import os
-import pandas as pd
-import requests
+import re
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from datetime import datetime
 from datetime import date
-
-
-#Functions for acquiring celebrity data objects
-def get_celebritybucks_api_object():
+from urllib.parse import urlsplit
+
+from celebrity_bucks_game_player_advantage.archive import ArchiveReplaySession, PageArchive, create_crawl_id
+from celebrity_bucks_game_player_advantage.lazy_import import LazyModule
+from celebrity_bucks_game_player_advantage.metrics import CrawlMetrics
+from celebrity_bucks_game_player_advantage.price_history import PriceHistoryStore
+from celebrity_bucks_game_player_advantage.rate_limit import HostRateLimiter, RETRY_STATUS_CODES, get_retry_delay
+from celebrity_bucks_game_player_advantage.replay import RecordingSession, ReplaySession
+from celebrity_bucks_game_player_advantage.response_cache import ResponseCache, get_revalidation_headers
+from celebrity_bucks_game_player_advantage.slug_index import SlugIndex
+
+#Imported on first use, so that index lookups and price math start without them
+asyncio = LazyModule('asyncio')
+bs4 = LazyModule('bs4')
+pd = LazyModule('pandas')
+requests = LazyModule('requests')
+
+
+#Hosts scraped for celebrity attributes
+CELEBRITYBUCKS_HOST = 'celebritybucks.com'
+ASTROSEEK_HOST = 'www.astro-seek.com'
+
+#Base URLs of the scraped hosts, which `set_base_url` can point at a local stub server
+DEFAULT_BASE_URLS = {CELEBRITYBUCKS_HOST:'https://celebritybucks.com',
+					 ASTROSEEK_HOST:'https://www.astro-seek.com'}
+
+#Default HTTP settings for fetching celebrity data
+DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+
+#Default HTML parser backend, any tree builder name accepted by bs4.BeautifulSoup
+DEFAULT_PARSER = 'html.parser'
+
+_session = None
+_session_lock = threading.Lock()
+_response_cache = None
+_rate_limiter = None
+_slug_index = None
+_archive = None
+_crawl_id = None
+_metrics = None
+_base_urls = dict(DEFAULT_BASE_URLS)
+
+#Columns of the celebrity attribute data frame, in order
+CELEB_COLUMNS = ['Celebrity',
+				 'Current Ranking',
+				 'Current Price',
+				 'Avg. 21-Day Price',
+				 'Avg. 21-Day Price/Current Price',
+				 'All-Time High Price',
+				 'All-Time High Price/Current Price',
+				 'Days Since All-Time High Price',
+				 'Gender',
+				 'Age',
+				 'Upcoming Birthday',
+				 'U.S. Nationality',
+				 'Living Status',
+				 'Celebrity Bucks Recommendation',
+				 'Last Update']
+
+#Compact dtypes of the celebrity attribute data frame columns in typed snapshots
+CELEB_DTYPES = {'Celebrity':'string',
+				'Current Ranking':'Int32',
+				'Current Price':'Int32',
+				'Avg. 21-Day Price':'Int32',
+				'Avg. 21-Day Price/Current Price':'float32',
+				'All-Time High Price':'Int32',
+				'All-Time High Price/Current Price':'float32',
+				'Days Since All-Time High Price':'Int32',
+				'Gender':'category',
+				'Age':'Int32',
+				'Upcoming Birthday':'category',
+				'U.S. Nationality':'category',
+				'Living Status':'category',
+				'Celebrity Bucks Recommendation':'category',
+				'Last Update':'datetime64[ns]',
+				'Birth Date':'datetime64[ns]'}
+
+#Date columns of collected records from which `add_derived_metrics` recomputes time-dependent columns
+DERIVED_SOURCE_COLUMNS = ['All-Time High Date',
+						  'Birth Date']
+
+#Columns of checkpointed records and of data sets collected with `birth_dates`, keeping 'Birth Date' for resumed records and for building a BirthdayCalendar
+BIRTH_DATE_COLUMNS = CELEB_COLUMNS + ['Birth Date']
+
+#Orders in which `prioritise_celebrities` can schedule celebrities for a crawl
+CRAWL_PRIORITIES = ['rank', 'price_movement', 'staleness']
+
+#Astro Seek attributes of celebrities without a birth chart, as returned by `get_astroseek_attributes` for an empty page
+MISSING_ASTROSEEK_ATTRIBUTES = {'Gender':'NaN',
+								'Age':'NaN',
+								'Upcoming Birthday':'NaN',
+								'U.S. Nationality':'NaN',
+								'Living Status':'NaN',
+								'Birth Date':'NaN'}
+
+#Columns collected from Astro Seek, which rarely change between snapshots
+ASTROSEEK_COLUMNS = ['Gender',
+					 'Age',
+					 'Upcoming Birthday',
+					 'U.S. Nationality',
+					 'Living Status']
+
+
+#Functions for managing HTTP sessions
+def create_session(pool_maxsize=DEFAULT_POOL_MAXSIZE):
 	"""
-	Returns a dictionary containing celebrity rankings and price values from the Celebrity Bucks API. Source: https://celebritybucks.com/developers/.
+	Returns a requests.Session that keeps connections to the Celebrity Bucks and Astro Seek hosts alive between requests, with a separate connection pool for each host.
 
 	Parameters
 	----------
-	 	  
+	  pool_maxsize : int or dict, optional
+	    The maximum number of connections kept alive per host, either as a single value for every host or as a dictionary mapping host names to values.
+
 	Returns
 	-------
-	dict
-	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+	requests.Session
+	    A session with a connection pool mounted for each scraped host.
 
 	Examples
 	--------
-	>>> api_object = get_celebritybucks_api_object()
-	>>> type(api_object)
-	dict
+	>>> session = create_session(pool_maxsize={'celebritybucks.com': 8, 'www.astro-seek.com': 4})
+	>>> session.get_adapter('https://www.astro-seek.com/')._pool_maxsize
+	4
 	"""
-	r = requests.get(f'https://celebritybucks.com/developers/export/JSON')
-	if r.status_code!=200:
-		print('API request is NOT successful. Check https://celebritybucks.com/developers and your API query before retrying.')
-		sys.exit()
-	elif r.status_code==200:
-		print('API request is successful.')
+	if isinstance(pool_maxsize, int):
+		pool_maxsize = {CELEBRITYBUCKS_HOST:pool_maxsize, ASTROSEEK_HOST:pool_maxsize}
 
-	api_object = r.json()
-	return(api_object)
+	assert all(maxsize >= 1 for maxsize in pool_maxsize.values()), "Pool size must be at least 1."
 
+	session = requests.Session()
+	for host, maxsize in pool_maxsize.items():
+		session.mount(f'https://{host}/', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=maxsize))
+	return(session)
 
-def get_celebrity_list(api_object):
+
+def get_session():
 	"""
-	Returns a ranked list of celebrities generated from a Celebrity Bucks API call. Source: https://celebritybucks.com/developers/.
+	Returns the shared requests.Session used by the fetch functions when no session is passed to them, creating it on first use.
 
 	Parameters
 	----------
-	  api_object : dict
-	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
-	 	  
+
 	Returns
 	-------
-	list
-	    A list of celebrities ranked by their current price values in the Celebrity Bucks API call.
+	requests.Session
+	    The shared session.
 
 	Examples
 	--------
-	>>> celebrities = get_celebrity_list()
-	>>> len(celebrities)
-	717	
-	>>> celebrities[0:3]
-	['Taylor Swift','Donald Trump','Kim Kardashian']
+	>>> get_session() is get_session()
+	True
 	"""
-	celebrities = []
-
-	for index in range(len(api_object['CelebrityValues'])):
-		celebrities.append(api_object['CelebrityValues'][index]['name'])
-
-	return(celebrities)
+	global _session
+	with _session_lock:
+		if _session is None:
+			_session = create_session()
+		return(_session)
 
 
-def get_celebritybucks_soup_object(api_object, celebrity=""):
+def set_session(session):
 	"""
-	Returns a bs4.BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. Source: https://celebritybucks.com/celebrities/.
+	Replaces the shared requests.Session used by the fetch functions when no session is passed to them. Passing None restores a default session on next use.
 
 	Parameters
 	----------
-	  celebrity : str
-	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
-	  
+	  session : requests.Session
+	    The session to share, or None.
+
 	Returns
 	-------
-	bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity.
 
 	Examples
 	--------
-	>>> soup_cb = get_celebritybucks_soup_object("Jamie Foxx")
-	>>> type(soup_cb)
-	bs4.BeautifulSoup
+	>>> set_session(create_session(pool_maxsize=20))
 	"""
-	assert type(celebrity) == str, "Input value must be of type string."
+	global _session
+	with _session_lock:
+		_session = session
 
-	celeb_name_split = celebrity.split()
-	celeb_name = '-'.join(celeb_name_split)
 
-	celebID = get_celebritybucks_ID(api_object, celebrity)
+def set_response_cache(cache):
+	"""
+	Sets the ResponseCache consulted by the fetch functions when no cache is passed to them. Passing None disables caching.
+
+	Parameters
+	----------
+	  cache : ResponseCache
+	    The cache to share, or None.
 
-	celebrity_bucks_url = f'https://celebritybucks.com/celebrity/{celebID}/{celeb_name}'
+	Returns
+	-------
 
-	celebrity_bucks_html = requests.get(celebrity_bucks_url)
-	soup_cb_object = bs4.BeautifulSoup(celebrity_bucks_html.content, 'html.parser')
-	return(soup_cb_object)
+	Examples
+	--------
+	>>> set_response_cache(ResponseCache('../data/response_cache.sqlite'))
+	"""
+	global _response_cache
+	_response_cache = cache
 
 
-def get_astroseek_soup_object(celebrity=""):
+def set_rate_limiter(rate_limiter):
 	"""
-	Returns a bs4.BeautifulSoup object containing HTML from the Astro Seek webpage corresponding to a given celebrity. Source: https://www.astro-seek.com/.
+	Sets the HostRateLimiter that paces the fetch functions when no rate limiter is passed to them. Passing None disables pacing.
 
 	Parameters
 	----------
-	  celebrity : str
-	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
-	  
+	  rate_limiter : HostRateLimiter
+	    The rate limiter to share, or None.
+
 	Returns
 	-------
-	bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity.
 
 	Examples
 	--------
-	>>> soup_as = get_astroseek_soup_object("Gwen Stefani")
-	>>> type(soup_as)
-	bs4.BeautifulSoup	
+	>>> set_rate_limiter(HostRateLimiter(requests_per_second=2))
 	"""
-	assert type(celebrity) == str, "Input value must be of type string."
-
-	celeb_name_split = celebrity.replace(".","").replace("'","-").split()
-	celeb_name = '-'.join(celeb_name_split)
-
-	astro_seek_url = f'https://www.astro-seek.com/birth-chart/{celeb_name}-horoscope'
-
-	astro_seek_html = requests.get(astro_seek_url)
-	soup_as_object = bs4.BeautifulSoup(astro_seek_html.content, 'html.parser')
-	return(soup_as_object)
+	global _rate_limiter
+	_rate_limiter = rate_limiter
 
 
-def create_celeb_df():
+def set_slug_index(slug_index):
 	"""
-	Creates an empty Pandas data frame in which to store celebrity attributes collected in other functions.
+	Sets the SlugIndex consulted for the Astro Seek slug of every celebrity and updated with the outcome of every Astro Seek request. Celebrities it holds as known misses are not requested from Astro Seek. Passing None disables the index.
 
 	Parameters
 	----------
-	
+	  slug_index : SlugIndex
+	    The slug index to use, or None.
+
 	Returns
 	-------
-	pandas.core.frame.DataFrame
-	    A Pandas data frame with column names that correspond to celebrity attributes collected in other functions.
 
 	Examples
 	--------
-	>>> df = create_celeb_df()
-	>>> df.to_dict()
-	{'Celebrity': {},
-	 'Current Ranking': {},
-	 'Current Price': {},
-	 'Avg. 21-Day Price': {},
-	 'Avg. 21-Day Price/Current Price': {},
-	 'All-Time High Price': {},
-	 'All-Time High Price/Current Price': {},
-	 'Days Since All-Time High Price': {},
-	 'Gender': {},
-	 'Age': {},
-	 'Upcoming Birthday': {},
-	 'U.S. Nationality': {},
-	 'Living Status': {},
-	 'Celebrity Bucks Recommendation': {},
-	 'Last Update': {}}	
+	>>> set_slug_index(SlugIndex('../data/slug_index.sqlite'))
 	"""
-	df = pd.DataFrame(columns = ['Celebrity',
-								 'Current Ranking',
-								 'Current Price',
-								 'Avg. 21-Day Price',
-								 'Avg. 21-Day Price/Current Price',
-								 'All-Time High Price',
-								 'All-Time High Price/Current Price',
-								 'Days Since All-Time High Price',
-								 'Gender',
-								 'Age',
-								 'Upcoming Birthday',
-								 'U.S. Nationality',
-								 'Living Status',
-								 'Celebrity Bucks Recommendation',
-								 'Last Update'])
-	return(df)
+	global _slug_index
+	_slug_index = slug_index
 
 
-#Functions for acquiring celebrity attributes
-def get_celebritybucks_ranking(api_object, celebrity=""):
+def set_archive(archive, crawl_id=None):
 	"""
-	Returns the Celebrity Bucks ranking for a given celebrity from the Celebrity Bucks API.
+	Sets the PageArchive in which every response returned by the fetch functions is stored under a crawl ID, including fresh and revalidated responses from the response cache. Passing None disables archiving.
 
 	Parameters
 	----------
-	  api_object : dict
-	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
-	  celebrity : str
-	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
-	  
+	  archive : PageArchive
+	    The archive to store responses in, or None.
+
+	  crawl_id : str, optional
+	    The ID of the crawl. Defaults to the current time.
+
 	Returns
 	-------
-	int
-	  The current Celebrity Bucks ranking of the celebrity
+	str
+	    The ID of the crawl, or None if archiving is disabled
 
 	Examples
 	--------
-	>>> get_celebritybucks_ranking('LeBron James')
-	75
-	>>> get_celebritybucks_ranking("Eminem")
-	209
+	>>> set_archive(PageArchive('../data/archive'))
+	'2020-12-11_19_46_49'
 	"""
-	assert type(celebrity) == str, "Input value must be of type string."
-
-	for index in range(len(api_object['CelebrityValues'])):
-		if api_object['CelebrityValues'][index]['name'] == celebrity:
-			return(index+1)
-		else:
-			next
-	return(f'{celebrity} not found within CelebrityBucks data set.')
+	global _archive, _crawl_id
+	_archive = archive
+	_crawl_id = None if archive is None else create_crawl_id() if crawl_id is None else crawl_id
+	return(_crawl_id)
 
 
-def get_celebritybucks_price(api_object, celebrity=""):
+def set_metrics(metrics):
 	"""
-	Returns the Celebrity Bucks price for a given celebrity from the Celebrity Bucks API.
+	Sets the CrawlMetrics that record stage timings and counters of the fetch, parse and attribute functions. Passing None disables instrumentation.
 
 	Parameters
 	----------
-	  api_object : dict
-	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
-	  celebrity : str
-	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
-	  
+	  metrics : CrawlMetrics
+	    The metrics to record to, or None.
+
 	Returns
 	-------
-	int
-	  The current Celebrity Bucks dollar value associated with the celebrity
 
 	Examples
 	--------
-	>>> get_celebritybucks_price('Donald Trump')
-	334000
+	>>> metrics = CrawlMetrics()
+	>>> set_metrics(metrics)
 	"""
-	assert type(celebrity) == str, "Input value must be of type string."
+	global _metrics
+	_metrics = metrics
 
-	for index in range(len(api_object['CelebrityValues'])):
-		if api_object['CelebrityValues'][index]['name'] == celebrity:
-			return(api_object['CelebrityValues'][index]['price'])
-		else:
-			next
-	return(f'{celebrity} not found within CelebrityBucks data set.')
 
+def _time_stage(stage, **labels):
+	if _metrics is None:
+		return(nullcontext())
+	return(_metrics.time(stage, **labels))
 
-def get_celebritybucks_ID(api_object, celebrity=""):
+
+def _count(name, **labels):
+	if _metrics is not None:
+		_metrics.increment(name, **labels)
+
+
+def get_base_url(host):
 	"""
-	Returns the four-digit Celebrity Bucks ID value for a given celebrity from the Celebrity Bucks API.
+	Returns the base URL that webpages of a scraped host are requested from.
 
 	Parameters
 	----------
-	  api_object : dict
-	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
-	  celebrity : str
-	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
-	  
+	  host : str
+	    The scraped host, either `CELEBRITYBUCKS_HOST` or `ASTROSEEK_HOST`.
+
 	Returns
 	-------
 	str
-	  The Celebrity Bucks four-digit ID value associated with the celebrity
+	    The base URL of the host's webpages
 
 	Examples
 	--------
-	>>> get_celebritybucks_ID("Eminem")
-	'2488'
+	>>> get_base_url(ASTROSEEK_HOST)
+	'https://www.astro-seek.com'
 	"""
-	assert type(celebrity) == str, "Input value must be of type string."
-
-	for index in range(len(api_object['CelebrityValues'])):
-		if api_object['CelebrityValues'][index]['name'] == celebrity:
-			return(api_object['CelebrityValues'][index]['celebId'])
-		else:
-			next
-	return(f'{celebrity} not found within CelebrityBucks data set.')
+	return(_base_urls[host])
 
 
-def get_gender(soup_object):
+def set_base_url(host, base_url=None):
 	"""
-	Returns the gender associated with a given celebrity. Source: https://www.astro-seek.com/.
+	Sets the base URL that webpages of a scraped host are requested from, such as the URL of a `replay.StubServer`. Passing None restores the host's default base URL.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
-	  
+	  host : str
+	    The scraped host, either `CELEBRITYBUCKS_HOST` or `ASTROSEEK_HOST`.
+
+	  base_url : str, optional
+	    The base URL to request the host's webpages from, without a trailing slash.
+
 	Returns
 	-------
-	str
-	  The gender associated with the celebrity
 
 	Examples
 	--------
-	>>> get_gender(soup_taylor_swift)
-	'Female'
+	>>> set_base_url(ASTROSEEK_HOST, 'http://127.0.0.1:8000/www.astro-seek.com')
 	"""
-	try:
-		return(soup_object.find_all(class_='fl')[1].get_text().strip())
-	except:
-		return('NaN')
+	assert host in DEFAULT_BASE_URLS, f"Unknown host {host}."
+	_base_urls[host] = DEFAULT_BASE_URLS[host] if base_url is None else base_url.rstrip('/')
 
 
-def get_age(soup_object):
+def fetch_url(url, session=None, timeout=None, cache=None, rate_limiter=None, retries=None):
 	"""
-	Returns the age of a given celebrity. Source: https://www.astro-seek.com/.
+	Sends a GET request for a given URL through a pooled session and returns the response. When a response cache is in use, fresh cached responses are returned without a request and expired ones are revalidated with the server. Every returned response is stored in the archive set with `set_archive`, if any. Requests are paced by the rate limiter in use, and connection errors and 429 or 5xx responses are retried with jittered exponential backoff, honouring Retry-After.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
-	  
+	  url : str
+	    The URL to request.
+
+	  session : requests.Session, optional
+	    The session to send the request through. Defaults to the shared session.
+
+	  timeout : float, optional
+	    The number of seconds to wait for the server before giving up. Defaults to `DEFAULT_TIMEOUT`.
+
+	  cache : ResponseCache, optional
+	    The response cache to consult. Defaults to the cache set with `set_response_cache`, if any.
+
+	  rate_limiter : HostRateLimiter, optional
+	    The rate limiter pacing the request. Defaults to the rate limiter set with `set_rate_limiter`, if any.
+
+	  retries : int, optional
+	    The number of times to retry a failed request. Defaults to `DEFAULT_RETRIES`.
+
 	Returns
 	-------
-	int
-	  The age of the celebrity
+	requests.Response
+	    The server's response, or the cached response if it is fresh or unchanged.
 
 	Examples
 	--------
-	>>> get_age(soup_meryl_streep)
-	71
+	>>> fetch_url('https://celebritybucks.com/developers/export/JSON').status_code
+	200
 	"""
-	try:
-		return(int(soup_object.find_all(class_='fl')[-5].get_text().strip()[2:5]))
-	except:
+	if session is None:
+		session = get_session()
+	if timeout is None:
+		timeout = DEFAULT_TIMEOUT
+
+	if cache is None:
+		cache = _response_cache
+	if rate_limiter is None:
+		rate_limiter = _rate_limiter
+	if retries is None:
+		retries = DEFAULT_RETRIES
+
+	host = urlsplit(url).hostname
+
+	cached_response, fresh = (None, False) if cache is None else cache.get(url)
+	if cache is not None:
+		_count('cache_hits' if fresh else 'cache_misses', host=host)
+	if fresh:
+		return(_archive_response(url, cached_response))
+
+	headers = {} if cached_response is None else get_revalidation_headers(cached_response)
+
+	for attempt in range(1, retries + 2):
+		if attempt > 1:
+			_count('retries', host=host)
 		try:
-			return(int(soup_object.find_all(class_='fl')[-3].get_text().strip()[0:3]))
-		except:
-			return('NaN')
+			with rate_limiter.limit(url) if rate_limiter is not None else nullcontext():
+				start = time.perf_counter()
+				response = session.get(url, timeout=timeout, headers=headers)
+				_observe_response(host, response, time.perf_counter() - start)
+		except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+			_count('request_errors', host=host)
+			if attempt > retries:
+				raise
+			time.sleep(get_retry_delay(attempt, backoff=DEFAULT_BACKOFF))
+			continue
 
+		if response.status_code not in RETRY_STATUS_CODES:
+			if rate_limiter is not None:
+				rate_limiter.recover(url)
+			break
 
-def get_year():
+		if rate_limiter is not None and response.status_code == 429:
+			rate_limiter.throttle(url)
+		if attempt > retries:
+			break
+		time.sleep(get_retry_delay(attempt, response, backoff=DEFAULT_BACKOFF))
+
+	if cache is None:
+		return(_archive_response(url, response))
+
+	if response.status_code == 304 and cached_response is not None:
+		_count('cache_revalidations', host=host)
+		cache.refresh(url)
+		return(_archive_response(url, cached_response))
+
+	cache.store(url, response)
+	return(_archive_response(url, response))
+
+
+def _archive_response(url, response):
+	#Archiving after cache resolution, so that cached responses reach the crawl's manifest too
+	if _archive is not None and response.status_code != 304:
+		_archive.add_to_crawl(_crawl_id, url, response)
+	return(response)
+
+
+def _observe_response(host, response, seconds):
+	if _metrics is None:
+		return
+
+	_metrics.increment('requests', host=host, status=response.status_code)
+	_metrics.observe('fetch', seconds, host=host)
+
+	#requests times a response up to its headers, covering DNS, connecting and waiting on the server, and reads the body after
+	elapsed = getattr(response, 'elapsed', None)
+	if elapsed is not None and elapsed.total_seconds() > 0:
+		_metrics.observe('time_to_headers', elapsed.total_seconds(), host=host)
+		_metrics.observe('transfer', max(0.0, seconds - elapsed.total_seconds()), host=host)
+
+
+#Functions for parsing webpages
+_AnyOfStrainer = None
+
+def _get_any_of_strainer(*strainers):
 	"""
-	Returns the current calendar year unless the current date is within the first seven days of its year.
+	Returns a bs4.SoupStrainer that keeps every top-level element allowed by at least one of several strainers, along with its contents. It overrides the tree-building hooks of bs4 4.13 and later, hence the minimum version in pyproject.toml. The strainer class is defined on first use, as it subclasses a bs4 class.
+	"""
+	global _AnyOfStrainer
+	if _AnyOfStrainer is None:
+		class AnyOfStrainer(bs4.SoupStrainer):
+			def __init__(self, *strainers):
+				super().__init__()
+				self.strainers = strainers
+
+			@property
+			def excludes_everything(self):
+				return(False)
+
+			def allow_tag_creation(self, nsprefix, name, attrs):
+				return(any(strainer.allow_tag_creation(nsprefix, name, attrs) for strainer in self.strainers))
+
+			def allow_string_creation(self, string):
+				return(False)
+
+		_AnyOfStrainer = AnyOfStrainer
+	return(_AnyOfStrainer(*strainers))
+
+
+def get_parse_only(host):
+	"""
+	Returns a bs4.SoupStrainer that keeps only the elements read by the attribute extractors for a given host's webpages.
 
 	Parameters
 	----------
-	 	  
+	  host : str
+	    Either `CELEBRITYBUCKS_HOST` or `ASTROSEEK_HOST`.
+
 	Returns
 	-------
-	int
-	  The current year or the prior year if the current date is within the first seven days of the year
+	bs4.SoupStrainer
+	    A strainer keeping the 'panel-body center' and role='alert' elements of Celebrity Bucks pages, or the 'fl' elements of Astro Seek pages.
 
 	Examples
 	--------
-	>>> get_year()
-	2020
+	>>> get_parse_only(ASTROSEEK_HOST)
+	<SoupStrainer ...>
 	"""
-	today = datetime.today()
-	if today.month==1 and today.day<=7:
-		return(today.year+1)
-	else:
-		return(today.year)
+	if host == CELEBRITYBUCKS_HOST:
+		return(_get_any_of_strainer(bs4.SoupStrainer(class_='panel-body center'), bs4.SoupStrainer(role='alert')))
+	elif host == ASTROSEEK_HOST:
+		return(bs4.SoupStrainer(class_='fl'))
+	raise ValueError(f'No elements are extracted from {host} webpages.')
 
 
-def upcoming_birthday(soup_object):
+def parse_page(content, host, parser=None, parse_only=False):
 	"""
-	Identifies whether a given celebrity will have a birthday within the next seven days. Source: https://www.astro-seek.com/.
+	Returns a bs4.BeautifulSoup object built from the HTML of a Celebrity Bucks or Astro Seek webpage.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
-	  
+	  content : bytes or str
+	    The HTML of the webpage.
+
+	  host : str
+	    The host the webpage was fetched from, either `CELEBRITYBUCKS_HOST` or `ASTROSEEK_HOST`.
+
+	  parser : str, optional
+	    The bs4 tree builder to parse with, such as 'html.parser' or 'lxml'. Defaults to `DEFAULT_PARSER`.
+
+	  parse_only : bool, optional
+	    Whether to build only the elements read by the attribute extractors, which lowers parsing time and memory.
+
 	Returns
 	-------
-	str
-	  A binary declaration as to whether the celebrity has or does not have a birthday upcoming in the following week
+	bs4.BeautifulSoup
+	    A BeautifulSoup object containing the webpage's HTML.
 
 	Examples
 	--------
-	>>> upcoming_birthday(soup_harrison_ford)
-	'No upcoming birthday'
-	>>> upcoming_birthday(soup_billie_eilish)
-	'Upcoming birthday'
+	>>> soup_as = parse_page(astro_seek_html.content, ASTROSEEK_HOST, parser='lxml', parse_only=True)
+	>>> type(soup_as)
+	bs4.BeautifulSoup
 	"""
-	months = {'January':1,'February':2,'March':3,'April':4,'May':5,'June':6,'July':7,'August':8,'September':9,'October':10,'November':11,'December':12}
-	try:
-		month_str = soup_object.find_all(class_='fl')[3].find(class_='tenky-modry').get_text().strip().split()[1]
-		month = months[month_str]
-		day = int(soup_object.find_all(class_='fl')[3].find(class_='tenky-modry').get_text().strip().split()[0])
-		year = get_year()
+	if parser is None:
+		parser = DEFAULT_PARSER
 
-		current_date = date.today()
-
-		delta = date(year,month,day) - date.today()
-
-		if delta.days >=0 and delta.days<=7:
-			return('Upcoming birthday')
-		else:
-			return('No upcoming birthday')
-	except:
-		return('NaN')
+	with _time_stage('parse', host=host):
+		if parse_only:
+			return(bs4.BeautifulSoup(content, parser, parse_only=get_parse_only(host)))
+		return(bs4.BeautifulSoup(content, parser))
 
 
-def us_nationality(soup_object):
+#Functions for acquiring celebrity data objects
+def get_celebritybucks_api_object(session=None, timeout=None):
 	"""
-	Identifies whether a given celebrity is a U.S. national. Source: https://www.astro-seek.com/.
+	Returns a dictionary containing celebrity rankings and price values from the Celebrity Bucks API, raising a requests.exceptions.HTTPError if the request is not successful. Source: https://celebritybucks.com/developers/.
 
 	Parameters
 	----------
+	  session : requests.Session, optional
+	    The session to send the request through. Defaults to the shared session.
+
+	  timeout : float, optional
+	    The number of seconds to wait for the server before giving up. Defaults to `DEFAULT_TIMEOUT`.
+	 	  
+	Returns
+	-------
+	dict
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+
+	Examples
+	--------
+	>>> api_object = get_celebritybucks_api_object()
+	>>> type(api_object)
+	dict
+	"""
+	r = fetch_url(f'{_base_urls[CELEBRITYBUCKS_HOST]}/developers/export/JSON', session, timeout)
+	if r.status_code!=200:
+		raise requests.exceptions.HTTPError(f'API request is NOT successful (status {r.status_code}). Check https://celebritybucks.com/developers and your API query before retrying.', response=r)
+	elif r.status_code==200:
+		print('API request is successful.')
+
+	api_object = r.json()
+	return(api_object)
+
+
+def get_celebrity_list(api_object):
+	"""
+	Returns a ranked list of celebrities generated from a Celebrity Bucks API call. Source: https://celebritybucks.com/developers/.
+
+	Parameters
+	----------
+	  api_object : dict
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+	 	  
+	Returns
+	-------
+	list
+	    A list of celebrities ranked by their current price values in the Celebrity Bucks API call.
+
+	Examples
+	--------
+	>>> celebrities = get_celebrity_list()
+	>>> len(celebrities)
+	717	
+	>>> celebrities[0:3]
+	['Taylor Swift','Donald Trump','Kim Kardashian']
+	"""
+	celebrities = []
+
+	for index in range(len(api_object['CelebrityValues'])):
+		celebrities.append(api_object['CelebrityValues'][index]['name'])
+
+	return(celebrities)
+
+
+def get_celebritybucks_url(api_object, celebrity=""):
+	"""
+	Returns the URL of the Celebrity Bucks webpage corresponding to a given celebrity. Source: https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  api_object : dict
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+	  
+	Returns
+	-------
+	str
+	    The URL of the celebrity's Celebrity Bucks webpage
+
+	Examples
+	--------
+	>>> get_celebritybucks_url(api_object, 'Barack Obama')
+	'https://celebritybucks.com/celebrity/2488/Barack-Obama'
+	"""
+	assert type(celebrity) == str, "Input value must be of type string."
+
+	celeb_name_split = celebrity.split()
+	celeb_name = '-'.join(celeb_name_split)
+
+	celebID = get_celebritybucks_ID(api_object, celebrity)
+
+	return(f'{_base_urls[CELEBRITYBUCKS_HOST]}/celebrity/{celebID}/{celeb_name}')
+
+
+def get_astroseek_url(celebrity=""):
+	"""
+	Returns the URL of the Astro Seek birth chart webpage corresponding to a given celebrity, using the slug recorded in the slug index if one is set. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+	  
+	Returns
+	-------
+	str
+	    The URL of the celebrity's Astro Seek birth chart webpage
+
+	Examples
+	--------
+	>>> get_astroseek_url("Conan O'Brien")
+	'https://www.astro-seek.com/birth-chart/Conan-O-Brien-horoscope'
+	"""
+	assert type(celebrity) == str, "Input value must be of type string."
+
+	celeb_name = None if _slug_index is None else _slug_index.get_slug(celebrity)
+	if celeb_name is None:
+		celeb_name = get_astroseek_slug(celebrity)
+
+	return(f'{_base_urls[ASTROSEEK_HOST]}/birth-chart/{celeb_name}-horoscope')
+
+
+def get_astroseek_slug(celebrity=""):
+	"""
+	Returns the slug of the Astro Seek birth chart webpage of a given celebrity under the default rules, before any confirmed slug or override in the slug index.
+
+	Parameters
+	----------
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes.
+
+	Returns
+	-------
+	str
+	    The slug built from the celebrity's name
+
+	Examples
+	--------
+	>>> get_astroseek_slug("Conan O'Brien")
+	'Conan-O-Brien'
+	"""
+	assert type(celebrity) == str, "Input value must be of type string."
+
+	celeb_name_split = celebrity.replace(".","").replace("'","-").split()
+	return('-'.join(celeb_name_split))
+
+
+def get_celebritybucks_soup_object(api_object, celebrity="", session=None, timeout=None, parser=None, parse_only=False):
+	"""
+	Returns a bs4.BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. Source: https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+
+	  session : requests.Session, optional
+	    The session to send the request through. Defaults to the shared session.
+
+	  timeout : float, optional
+	    The number of seconds to wait for the server before giving up. Defaults to `DEFAULT_TIMEOUT`.
+
+	  parser : str, optional
+	    The bs4 tree builder to parse with, such as 'html.parser' or 'lxml'. Defaults to `DEFAULT_PARSER`.
+
+	  parse_only : bool, optional
+	    Whether to build only the elements read by the attribute extractors, which lowers parsing time and memory.
+	  
+	Returns
+	-------
+	bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity.
+
+	Examples
+	--------
+	>>> soup_cb = get_celebritybucks_soup_object("Jamie Foxx")
+	>>> type(soup_cb)
+	bs4.BeautifulSoup
+	"""
+	celebrity_bucks_html = fetch_url(get_celebritybucks_url(api_object, celebrity), session, timeout)
+	soup_cb_object = parse_page(celebrity_bucks_html.content, CELEBRITYBUCKS_HOST, parser, parse_only)
+	return(soup_cb_object)
+
+
+def get_astroseek_soup_object(celebrity="", session=None, timeout=None, parser=None, parse_only=False):
+	"""
+	Returns a bs4.BeautifulSoup object containing HTML from the Astro Seek webpage corresponding to a given celebrity. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+
+	  session : requests.Session, optional
+	    The session to send the request through. Defaults to the shared session.
+
+	  timeout : float, optional
+	    The number of seconds to wait for the server before giving up. Defaults to `DEFAULT_TIMEOUT`.
+
+	  parser : str, optional
+	    The bs4 tree builder to parse with, such as 'html.parser' or 'lxml'. Defaults to `DEFAULT_PARSER`.
+
+	  parse_only : bool, optional
+	    Whether to build only the elements read by the attribute extractors, which lowers parsing time and memory.
+	  
+	Returns
+	-------
+	bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity.
+
+	Examples
+	--------
+	>>> soup_as = get_astroseek_soup_object("Gwen Stefani")
+	>>> type(soup_as)
+	bs4.BeautifulSoup	
+	"""
+	#Known misses in the slug index are answered with an empty webpage, without a request
+	if _slug_index is not None and _slug_index.is_miss(celebrity):
+		return(parse_page('', ASTROSEEK_HOST, parser, parse_only))
+
+	astro_seek_html = fetch_url(get_astroseek_url(celebrity), session, timeout)
+	soup_as_object = parse_page(astro_seek_html.content, ASTROSEEK_HOST, parser, parse_only)
+	return(soup_as_object)
+
+
+def create_celeb_df():
+	"""
+	Creates an empty Pandas data frame in which to store celebrity attributes collected in other functions.
+
+	Parameters
+	----------
+	
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	    A Pandas data frame with column names that correspond to celebrity attributes collected in other functions.
+
+	Examples
+	--------
+	>>> df = create_celeb_df()
+	>>> df.to_dict()
+	{'Celebrity': {},
+	 'Current Ranking': {},
+	 'Current Price': {},
+	 'Avg. 21-Day Price': {},
+	 'Avg. 21-Day Price/Current Price': {},
+	 'All-Time High Price': {},
+	 'All-Time High Price/Current Price': {},
+	 'Days Since All-Time High Price': {},
+	 'Gender': {},
+	 'Age': {},
+	 'Upcoming Birthday': {},
+	 'U.S. Nationality': {},
+	 'Living Status': {},
+	 'Celebrity Bucks Recommendation': {},
+	 'Last Update': {}}	
+	"""
+	df = pd.DataFrame(columns = CELEB_COLUMNS)
+	return(df)
+
+
+class CelebRecordBuffer:
+	"""
+	Accumulates celebrity records in one list per column and materialises them as a Pandas data frame in a single step, instead of copying the data frame for every appended row. Each column is converted to a data frame column on its own, so columns holding a single type keep a typed dtype.
+
+	Parameters
+	----------
+	  columns : list, optional
+	    The column names to collect, in order. Defaults to the `create_celeb_df` columns.
+
+	  chunk_size : int, optional
+	    The number of rows to hold in the column buffers before they are materialised into an intermediate data frame. Defaults to materialising once, in `to_frame`.
+
+	Examples
+	--------
+	>>> buffer = CelebRecordBuffer()
+	>>> buffer.append(get_celeb_record(api_object, 'Rachel McAdams'))
+	>>> buffer.to_frame().shape
+	(1, 15)
+	"""
+	def __init__(self, columns=None, chunk_size=None):
+		assert chunk_size is None or chunk_size >= 1, "Chunk size must be at least 1."
+
+		self.columns = list(CELEB_COLUMNS if columns is None else columns)
+		self.chunk_size = chunk_size
+		self._buffers = {column:[] for column in self.columns}
+		self._buffered = 0
+		self._chunks = []
+		self._length = 0
+
+	def __len__(self):
+		return(self._length)
+
+	def append(self, record):
+		"""
+		Adds a record, given as a dictionary keyed by column name, to the column buffers. Missing columns are left empty.
+		"""
+		for column in self.columns:
+			self._buffers[column].append(record.get(column))
+
+		self._buffered += 1
+		self._length += 1
+
+		if self.chunk_size is not None and self._buffered >= self.chunk_size:
+			self._flush()
+
+	def _flush(self):
+		if self._buffered == 0:
+			return
+
+		self._chunks.append(pd.DataFrame(self._buffers, columns=self.columns))
+		self._buffers = {column:[] for column in self.columns}
+		self._buffered = 0
+
+	def to_frame(self):
+		"""
+		Returns every record appended so far as a single Pandas data frame.
+		"""
+		self._flush()
+
+		if not self._chunks:
+			return(pd.DataFrame(columns=self.columns))
+		elif len(self._chunks) == 1:
+			return(self._chunks[0].copy())
+		return(pd.concat(self._chunks, ignore_index=True))
+
+
+#Functions for acquiring celebrity attributes
+class CelebrityIndex:
+	"""
+	An index over a Celebrity Bucks API object that maps each celebrity name to its ranking, price and ID so that lookups take constant time. It can be passed anywhere an API object is accepted.
+
+	Parameters
+	----------
+	  api_object : dict
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+
+	Examples
+	--------
+	>>> index = CelebrityIndex(api_object)
+	>>> index.lookup('Eminem')
+	{'rank': 209, 'price': 14000, 'celebId': '2488'}
+	>>> get_celebritybucks_price(index, 'Eminem')
+	14000
+	"""
+	def __init__(self, api_object):
+		if isinstance(api_object, CelebrityIndex):
+			api_object = api_object.api_object
+
+		self.api_object = api_object
+		self._entries = {}
+		self._frame = None
+
+		#Keeping the first occurrence of a name, as the linear lookups do
+		for rank, value in enumerate(api_object['CelebrityValues'], start=1):
+			self._entries.setdefault(value['name'], {'rank':rank, 'price':value['price'], 'celebId':value['celebId']})
+
+	def __getitem__(self, key):
+		return(self.api_object[key])
+
+	def __len__(self):
+		return(len(self._entries))
+
+	def lookup(self, celebrity):
+		"""
+		Returns a dictionary with the ranking, price and ID of a given celebrity, or None if the celebrity is not in the index.
+		"""
+		return(self._entries.get(celebrity))
+
+	def to_frame(self):
+		"""
+		Returns the rankings, prices and IDs in the index as a data frame indexed by unique celebrity name, as used by `lookup_celebrities`. The frame is built on first use and shared between calls, so it should not be modified.
+		"""
+		if self._frame is None:
+			self._frame = _get_payload_frame(self.api_object)
+		return(self._frame)
+
+
+def _lookup_celebrity(api_object, celebrity):
+	"""
+	Returns a dictionary with the ranking, price and ID of a given celebrity from an API object or CelebrityIndex, or None if the celebrity is not found.
+	"""
+	if isinstance(api_object, CelebrityIndex):
+		return(api_object.lookup(celebrity))
+
+	for index in range(len(api_object['CelebrityValues'])):
+		if api_object['CelebrityValues'][index]['name'] == celebrity:
+			value = api_object['CelebrityValues'][index]
+			return({'rank':index+1, 'price':value['price'], 'celebId':value['celebId']})
+	return(None)
+
+
+def get_celebritybucks_ranking(api_object, celebrity=""):
+	"""
+	Returns the Celebrity Bucks ranking for a given celebrity from the Celebrity Bucks API.
+
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+	  
+	Returns
+	-------
+	int
+	  The current Celebrity Bucks ranking of the celebrity
+
+	Examples
+	--------
+	>>> get_celebritybucks_ranking('LeBron James')
+	75
+	>>> get_celebritybucks_ranking("Eminem")
+	209
+	"""
+	assert type(celebrity) == str, "Input value must be of type string."
+
+	entry = _lookup_celebrity(api_object, celebrity)
+	if entry is None:
+		return(f'{celebrity} not found within CelebrityBucks data set.')
+	return(entry['rank'])
+
+
+def get_celebritybucks_price(api_object, celebrity=""):
+	"""
+	Returns the Celebrity Bucks price for a given celebrity from the Celebrity Bucks API.
+
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+	  
+	Returns
+	-------
+	int
+	  The current Celebrity Bucks dollar value associated with the celebrity
+
+	Examples
+	--------
+	>>> get_celebritybucks_price('Donald Trump')
+	334000
+	"""
+	assert type(celebrity) == str, "Input value must be of type string."
+
+	entry = _lookup_celebrity(api_object, celebrity)
+	if entry is None:
+		return(f'{celebrity} not found within CelebrityBucks data set.')
+	return(entry['price'])
+
+
+def get_celebritybucks_ID(api_object, celebrity=""):
+	"""
+	Returns the four-digit Celebrity Bucks ID value for a given celebrity from the Celebrity Bucks API.
+
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+	  
+	Returns
+	-------
+	str
+	  The Celebrity Bucks four-digit ID value associated with the celebrity
+
+	Examples
+	--------
+	>>> get_celebritybucks_ID("Eminem")
+	'2488'
+	"""
+	assert type(celebrity) == str, "Input value must be of type string."
+
+	entry = _lookup_celebrity(api_object, celebrity)
+	if entry is None:
+		return(f'{celebrity} not found within CelebrityBucks data set.')
+	return(entry['celebId'])
+
+
+def lookup_celebrities(api_object, celebrities):
+	"""
+	Returns the Celebrity Bucks ranking, price and ID of many celebrities at once from the Celebrity Bucks API, in a single pass over the API object rather than one scan per name. Celebrities not found in the API object get missing values instead of an error string.
+
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+	  celebrities : list
+	    Celebrities' first and last names, matched exactly as in `get_celebritybucks_ranking`.
+
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	  A data frame with one row per given name, in the given order, and columns 'Celebrity', 'Current Ranking' and 'Current Price' as nullable 32-bit integers and 'celebId' as string
+
+	Examples
+	--------
+	>>> lookup_celebrities(api_object, ['Eminem', 'Not a celebrity'])
+	         Celebrity  Current Ranking  Current Price  celebId
+	0           Eminem              209          14000     2488
+	1  Not a celebrity             <NA>           <NA>     <NA>
+	"""
+	assert type(celebrities) in [list, tuple], "Input value must be of type list."
+	assert all(type(celebrity) == str for celebrity in celebrities), "Celebrity names must be of type string."
+
+	payload = api_object.to_frame() if isinstance(api_object, CelebrityIndex) else _get_payload_frame(api_object)
+	df = payload.reindex(pd.Index(celebrities, dtype=object))
+	df.index.name = 'Celebrity'
+	df = df.reset_index()
+	df['Celebrity'] = df['Celebrity'].astype('string')
+	return(df)
+
+
+def _get_payload_frame(api_object):
+	"""
+	Returns the rankings, prices and IDs in an API object as a data frame indexed by unique celebrity name, keeping the first occurrence of a name as the linear lookups do.
+	"""
+	values = api_object['CelebrityValues']
+	payload = pd.DataFrame({'Current Ranking':range(1, len(values) + 1),
+							'Current Price':[value['price'] for value in values],
+							'celebId':[value['celebId'] for value in values]},
+						   index=pd.Index([value['name'] for value in values], dtype=object))
+	payload = payload[~payload.index.duplicated(keep='first')]
+	payload['Current Ranking'] = payload['Current Ranking'].astype('Int32')
+	payload['Current Price'] = pd.to_numeric(payload['Current Price'], errors='coerce').round().astype('Int32')
+	payload['celebId'] = payload['celebId'].astype('string')
+	return(payload)
+
+
+def get_gender(soup_object):
+	"""
+	Returns the gender associated with a given celebrity. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	str
+	  The gender associated with the celebrity
+
+	Examples
+	--------
+	>>> get_gender(soup_taylor_swift)
+	'Female'
+	"""
+	return(_gender_from_fl(_get_fl_nodes(soup_object)))
+
+
+def get_age(soup_object):
+	"""
+	Returns the age of a given celebrity. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	int
+	  The age of the celebrity
+
+	Examples
+	--------
+	>>> get_age(soup_meryl_streep)
+	71
+	"""
+	return(_age_from_fl(_get_fl_nodes(soup_object)))
+
+
+def get_year():
+	"""
+	Returns the current calendar year unless the current date is within the first seven days of its year.
+
+	Parameters
+	----------
+	 	  
+	Returns
+	-------
+	int
+	  The current year or the prior year if the current date is within the first seven days of the year
+
+	Examples
+	--------
+	>>> get_year()
+	2020
+	"""
+	today = datetime.today()
+	if today.month==1 and today.day<=7:
+		return(today.year+1)
+	else:
+		return(today.year)
+
+
+def upcoming_birthday(soup_object):
+	"""
+	Identifies whether a given celebrity will have a birthday within the next seven days. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	str
+	  A binary declaration as to whether the celebrity has or does not have a birthday upcoming in the following week
+
+	Examples
+	--------
+	>>> upcoming_birthday(soup_harrison_ford)
+	'No upcoming birthday'
+	>>> upcoming_birthday(soup_billie_eilish)
+	'Upcoming birthday'
+	"""
+	return(_upcoming_birthday_from_fl(_get_fl_nodes(soup_object)))
+
+
+def get_birth_date(soup_object):
+	"""
+	Returns the birth date of a given celebrity. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	datetime.date
+	  The celebrity's birth date, or 'NaN' if it cannot be found
+
+	Examples
+	--------
+	>>> get_birth_date(soup_barack_obama)
+	datetime.date(1961, 8, 4)
+	"""
+	birth_date = _birth_date_from_fl(_get_fl_nodes(soup_object))
+	return('NaN' if birth_date is None else birth_date)
+
+
+def us_nationality(soup_object):
+	"""
+	Identifies whether a given celebrity is a U.S. national. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	str
+	  A binary declaration as to whether the celebrity is or is not a U.S. national
+
+	Examples
+	--------
+	>>> us_nationality(soup_kylie_jenner)
+	'U.S. national'
+	>>> us_nationality(soup_hayden_christensen)
+	'Foreign to U.S.'
+	"""
+	return(_us_nationality_from_fl(_get_fl_nodes(soup_object)))
+
+
+def living_status(soup_object):
+	"""
+	Identifies whether a given celebrity is alive or dead. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	str
+	  A binary declaration as to whether the celebrity is alive or dead
+
+	Examples
+	--------
+	>>> living_status(soup_bill_clinton)
+	'Alive'
+	>>> living_status(soup_muhammad_ali)
+	'Dead'
+	"""
+	return(_living_status_from_fl(_get_fl_nodes(soup_object)))
+
+
+def get_astroseek_attributes(soup_object):
+	"""
+	Returns the gender, age, upcoming birthday, U.S. nationality, living status and birth date of a given celebrity, collecting the Astro Seek birth chart nodes only once. Source: https://www.astro-seek.com/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	dict
+	  A dictionary of celebrity attributes keyed by their `create_celeb_df` column names, plus 'Birth Date'
+
+	Examples
+	--------
+	>>> get_astroseek_attributes(soup_bill_clinton)
+	{'Gender': 'Male',
+	 'Age': 74,
+	 'Upcoming Birthday': 'No upcoming birthday',
+	 'U.S. Nationality': 'U.S. national',
+	 'Living Status': 'Alive',
+	 'Birth Date': datetime.date(1946, 8, 19)}
+	"""
+	with _time_stage('extract', extractor='astroseek_nodes'):
+		fl_nodes = _get_fl_nodes(soup_object)
+	birth_date = _extract('birth_date', _birth_date_from_fl, fl_nodes)
+
+	return({'Gender':_extract('gender', _gender_from_fl, fl_nodes),
+			'Age':_extract('age', _age_from_fl, fl_nodes),
+			'Upcoming Birthday':_extract('upcoming_birthday', _upcoming_birthday_from_fl, fl_nodes),
+			'U.S. Nationality':_extract('us_nationality', _us_nationality_from_fl, fl_nodes),
+			'Living Status':_extract('living_status', _living_status_from_fl, fl_nodes),
+			'Birth Date':'NaN' if birth_date is None else birth_date})
+
+
+def _extract(extractor, function, nodes):
+	with _time_stage('extract', extractor=extractor):
+		return(function(nodes))
+
+
+#Helper functions reading attributes from the Astro Seek birth chart nodes
+def _get_fl_nodes(soup_object):
+	try:
+		return(soup_object.find_all(class_='fl'))
+	except:
+		return([])
+
+
+def _gender_from_fl(fl_nodes):
+	try:
+		return(fl_nodes[1].get_text().strip())
+	except:
+		return('NaN')
+
+
+def _age_from_fl(fl_nodes):
+	try:
+		return(int(fl_nodes[-5].get_text().strip()[2:5]))
+	except:
+		try:
+			return(int(fl_nodes[-3].get_text().strip()[0:3]))
+		except:
+			return('NaN')
+
+
+def _upcoming_birthday_from_fl(fl_nodes):
+	months = {'January':1,'February':2,'March':3,'April':4,'May':5,'June':6,'July':7,'August':8,'September':9,'October':10,'November':11,'December':12}
+	try:
+		birth_date = fl_nodes[3].find(class_='tenky-modry').get_text().strip().split()
+		month = months[birth_date[1]]
+		day = int(birth_date[0])
+		year = get_year()
+
+		delta = date(year,month,day) - date.today()
+
+		if delta.days >=0 and delta.days<=7:
+			return('Upcoming birthday')
+		else:
+			return('No upcoming birthday')
+	except:
+		return('NaN')
+
+
+def _birth_date_from_fl(fl_nodes):
+	months = {'January':1,'February':2,'March':3,'April':4,'May':5,'June':6,'July':7,'August':8,'September':9,'October':10,'November':11,'December':12}
+	try:
+		day, month_str, year = fl_nodes[3].find(class_='tenky-modry').get_text().strip().split()[0:3]
+		return(date(int(year),months[month_str],int(day)))
+	except:
+		return(None)
+
+
+def _us_nationality_from_fl(fl_nodes):
+	try:
+		if fl_nodes[7].get_text().strip()[0:2]=='US':
+			return("U.S. national")
+		else:
+			return("Foreign to U.S.")
+	except:
+		return('NaN')
+
+
+def _living_status_from_fl(fl_nodes):
+	try:
+		if 'Seek celebrities by planet positions' in fl_nodes[0].get_text().strip():
+			return('NaN')
+
+		for node in fl_nodes:
+			if node.get_text().strip() == 'Death:':
+				return('Dead')
+		return('Alive')
+	except:
+		return('NaN')
+
+
+def get_avg_21_day_price(soup_object):
+	"""
+	Returns the average 21-day Celebrity Bucks price for a given celebrity. Source: https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	int
+	  The average 21-day Celebrity Bucks dollar value associated with the celebrity
+
+	Examples
+	--------
+	>>> get_avg_21_day_price(soup_kelly_clarkson)
+	36000
+	"""
+	return(_avg_21_day_price_from_panels(_get_panel_nodes(soup_object)))
+
+
+def get_all_time_high_price(soup_object):
+	"""
+	Returns the all-time high Celebrity Bucks price for a given celebrity. Source: https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	int
+	  The all-time high Celebrity Bucks dollar value associated with the celebrity
+
+	Examples
+	--------
+	>>> get_all_time_high_price(soup_george_clooney)
+	1721000
+	"""
+	return(_all_time_high_price_from_panels(_get_panel_nodes(soup_object)))
+
+
+def get_days_since_ath(soup_object):
+	"""
+	Returns the number of days since a given celebrity acheived their all-time high Celebrity Bucks price. Source: https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. 
+	  
+	Returns
+	-------
+	int
+	  The number of days since the celebrity acheived their all-time high Celebrity Bucks price
+
+	Examples
+	--------
+	>>> get_days_since_ath(soup_kate_middleton)
+	2049
+	"""
+	ath_date = _ath_date_from_panels(_get_panel_nodes(soup_object))
+	if ath_date is None:
+		return('NaN')
+	return((date.today() - ath_date).days)
+
+
+def get_cb_rec(soup_object):
+	"""
+	Returns the current Celebrity Bucks recommendation as to whether game players should buy, hold, or sell a given celebrity. Source: https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity.
+	  
+	Returns
+	-------
+	str
+	   The current Celebrity Bucks recommended action with regard to the celebrity
+
+	Examples
+	--------
+	>>> get_cb_rec(soup_tom_hanks)
+	'Buy'
+	>>> get_cb_rec(soup_gwyneth_paltrow)
+	'Hold'
+	>>> get_cb_rec(soup_miley_cyrus)
+	'Sell'
+	"""
+	return(_cb_rec_from_alerts(soup_object.find_all(role='alert')))
+
+
+def get_celebritybucks_attributes(soup_object):
+	"""
+	Returns the average 21-day price, all-time high price, all-time high date, days since the all-time high and recommendation of a given celebrity, traversing the Celebrity Bucks page only once. Values that cannot be found are returned as 'NaN'. Source: https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity.
+	  
+	Returns
+	-------
+	dict
+	   A dictionary of celebrity attributes keyed by their `create_celeb_df` column names, plus 'All-Time High Date'
+
+	Examples
+	--------
+	>>> get_celebritybucks_attributes(soup_kate_middleton)
+	{'Avg. 21-Day Price': 2000,
+	 'All-Time High Price': 1037000,
+	 'All-Time High Date': datetime.date(2015, 5, 2),
+	 'Days Since All-Time High Price': 2049,
+	 'Celebrity Bucks Recommendation': 'Hold'}
+	"""
+	panel_nodes = []
+	alert_nodes = []
+
+	with _time_stage('extract', extractor='celebritybucks_nodes'):
+		try:
+			for node in soup_object.find_all(_is_celebritybucks_node):
+				if node.get('role') == 'alert':
+					alert_nodes.append(node)
+				if _is_panel_node(node):
+					panel_nodes.append(node)
+		except:
+			pass
+
+	ath_date = _extract('ath_date', _ath_date_from_panels, panel_nodes)
+
+	try:
+		cb_rec = _extract('cb_rec', _cb_rec_from_alerts, alert_nodes)
+	except:
+		cb_rec = 'NaN'
+
+	return({'Avg. 21-Day Price':_extract('avg_21_day_price', _avg_21_day_price_from_panels, panel_nodes),
+			'All-Time High Price':_extract('all_time_high_price', _all_time_high_price_from_panels, panel_nodes),
+			'All-Time High Date':'NaN' if ath_date is None else ath_date,
+			'Days Since All-Time High Price':'NaN' if ath_date is None else (date.today() - ath_date).days,
+			'Celebrity Bucks Recommendation':cb_rec})
+
+
+#Helper functions reading attributes from the Celebrity Bucks page nodes
+def _is_panel_node(tag):
+	return(' '.join(tag.get('class', [])) == 'panel-body center')
+
+
+def _is_celebritybucks_node(tag):
+	return(tag.get('role') == 'alert' or _is_panel_node(tag))
+
+
+def _get_panel_nodes(soup_object):
+	try:
+		return(soup_object.find_all(class_='panel-body center'))
+	except:
+		return([])
+
+
+def _parse_panel_price(panel_node):
+	return(int(panel_node.get_text().strip()[1:].replace(',', '')))
+
+
+def _avg_21_day_price_from_panels(panel_nodes):
+	try:
+		return(_parse_panel_price(panel_nodes[0]))
+	except:
+		return('NaN')
+
+
+def _all_time_high_price_from_panels(panel_nodes):
+	for position in [2, 1, -2]:
+		try:
+			return(_parse_panel_price(panel_nodes[position]))
+		except:
+			continue
+	return('NaN')
+
+
+def _ath_date_from_panels(panel_nodes):
+	months_shortened = {'Jan':1,'Feb':2,'Mar':3,'Apr':4,'May':5,'Jun':6,'Jul':7,'Aug':8,'Sep':9,'Oct':10,'Nov':11,'Dec':12}
+	try:
+		month_str_sh, day, year = panel_nodes[-1].get_text().strip().replace(",","").split()[0:3]
+		return(date(int(year),months_shortened[month_str_sh],int(day)))
+	except:
+		return(None)
+
+
+def _cb_rec_from_alerts(alert_nodes):
+	return(alert_nodes[1].get_text().strip().split()[-1])
+
+
+def get_celeb_record(api_object, celebrity, host_semaphores=None, session=None, timeout=None, parser=None, parse_only=False, astroseek_attributes=None, parse_pool=None):
+	"""
+	Collects data for a given celebrity from three sources and returns it as a dictionary keyed by the `create_celeb_df` column names, followed by the `DERIVED_SOURCE_COLUMNS`. Price ratios that cannot be computed, from a missing price or a current price of zero, are 'NaN' rather than dropping the record. Returns None if the celebrity is not in the API call, the Celebrity Bucks webpage could not be fetched or the record cannot be assembled. Sources: Celebrity Bucks API, https://www.astro-seek.com/, and https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  api_object : dict
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+
+	  host_semaphores : dict, optional
+	    A dictionary mapping host names to semaphores that bound the number of concurrent requests made to each host.
+
+	  session : requests.Session, optional
+	    The session to send requests through. Defaults to the shared session.
+
+	  timeout : float, optional
+	    The number of seconds to wait for each server before giving up. Defaults to `DEFAULT_TIMEOUT`.
+
+	  parser : str, optional
+	    The bs4 tree builder to parse with, such as 'html.parser' or 'lxml'. Defaults to `DEFAULT_PARSER`.
+
+	  parse_only : bool, optional
+	    Whether to build only the elements read by the attribute extractors, which lowers parsing time and memory.
+
+	  astroseek_attributes : dict, optional
+	    Previously collected Astro Seek attributes keyed by their `create_celeb_df` column names. When given, the Astro Seek webpage is not fetched.
+
+	  parse_pool : concurrent.futures.Executor, optional
+	    An executor, such as a process pool, in which the webpages are parsed and their attributes extracted. The Astro Seek webpage is fetched while the Celebrity Bucks webpage is parsed. Defaults to parsing in the calling thread.
+
+	Returns
+	-------
+	dict
+	   A dictionary containing celebrity attributes, or None if the record could not be assembled
+
+	Examples
+	--------
+	>>> record = get_celeb_record(api_object, 'Rachel McAdams')
+	>>> record['Current Ranking']
+	65
+	"""
+	if host_semaphores is None:
+		host_semaphores = {}
+	start = time.perf_counter()
+
+	#Celebrities missing from the API call have no record, and their webpages are not fetched
+	if _lookup_celebrity(api_object, celebrity) is None:
+		return(_fail_record(celebrity, start))
+
+	#Scraping Celebrity Bucks individual celebrity site
+	with host_semaphores.get(CELEBRITYBUCKS_HOST, nullcontext()):
+		celebrity_bucks_html = fetch_url(get_celebritybucks_url(api_object, celebrity), session, timeout)
+
+	#Error pages, such as a 404 or a 5xx left after the retries, hold no prices and yield no record
+	if celebrity_bucks_html.status_code != 200:
+		return(_fail_record(celebrity, start))
+	parsed_cb = _submit_page_attributes(parse_pool, celebrity_bucks_html.content, CELEBRITYBUCKS_HOST, parser, parse_only)
+
+	#Scraping Astro Seek individual celebrity site, unless the slug index holds the celebrity as a known miss
+	if astroseek_attributes is None and _slug_index is not None and _slug_index.is_miss(celebrity):
+		_count('slug_index_skips', host=ASTROSEEK_HOST)
+		astroseek_attributes = dict(MISSING_ASTROSEEK_ATTRIBUTES)
+	elif astroseek_attributes is None:
+		with host_semaphores.get(ASTROSEEK_HOST, nullcontext()):
+			astro_seek_html = fetch_url(get_astroseek_url(celebrity), session, timeout)
+		parsed_as = _submit_page_attributes(parse_pool, astro_seek_html.content, ASTROSEEK_HOST, parser, parse_only)
+
+	try:
+		#Current Ranking
+		current_ranking = get_celebritybucks_ranking(api_object, celebrity)
+
+		#Current Price
+		current_price = get_celebritybucks_price(api_object, celebrity)
+
+		#Gender, Age, Upcoming Birthday, U.S. Nationality and Living Status
+		if astroseek_attributes is None:
+			astroseek_attributes = parsed_as.result()
+			_record_slug_resolution(celebrity, astro_seek_html, astroseek_attributes)
+		gender = astroseek_attributes['Gender']
+		age = astroseek_attributes['Age']
+		birthday_next_7_days = astroseek_attributes['Upcoming Birthday']
+		nationality = astroseek_attributes['U.S. Nationality']
+		living = astroseek_attributes['Living Status']
+		birth_date = astroseek_attributes.get('Birth Date', 'NaN')
+
+		#Avg. 21-Day Price, All-Time High Price, Days Since All-Time High Price and Celebrity Bucks Recommendation
+		celebritybucks_attributes = parsed_cb.result()
+		twenty_one_day_price = celebritybucks_attributes['Avg. 21-Day Price']
+		all_time_high_price = celebritybucks_attributes['All-Time High Price']
+		duration_since_ath = celebritybucks_attributes['Days Since All-Time High Price']
+		ath_date = celebritybucks_attributes['All-Time High Date']
+		cb_rec = celebritybucks_attributes['Celebrity Bucks Recommendation']
+
+		#Avg. 21-Day Price/Current Price
+		ratio_21d = _get_price_ratio(twenty_one_day_price, current_price)
+
+		#All-Time High Price/Current Price
+		ratio_ath = _get_price_ratio(all_time_high_price, current_price)
+
+		#Last Update
+		current_time = datetime.now()
+	except:
+		return(_fail_record(celebrity, start))
+
+	record = {'Celebrity':celebrity,
+			  'Current Ranking':current_ranking,
+			  'Current Price':current_price,
+			  'Avg. 21-Day Price':twenty_one_day_price,
+			  'Avg. 21-Day Price/Current Price':ratio_21d,
+			  'All-Time High Price':all_time_high_price,
+			  'All-Time High Price/Current Price':ratio_ath,
+			  'Days Since All-Time High Price':duration_since_ath,
+			  'Gender':gender,
+			  'Age':age,
+			  'Upcoming Birthday':birthday_next_7_days,
+			  'U.S. Nationality':nationality,
+			  'Living Status':living,
+			  'Celebrity Bucks Recommendation':cb_rec,
+			  'Last Update':current_time,
+			  'All-Time High Date':ath_date,
+			  'Birth Date':birth_date}
+	_observe_record(celebrity, record, time.perf_counter() - start)
+
+	return(record)
+
+
+def _get_price_ratio(price, current_price):
+	try:
+		return(round(price/current_price,3))
+	except:
+		return('NaN')
+
+
+def _fail_record(celebrity, start):
+	print(f'Unable to add record for {celebrity} to data frame.')
+	_observe_record(celebrity, None, time.perf_counter() - start)
+	return(None)
+
+
+def _observe_record(celebrity, record, seconds):
+	if _metrics is None:
+		return
+
+	_metrics.observe('record', seconds)
+	_metrics.observe_celebrity(celebrity, seconds)
+
+	if record is None:
+		_metrics.increment('failed_records')
+		return
+	for column, value in record.items():
+		if isinstance(value, str) and value == 'NaN':
+			_metrics.increment('nan_fallbacks', column=column)
+
+
+def _record_slug_resolution(celebrity, response, astroseek_attributes):
+	"""
+	Records in the slug index whether the Astro Seek birth chart of a celebrity was found. A 404 response, or a successful response whose page yields neither a living status nor a birth date, as the Astro Seek search page served for unknown slugs does, is a miss. Other responses, such as 429 and 5xx errors, are not recorded, so an outage does not mark real slugs as misses.
+	"""
+	if _slug_index is None:
+		return
+
+	if response.status_code == 404:
+		_slug_index.record_miss(celebrity)
+	elif response.status_code == 200 and astroseek_attributes['Living Status'] == 'NaN' and astroseek_attributes['Birth Date'] == 'NaN':
+		_slug_index.record_miss(celebrity)
+	elif response.status_code == 200:
+		#Following any redirect to the canonical birth chart webpage
+		match = re.search(r'/birth-chart/(.+)-horoscope$', urlsplit(response.url or '').path)
+		_slug_index.record_hit(celebrity, get_astroseek_slug(celebrity) if match is None else match.group(1))
+
+
+def get_page_attributes(content, host, parser=None, parse_only=False):
+	"""
+	Parses a fetched webpage and returns the celebrity attributes read from it by the extractors of its host. Takes and returns only plain values, so it can run in worker processes that send compact records back instead of soup objects.
+
+	Parameters
+	----------
+	  content : bytes or str
+	    The HTML of a Celebrity Bucks or Astro Seek webpage.
+
+	  host : str
+	    The host the webpage was fetched from, either `CELEBRITYBUCKS_HOST` or `ASTROSEEK_HOST`.
+
+	  parser : str, optional
+	    The bs4 tree builder to parse with, such as 'html.parser' or 'lxml'. Defaults to `DEFAULT_PARSER`.
+
+	  parse_only : bool, optional
+	    Whether to build only the elements read by the attribute extractors, which lowers parsing time and memory.
+
+	Returns
+	-------
+	dict
+	   The attributes returned by `get_celebritybucks_attributes` or `get_astroseek_attributes`
+
+	Examples
+	--------
+	>>> get_page_attributes(fetch_url(get_astroseek_url('Bill Clinton')).content, ASTROSEEK_HOST)['Gender']
+	'Male'
+	"""
+	soup_object = parse_page(content, host, parser, parse_only)
+	if host == CELEBRITYBUCKS_HOST:
+		return(get_celebritybucks_attributes(soup_object))
+	elif host == ASTROSEEK_HOST:
+		return(get_astroseek_attributes(soup_object))
+	raise ValueError(f'No attributes are extracted from {host} webpages.')
+
+
+def create_parse_pool(parse_workers):
+	"""
+	Returns a process pool for parsing webpages and extracting their attributes on several cores. Workers are started fresh rather than forked, as the pool is used alongside the threads fetching webpages.
+
+	Parameters
+	----------
+	  parse_workers : int
+	    The number of worker processes.
+
+	Returns
+	-------
+	concurrent.futures.ProcessPoolExecutor
+	   The process pool
+
+	Examples
+	--------
+	>>> with create_parse_pool(4) as parse_pool:
+	...     record = get_celeb_record(api_object, 'Rachel McAdams', parse_pool=parse_pool)
+	"""
+	assert parse_workers >= 1, "Parse workers must be at least 1."
+	return(ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn')))
+
+
+def _submit_page_attributes(parse_pool, content, host, parser, parse_only):
+	if parse_pool is not None:
+		return(parse_pool.submit(get_page_attributes, content, host, parser, parse_only))
+
+	future = Future()
+	future.set_result(get_page_attributes(content, host, parser, parse_only))
+	return(future)
+
+
+def append_to_df(df, celebrity):
+	"""
+	Collects data for a given celebrity from three sources and appends data to a `celebrity_data_attributes` Pandas data frame. Intended for script execution. Sources: Celebrity Bucks API, https://www.astro-seek.com/, and https://celebritybucks.com/celebrities/. 
+
+	Parameters
+	----------
+	  df : pandas.core.frame.DataFrame
+	    A Pandas data frame with column names that correspond to celebrity attributes collected in other functions.
+
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+	
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	   A Pandas data frame containing celebrity attributes
+
+	Examples
+	--------
+	>>> len(df)
+	64
+	>>> df = append_to_df(df, 'Rachel McAdams')
+	>>> len(df)
+	65
+	>>> df[df['Celebrity'] == 'Rachel McAdams'].to_dict()
+	{'Celebrity': {64: 'Rachel McAdams'},
+	 'Current Ranking': {64: 65},
+	 'Current Price': {64: 51000},
+	 'Avg. 21-Day Price': {64: 3000},
+	 'Avg. 21-Day Price/Current Price': {64: 0.059000000000000004},
+	 'All-Time High Price': {64: 377000},
+	 'All-Time High Price/Current Price': {64: 7.392},
+	 'Days Since All-Time High Price': {64: 2333},
+	 'Gender': {64: 'Female'},
+	 'Age': {64: 42.0},
+	 'Upcoming Birthday': {64: 'No upcoming birthday'},
+	 'U.S. Nationality': {64: 'Foreign to U.S.'},
+	 'Living Status': {64: 'Alive'},
+	 'Celebrity Bucks Recommendation': {64: 'Buy'},
+	 'Last Update': {64: '31:02.3'}}
+	"""
+	record = get_celeb_record(api_object, celebrity)
+
+	#Appending row to dataframe, with its derived columns recomputed from the record's dates
+	if record is not None:
+		buffer = CelebRecordBuffer(list(df.columns) + DERIVED_SOURCE_COLUMNS)
+		buffer.append(record)
+		row = add_derived_metrics(buffer.to_frame())[df.columns]
+
+		if len(df) == 0:
+			df = row
+		else:
+			df = pd.concat([df, row], ignore_index = True)
+
+	return(df)
+
+
+def get_celeb_data(api_object, soup_cb, soup_as, celebrity):
+	"""
+	Collects data for a given celebrity from three sources and returns data as a single row in a Pandas data frame. Intended for interactive usage. Sources: Celebrity Bucks API, https://www.astro-seek.com/, and https://celebritybucks.com/celebrities/. 
+
+	Parameters
+	----------
+	  api_object : dict
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+
+	  soup_object: bs4.BeautifulSoup
+	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity.
+
 	  soup_object: bs4.BeautifulSoup
 	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
-	  
+
+	  celebrity : str
+	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
+	
 	Returns
 	-------
-	str
-	  A binary declaration as to whether the celebrity is or is not a U.S. national
+	pandas.core.frame.DataFrame
+	   A Pandas data frame containing attributes for a given celebrity
 
 	Examples
 	--------
-	>>> us_nationality(soup_kylie_jenner)
-	'U.S. national'
-	>>> us_nationality(soup_hayden_christensen)
-	'Foreign to U.S.'
+	>>> get_celeb_data(api_object, soup_cb, soup_as, celebrity='Rachel McAdams')
+	>>> df[df['Celebrity'] == 'Rachel McAdams'].to_dict()
+	{'Celebrity': {0: 'Rachel McAdams'},
+	 'Current Ranking': {0: 65},
+	 'Current Price': {0: 51000},
+	 'Avg. 21-Day Price': {0: 3000},
+	 'Avg. 21-Day Price/Current Price': {0: 0.059000000000000004},
+	 'All-Time High Price': {0: 377000},
+	 'All-Time High Price/Current Price': {0: 7.392},
+	 'Days Since All-Time High Price': {0: 2333},
+	 'Gender': {0: 'Female'},
+	 'Age': {0: 42.0},
+	 'Upcoming Birthday': {0: 'No upcoming birthday'},
+	 'U.S. Nationality': {0: 'Foreign to U.S.'},
+	 'Living Status': {0: 'Alive'},
+	 'Celebrity Bucks Recommendation': {0: 'Buy'},
+	 'Last Update': {0: '31:02.3'}}
 	"""
+	#Current Ranking
 	try:
-		if soup_object.find_all(class_='fl')[7].get_text().strip()[0:2]=='US':
-			return("U.S. national")
-		elif soup_object.find_all(class_='fl')[7].get_text().strip()[0:2]!='US':
-			return("Foreign to U.S.")
+		current_ranking = get_celebritybucks_ranking(api_object, celebrity)
 	except:
-		return('NaN')
+		current_ranking = 'NaN'
 
+	#Current Price
+	try:
+		current_price = get_celebritybucks_price(api_object, celebrity)
+	except:
+		current_price = 'NaN'
 
-def living_status(soup_object):
+	#Avg. 21-Day Price, All-Time High Price, Days Since All-Time High Price and Celebrity Bucks Recommendation
+	celebritybucks_attributes = get_celebritybucks_attributes(soup_cb)
+	twenty_one_day_price = celebritybucks_attributes['Avg. 21-Day Price']
+	all_time_high_price = celebritybucks_attributes['All-Time High Price']
+	duration_since_ath = celebritybucks_attributes['Days Since All-Time High Price']
+	ath_date = celebritybucks_attributes['All-Time High Date']
+	cb_rec = celebritybucks_attributes['Celebrity Bucks Recommendation']
+
+	#Gender, Age, Upcoming Birthday, U.S. Nationality and Living Status
+	astroseek_attributes = get_astroseek_attributes(soup_as)
+	gender = astroseek_attributes['Gender']
+	age = astroseek_attributes['Age']
+	birthday_next_7_days = astroseek_attributes['Upcoming Birthday']
+	nationality = astroseek_attributes['U.S. Nationality']
+	living = astroseek_attributes['Living Status']
+	birth_date = astroseek_attributes['Birth Date']
+
+	#Last Update
+	try:
+		current_time = datetime.now()
+	except:
+		current_time = 'NaN'
+
+	#Building single-row dataframe, with the price ratios derived from its columns
+	buffer = CelebRecordBuffer(CELEB_COLUMNS + DERIVED_SOURCE_COLUMNS)
+	buffer.append({'Celebrity':celebrity, 
+					'Current Ranking':current_ranking,
+					'Current Price':current_price,
+					'Avg. 21-Day Price':twenty_one_day_price,
+					'All-Time High Price':all_time_high_price,
+					'Days Since All-Time High Price':duration_since_ath,
+					'Gender':gender,
+					'Age':age,
+					'Upcoming Birthday':birthday_next_7_days,
+					'U.S. Nationality':nationality,
+					'Living Status':living,
+					'Celebrity Bucks Recommendation':cb_rec,
+					'Last Update':current_time,
+					'All-Time High Date':ath_date,
+					'Birth Date':birth_date})
+	df = add_derived_metrics(buffer.to_frame())[CELEB_COLUMNS]
+
+	return(df)
+
+
+#Functions for deriving celebrity metrics
+def add_derived_metrics(df, today=None, birthday_window=7, age_bins=None, age_labels=None):
 	"""
-	Identifies whether a given celebrity is alive or dead. Source: https://www.astro-seek.com/.
+	Computes the derived columns of a data frame of celebrity attributes with vectorised operations over every row at once: the average 21-day and all-time high price ratios, the days since the all-time high price, whether a birthday falls within a window of days and, optionally, age buckets. Missing or non-numeric prices and current prices of zero give missing ratios instead of raising. The days since the all-time high price and the upcoming birthday are recomputed for rows with an 'All-Time High Date' or 'Birth Date' and left as they are for other rows.
+
+	Parameters
+	----------
+	  df : pandas.core.frame.DataFrame
+	    A Pandas data frame with the `create_celeb_df` columns, optionally followed by the `DERIVED_SOURCE_COLUMNS`.
+
+	  today : datetime.date, optional
+	    The date the days since the all-time high price and upcoming birthdays are counted from. Defaults to today.
+
+	  birthday_window : int, optional
+	    The number of days ahead within which a birthday is upcoming.
+
+	  age_bins : list, optional
+	    The edges of the age buckets, each bucket including its lower edge. No 'Age Bucket' column is added by default.
+
+	  age_labels : list, optional
+	    The names of the age buckets. Defaults to the bucket intervals.
+
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	   A copy of the data frame with the derived columns filled in
+
+	Examples
+	--------
+	>>> df = add_derived_metrics(df, age_bins=[0, 30, 50, 70, 120], age_labels=['Under 30', '30-49', '50-69', '70+'])
+	>>> df[['Celebrity', 'Avg. 21-Day Price/Current Price', 'Age Bucket']].head(2)
+	      Celebrity  Avg. 21-Day Price/Current Price Age Bucket
+	0  Taylor Swift                            0.117      30-49
+	1  Barack Obama                            0.833      50-69
+	"""
+	assert birthday_window >= 0, "Birthday window must not be negative."
+
+	if today is None:
+		today = date.today()
+	today = pd.Timestamp(today).normalize()
+	df = df.copy()
+
+	#Avg. 21-Day Price/Current Price and All-Time High Price/Current Price
+	current_price = _to_number(df['Current Price'])
+	current_price = current_price.where(current_price != 0)
+	df['Avg. 21-Day Price/Current Price'] = (_to_number(df['Avg. 21-Day Price']) / current_price).round(3)
+	df['All-Time High Price/Current Price'] = (_to_number(df['All-Time High Price']) / current_price).round(3)
+
+	#Days Since All-Time High Price
+	if 'All-Time High Date' in df.columns:
+		days_since_ath = (today - _to_datetime(df['All-Time High Date'])).dt.days
+		df['Days Since All-Time High Price'] = days_since_ath.astype('Int64').astype(object).where(days_since_ath.notna(), df['Days Since All-Time High Price'])
+
+	#Upcoming Birthday
+	if 'Birth Date' in df.columns:
+		days_to_birthday = _days_to_birthday(_to_datetime(df['Birth Date']), today)
+		upcoming = days_to_birthday.le(birthday_window).map({True:'Upcoming birthday', False:'No upcoming birthday'})
+		df['Upcoming Birthday'] = upcoming.where(days_to_birthday.notna(), df['Upcoming Birthday'])
+
+	#Age Bucket
+	if age_bins is not None:
+		df['Age Bucket'] = pd.cut(_to_number(df['Age']), bins=age_bins, labels=age_labels, right=False)
+
+	return(df)
+
+
+#Helper functions for vectorised derived metrics
+def _to_number(values):
+	return(pd.to_numeric(values, errors='coerce'))
+
+
+def _to_datetime(values):
+	return(pd.to_datetime(values.where(values != 'NaN'), errors='coerce').dt.normalize())
+
+
+def _days_to_birthday(birth_dates, today):
+	this_year = _birthday_in_year(birth_dates, today.year)
+	next_year = _birthday_in_year(birth_dates, today.year+1)
+	return((this_year.where(this_year >= today, next_year) - today).dt.days)
+
+
+def _birthday_in_year(birth_dates, year):
+	month = birth_dates.dt.month
+	day = birth_dates.dt.day
+
+	#Birthdays on February 29 are celebrated on February 28 outside leap years
+	if not calendar.isleap(year):
+		day = day.where((month != 2) | (day != 29), 28)
+
+	return(pd.to_datetime(pd.DataFrame({'year':year, 'month':month, 'day':day}, index=birth_dates.index), errors='coerce'))
+
+
+#Functions for collecting the full celebrity data set
+def collect_celeb_data(api_object, celebrities=None, workers_per_host=4, progress=True, session=None, timeout=None, parser=None, parse_only=False, astroseek_attributes=None, checkpoint_dir=None, checkpoint_every=50, resume=False, parse_workers=None, time_budget=None, request_budget=None, birth_dates=False):
+	"""
+	Collects data for a list of celebrities concurrently and returns it as a Pandas data frame with the `create_celeb_df` columns. Requests are made from a thread pool, with the number of requests in flight to each host bounded by `workers_per_host`. Sources: Celebrity Bucks API, https://www.astro-seek.com/, and https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  api_object : dict
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+
+	  celebrities : list, optional
+	    A list of celebrity names. Defaults to every celebrity in the Celebrity Bucks API call.
+
+	  workers_per_host : int or dict, optional
+	    The maximum number of concurrent requests per host, either as a single value for every host or as a dictionary mapping host names to values.
+
+	  progress : bool, optional
+	    Whether to print a progress tracker while collecting.
+
+	  session : requests.Session, optional
+	    The session to send requests through. Defaults to a new session with one pooled connection per worker for each host.
+
+	  timeout : float, optional
+	    The number of seconds to wait for each server before giving up. Defaults to `DEFAULT_TIMEOUT`.
+
+	  parser : str, optional
+	    The bs4 tree builder to parse with, such as 'html.parser' or 'lxml'. Defaults to `DEFAULT_PARSER`.
+
+	  parse_only : bool, optional
+	    Whether to build only the elements read by the attribute extractors, which lowers parsing time and memory.
+
+	  astroseek_attributes : dict, optional
+	    A dictionary mapping celebrity names to previously collected Astro Seek attributes. The Astro Seek webpages of these celebrities are not fetched.
+
+	  checkpoint_dir : str, optional
+	    A directory in which collected records are saved as the run progresses. No checkpoints are written by default.
+
+	  checkpoint_every : int, optional
+	    The number of collected records to save to the checkpoint at a time.
+
+	  resume : bool, optional
+	    Whether to skip celebrities already saved to the checkpoint under the same API call, instead of starting a new checkpoint.
+
+	  parse_workers : int, optional
+	    The number of worker processes that parse webpages and extract their attributes, leaving the threads to fetching. Defaults to parsing in the fetching threads.
+
+	  time_budget : float, optional
+	    The number of seconds after which no further celebrities are started. Celebrities already being collected are finished. Unbounded by default.
+
+	  request_budget : int, optional
+	    The maximum number of webpage requests, counting two per celebrity, or one when its Astro Seek attributes are given or it is a known miss in the slug index. Celebrities are started in order while the budget allows. Unbounded by default.
+
+	  birth_dates : bool, optional
+	    Whether to add each celebrity's 'Birth Date' after the `create_celeb_df` columns, as read by `BirthdayCalendar.from_frame`.
+
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	   A Pandas data frame containing celebrity attributes, in the same order as `celebrities`, cut short when a budget runs out
+
+	Examples
+	--------
+	>>> df = collect_celeb_data(api_object, ['Taylor Swift', 'Rachel McAdams'], workers_per_host=2)
+	>>> df.shape
+	(2, 15)
+	"""
+	if not isinstance(api_object, CelebrityIndex):
+		api_object = CelebrityIndex(api_object)
+
+	if celebrities is None:
+		celebrities = get_celebrity_list(api_object)
+
+	assert checkpoint_every >= 1, "Checkpoint interval must be at least 1."
+
+	checkpointed = {}
+	if checkpoint_dir is not None:
+		checkpointed = start_checkpoint(checkpoint_dir, api_object, resume)
+		if progress and checkpointed:
+			print(f'Resuming with {len(checkpointed)} celebrities already collected.')
+
+	records = [checkpointed.get(celebrity) for celebrity in celebrities]
+	remaining = [num for num, celebrity in enumerate(celebrities) if celebrity not in checkpointed]
+	unsaved = []
+	buffer = CelebRecordBuffer(CELEB_COLUMNS + DERIVED_SOURCE_COLUMNS)
+
+	completed_records = _iter_completed_records(api_object, [celebrities[num] for num in remaining], workers_per_host, session, timeout, parser, parse_only, astroseek_attributes,
+												parse_workers=parse_workers, time_budget=time_budget, request_budget=request_budget)
+	for completed, (position, record) in enumerate(completed_records):
+		records[remaining[position]] = record
+
+		#Checkpointing
+		if checkpoint_dir is not None and record is not None:
+			unsaved.append(record)
+			if len(unsaved) >= checkpoint_every:
+				append_to_checkpoint(checkpoint_dir, unsaved)
+				unsaved = []
+
+		#Progress tracker
+		if progress and completed%10==0:
+			print(f'{completed} celebrities out of {len(remaining)} collected!')
+
+	if checkpoint_dir is not None and unsaved:
+		append_to_checkpoint(checkpoint_dir, unsaved)
+
+	if progress:
+		print('Done!')
+
+	for record in records:
+		if record is not None:
+			buffer.append(record)
+
+	#Deriving metrics for every collected celebrity at once
+	return(add_derived_metrics(buffer.to_frame())[BIRTH_DATE_COLUMNS if birth_dates else CELEB_COLUMNS])
+
+
+def iter_celebrity_records(api_object, celebrities=None, workers_per_host=4, session=None, timeout=None, parser=None, parse_only=False, astroseek_attributes=None, max_pending=None, parse_workers=None):
+	"""
+	Collects data for a list of celebrities concurrently and yields each celebrity's record as soon as both of its webpages are parsed, in order of completion. Only a bounded number of celebrities are queued at a time, so memory use does not grow with the length of the list. Celebrities whose records cannot be assembled are skipped. Sources: Celebrity Bucks API, https://www.astro-seek.com/, and https://celebritybucks.com/celebrities/.
+
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+
+	  celebrities : list, optional
+	    A list of celebrity names. Defaults to every celebrity in the Celebrity Bucks API call.
+
+	  workers_per_host : int or dict, optional
+	    The maximum number of concurrent requests per host, either as a single value for every host or as a dictionary mapping host names to values.
+
+	  max_pending : int, optional
+	    The maximum number of celebrities queued or in progress at a time. Defaults to twice the number of workers.
+
+	  session, timeout, parser, parse_only, astroseek_attributes, parse_workers : optional
+	    As in `collect_celeb_data`.
+
+	Returns
+	-------
+	generator
+	   A generator of dictionaries containing celebrity attributes, keyed by the `create_celeb_df` column names only
+
+	Examples
+	--------
+	>>> for record in iter_celebrity_records(api_object, ['Taylor Swift', 'Rachel McAdams']):
+	...     print(record['Celebrity'], record['Current Price'])
+	Rachel McAdams 51000
+	Taylor Swift 562000
+	"""
+	if celebrities is None:
+		celebrities = get_celebrity_list(api_object)
+
+	for position, record in _iter_completed_records(api_object, celebrities, workers_per_host, session, timeout, parser, parse_only, astroseek_attributes, max_pending, parse_workers):
+		if record is not None:
+			yield({column:record[column] for column in CELEB_COLUMNS})
+
+
+async def aiter_celebrity_records(api_object, celebrities=None, **kwargs):
+	"""
+	An asynchronous version of `iter_celebrity_records` for use in event loops. Records are collected by the same thread pool and handed to the loop as they complete, without blocking it.
+
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+
+	  celebrities : list, optional
+	    A list of celebrity names. Defaults to every celebrity in the Celebrity Bucks API call.
+
+	  **kwargs
+	    Options passed on to `iter_celebrity_records`.
+
+	Returns
+	-------
+	async_generator
+	   An asynchronous generator of dictionaries containing celebrity attributes
+
+	Examples
+	--------
+	>>> async for record in aiter_celebrity_records(api_object):
+	...     await publish(record)
+	"""
+	records = iter_celebrity_records(api_object, celebrities, **kwargs)
+	loop = asyncio.get_running_loop()
+	finished = object()
+
+	try:
+		while True:
+			record = await loop.run_in_executor(None, next, records, finished)
+			if record is finished:
+				return
+			yield(record)
+	finally:
+		await loop.run_in_executor(None, records.close)
+
+
+def _iter_completed_records(api_object, celebrities, workers_per_host=4, session=None, timeout=None, parser=None, parse_only=False, astroseek_attributes=None, max_pending=None, parse_workers=None, time_budget=None, request_budget=None):
+	"""
+	Yields a tuple of each celebrity's position in `celebrities` and its record, or None if the record cannot be assembled, in order of completion. Celebrities are started in order until the time or request budget of `collect_celeb_data` runs out, and celebrities queued but not yet started when the time budget runs out are dropped.
+	"""
+	if not isinstance(api_object, CelebrityIndex):
+		api_object = CelebrityIndex(api_object)
+
+	if isinstance(workers_per_host, int):
+		workers_per_host = {CELEBRITYBUCKS_HOST:workers_per_host, ASTROSEEK_HOST:workers_per_host}
+
+	assert all(workers >= 1 for workers in workers_per_host.values()), "Workers per host must be at least 1."
+
+	max_workers = sum(workers_per_host.values())
+	if max_pending is None:
+		max_pending = 2 * max_workers
+
+	assert max_pending >= 1, "Maximum number of pending celebrities must be at least 1."
+	assert time_budget is None or time_budget >= 0, "Time budget must be non-negative."
+	assert request_budget is None or request_budget >= 0, "Request budget must be non-negative."
+
+	host_semaphores = {host:threading.BoundedSemaphore(workers) for host, workers in workers_per_host.items()}
+	if session is None:
+		session = create_session(pool_maxsize=workers_per_host)
+	if astroseek_attributes is None:
+		astroseek_attributes = {}
+
+	queued = iter(enumerate(celebrities))
+	pending = {}
+	deadline = None if time_budget is None else time.monotonic() + time_budget
+	requests_left = request_budget
+	parse_pool = None if parse_workers is None else create_parse_pool(parse_workers)
+	executor = ThreadPoolExecutor(max_workers=max_workers)
+
+	try:
+		while True:
+			#Topping up the queue while the budgets allow
+			for position, celebrity in queued:
+				if requests_left is not None:
+					requests_left -= _get_request_cost(celebrity, astroseek_attributes)
+				if (deadline is not None and time.monotonic() >= deadline) or (requests_left is not None and requests_left < 0):
+					queued = iter(())
+					break
+
+				pending[executor.submit(get_celeb_record, api_object, celebrity, host_semaphores, session, timeout, parser, parse_only, astroseek_attributes.get(celebrity), parse_pool)] = position
+				if len(pending) >= max_pending:
+					break
+
+			if not pending:
+				return
+
+			#Waking at the deadline, after which the celebrities already started are waited on
+			remaining_time = None if deadline is None or time.monotonic() >= deadline else deadline - time.monotonic()
+			done = wait(pending, timeout=remaining_time, return_when=FIRST_COMPLETED)[0]
+			for future in done:
+				position = pending.pop(future)
+				yield(position, _get_completed_record(future, celebrities[position]))
+
+			#Dropping the queued celebrities not yet started once the time budget runs out
+			if deadline is not None and time.monotonic() >= deadline:
+				queued = iter(())
+				for future in [future for future in pending if future.cancel()]:
+					del pending[future]
+	finally:
+		for future in pending:
+			future.cancel()
+		executor.shutdown(wait=True)
+		if parse_pool is not None:
+			parse_pool.shutdown(wait=True)
+
+
+def _get_completed_record(future, celebrity):
+	"""
+	Returns the record of a completed collection task, or None if its requests failed after every retry, so that one celebrity's failure does not end the run.
+	"""
+	try:
+		return(future.result())
+	except Exception as error:
+		_count('record_errors')
+		print(f'Unable to collect {celebrity}: {error!r}')
+		return(None)
+
+
+def _get_request_cost(celebrity, astroseek_attributes):
+	if celebrity in astroseek_attributes or (_slug_index is not None and _slug_index.is_miss(celebrity)):
+		return(1)
+	return(2)
+
+
+#Functions for checkpointing long collection runs
+def get_snapshot_id(api_object):
+	"""
+	Returns an identifier for a Celebrity Bucks API call that changes whenever any ranking, price or ID in it changes.
+
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+
+	Returns
+	-------
+	str
+	   A hexadecimal digest of the API call
+
+	Examples
+	--------
+	>>> get_snapshot_id(api_object)
+	'3f1c0a9e2b7d4c61'
+	"""
+	if isinstance(api_object, CelebrityIndex):
+		api_object = api_object.api_object
+	return(hashlib.sha1(json.dumps(api_object, sort_keys=True).encode()).hexdigest()[:16])
+
+
+def load_checkpoint(checkpoint_dir):
+	"""
+	Returns the Celebrity Bucks API call and the records saved in a checkpoint directory.
+
+	Parameters
+	----------
+	  checkpoint_dir : str
+	    The checkpoint directory passed to `collect_celeb_data`.
+
+	Returns
+	-------
+	tuple
+	   The API object the checkpoint was collected under, or None if there is no checkpoint, and a Pandas data frame of the saved records
+
+	Examples
+	--------
+	>>> api_object, df = load_checkpoint('../data/checkpoint')
+	>>> len(df)
+	350
+	"""
+	api_path = os.path.join(checkpoint_dir, 'api_object.json')
+	records_path = os.path.join(checkpoint_dir, 'records.csv')
+
+	if not os.path.exists(api_path):
+		return(None, create_celeb_df())
+
+	with open(api_path) as api_file:
+		api_object = json.load(api_file)['api_object']
+
+	if not os.path.exists(records_path) or os.path.getsize(records_path) == 0:
+		return(api_object, create_celeb_df())
+
+	#Dropping a final row cut short by a crash mid-write
+	df = pd.read_csv(records_path, on_bad_lines='skip')
+	df = df[df['Last Update'].notna()].drop_duplicates('Celebrity', keep='last').reset_index(drop=True)
+	return(api_object, df)
+
+
+def start_checkpoint(checkpoint_dir, api_object, resume=False):
+	"""
+	Prepares a checkpoint directory for a collection run and returns the records already saved in it under the same API call when resuming.
+
+	Parameters
+	----------
+	  checkpoint_dir : str
+	    The directory in which to save collected records.
+
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
+
+	  resume : bool, optional
+	    Whether to keep records saved under the same API call. A checkpoint saved under a different API call is always started over.
+
+	Returns
+	-------
+	dict
+	   A dictionary mapping celebrity names to their saved records
+
+	Examples
+	--------
+	>>> checkpointed = start_checkpoint('../data/checkpoint', api_object, resume=True)
+	>>> len(checkpointed)
+	350
+	"""
+	if isinstance(api_object, CelebrityIndex):
+		api_object = api_object.api_object
+
+	os.makedirs(checkpoint_dir, exist_ok=True)
+
+	if resume:
+		checkpoint_api_object, df = load_checkpoint(checkpoint_dir)
+		if checkpoint_api_object is not None and get_snapshot_id(checkpoint_api_object) == get_snapshot_id(api_object):
+			return({record['Celebrity']:record for record in df.to_dict('records')})
+
+	#Starting a new checkpoint, written to a temporary file first so that it is never left half written
+	api_path = os.path.join(checkpoint_dir, 'api_object.json')
+	with open(api_path + '.tmp', 'w') as api_file:
+		json.dump({'snapshot_id':get_snapshot_id(api_object), 'api_object':api_object}, api_file)
+	os.replace(api_path + '.tmp', api_path)
+
+	records_path = os.path.join(checkpoint_dir, 'records.csv')
+	if os.path.exists(records_path):
+		os.remove(records_path)
+
+	return({})
+
+
+def append_to_checkpoint(checkpoint_dir, records):
+	"""
+	Appends collected records to a checkpoint directory and flushes them to disk.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
-	  
+	  checkpoint_dir : str
+	    The checkpoint directory prepared by `start_checkpoint`.
+
+	  records : list
+	    A list of records as returned by `get_celeb_record`.
+
 	Returns
 	-------
-	str
-	  A binary declaration as to whether the celebrity is alive or dead
 
 	Examples
 	--------
-	>>> living_status(soup_bill_clinton)
-	'Alive'
-	>>> living_status(soup_muhammad_ali)
-	'Dead'
+	>>> append_to_checkpoint('../data/checkpoint', [get_celeb_record(api_object, 'Rachel McAdams')])
 	"""
-	try:
-		if 'Seek celebrities by planet positions' in soup_object.find_all(class_='fl')[0].get_text().strip():
-			return('NaN')
+	records_path = os.path.join(checkpoint_dir, 'records.csv')
+	write_header = not os.path.exists(records_path) or os.path.getsize(records_path) == 0
 
-		for row in range(len(soup_object.find_all(class_='fl'))):
-			if soup_object.find_all(class_='fl')[row].get_text().strip() == 'Death:':
-				return('Dead')
-			else:
-				next
-		return('Alive')
-	except:
-		return('NaN')
+	buffer = CelebRecordBuffer(BIRTH_DATE_COLUMNS)
+	for record in records:
+		buffer.append(record)
 
+	with open(records_path, 'a', newline='') as records_file:
+		buffer.to_frame().to_csv(records_file, header=write_header, index=False)
+		records_file.flush()
+		os.fsync(records_file.fileno())
 
-def get_avg_21_day_price(soup_object):
+
+#Functions for saving the data set
+def to_typed_frame(df):
 	"""
-	Returns the average 21-day Celebrity Bucks price for a given celebrity. Source: https://celebritybucks.com/celebrities/.
+	Converts a data frame of celebrity attributes to compact dtypes: nullable 32-bit integers for prices, rankings, days and ages, 32-bit floats for ratios, categoricals for the repeated text values and a timestamp for 'Last Update'. 'NaN' placeholders become real missing values.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. 
-	  
+	  df : pandas.core.frame.DataFrame
+	    A Pandas data frame containing celebrity attributes.
+
 	Returns
 	-------
-	int
-	  The average 21-day Celebrity Bucks dollar value associated with the celebrity
+	pandas.core.frame.DataFrame
+	   A copy of the data frame with the dtypes in `CELEB_DTYPES`
 
 	Examples
 	--------
-	>>> get_avg_21_day_price(soup_kelly_clarkson)
-	36000
+	>>> to_typed_frame(df)['Living Status'].dtype
+	CategoricalDtype(categories=['Alive', 'Dead'], ordered=False, categories_dtype=object)
 	"""
-	try:
-		twenty_one_day_price = int(soup_object.find_all(class_='panel-body center')[0].get_text().strip()[1:].replace(',', ''))
-		return(twenty_one_day_price)
-	except:
-		return('NaN')
+	df = df.copy()
+
+	for column, dtype in CELEB_DTYPES.items():
+		if column not in df.columns:
+			continue
+
+		values = df[column]
+		if dtype in ['Int32', 'float32']:
+			values = pd.to_numeric(values, errors='coerce')
+			if dtype == 'Int32':
+				values = values.round()
+		elif dtype.startswith('datetime64'):
+			values = pd.to_datetime(values, errors='coerce', format='ISO8601')
+		else:
+			values = values.astype(object).where(values.notna() & (values.astype(object) != 'NaN'))
 
+		df[column] = values.astype(dtype)
 
-def get_all_time_high_price(soup_object):
+	return(df)
+
+
+def write_snapshot(df, path):
 	"""
-	Returns the all-time high Celebrity Bucks price for a given celebrity. Source: https://celebritybucks.com/celebrities/.
+	Saves a data frame of celebrity attributes, choosing the format from the file extension. Parquet ('.parquet') and Arrow ('.arrow' or '.feather') files are written with the compact dtypes of `to_typed_frame` and require pyarrow. Any other extension is written as CSV, as before.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. 
-	  
+	  df : pandas.core.frame.DataFrame
+	    A Pandas data frame containing celebrity attributes.
+
+	  path : str
+	    The path of the file to write.
+
 	Returns
 	-------
-	int
-	  The all-time high Celebrity Bucks dollar value associated with the celebrity
 
 	Examples
 	--------
-	>>> get_all_time_high_price(soup_george_clooney)
-	1721000
+	>>> write_snapshot(df, '../data/celebrity_data_attributes_2020-12-11_19_46_49.parquet')
 	"""
-	try:
-		return(int(soup_object.find_all(class_='panel-body center')[2].get_text().strip()[1:].replace(',', '')))
-	except:
-		try:
-			return(int(soup_object.find_all(class_='panel-body center')[1].get_text().strip()[1:].replace(',', '')))
-		except:
-			try:
-				return(int(soup_object.find_all(class_='panel-body center')[-2].get_text().strip()[1:].replace(',', '')))
-			except:
-				return('NaN')
+	extension = os.path.splitext(path)[1].lower()
+
+	if extension == '.parquet':
+		df_typed = to_typed_frame(df)
+		df_typed.to_parquet(path, index=False)
+	elif extension in ['.arrow', '.feather']:
+		df_typed = to_typed_frame(df).reset_index(drop=True)
+		df_typed.to_feather(path)
+	else:
+		df.to_csv(path, index=False)
 
 
-def get_days_since_ath(soup_object):
+def read_snapshot(path):
 	"""
-	Returns the number of days since a given celebrity acheived their all-time high Celebrity Bucks price. Source: https://celebritybucks.com/celebrities/.
+	Loads a data frame of celebrity attributes saved by `write_snapshot` or by earlier versions of this script.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity. 
-	  
+	  path : str
+	    The path of a CSV, Parquet or Arrow file.
+
 	Returns
 	-------
-	int
-	  The number of days since the celebrity acheived their all-time high Celebrity Bucks price
+	pandas.core.frame.DataFrame
+	   A Pandas data frame containing celebrity attributes
 
 	Examples
 	--------
-	>>> get_days_since_ath(soup_kate_middleton)
-	2049
+	>>> df = read_snapshot(find_latest_snapshot('../data'))
 	"""
-	months_shortened = {'Jan':1,'Feb':2,'Mar':3,'Apr':4,'May':5,'Jun':6,'Jul':7,'Aug':8,'Sep':9,'Oct':10,'Nov':11,'Dec':12}
-	try:
-		month_str_sh = soup_object.find_all(class_='panel-body center')[-1].get_text().strip().replace(",","").split()[0]
-		day = int(soup_object.find_all(class_='panel-body center')[-1].get_text().strip().replace(",","").split()[1])
-		year = int(soup_object.find_all(class_='panel-body center')[-1].get_text().strip().replace(",","").split()[2])
-	except:
-		return('NaN')
-			
-	month = months_shortened[month_str_sh]
-	
-	duration = date.today() - date(year,month,day)
-	return(duration.days)
+	extension = os.path.splitext(path)[1].lower()
 
+	if extension == '.parquet':
+		return(pd.read_parquet(path))
+	elif extension in ['.arrow', '.feather']:
+		return(pd.read_feather(path))
+	return(pd.read_csv(path))
 
-def get_cb_rec(soup_object):
+
+#Functions for refreshing a previous data set
+def find_latest_snapshot(data_dir='../data'):
 	"""
-	Returns the current Celebrity Bucks recommendation as to whether game players should buy, hold, or sell a given celebrity. Source: https://celebritybucks.com/celebrities/.
+	Returns the path of the most recent `celebrity_data_attributes` CSV or Parquet file in a directory, or None if there is none.
 
 	Parameters
 	----------
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity.
-	  
+	  data_dir : str, optional
+	    The directory the data sets are saved in.
+
 	Returns
 	-------
 	str
-	   The current Celebrity Bucks recommended action with regard to the celebrity
+	   The path of the most recent data set, judged by the timestamp in its file name
 
 	Examples
 	--------
-	>>> get_cb_rec(soup_tom_hanks)
-	'Buy'
-	>>> get_cb_rec(soup_gwyneth_paltrow)
-	'Hold'
-	>>> get_cb_rec(soup_miley_cyrus)
-	'Sell'
+	>>> find_latest_snapshot('../data')
+	'../data/celebrity_data_attributes_2020-12-11_19_46_49.csv'
 	"""
-	return(soup_object.find_all(role='alert')[1].get_text().strip().split()[-1])
+	snapshots = []
+	for file_name in os.listdir(data_dir):
+		match = re.fullmatch(r'celebrity_data_attributes_(\d+)-(\d+)-(\d+)_(\d+)_(\d+)_(\d+)\.(csv|parquet)', file_name)
+		if match:
+			snapshots.append((datetime(*[int(value) for value in match.groups()[:6]]), os.path.join(data_dir, file_name)))
 
+	if not snapshots:
+		return(None)
+	return(max(snapshots)[1])
 
-def append_to_df(df, celebrity):
+
+def get_changed_celebrities(previous_df, api_object):
 	"""
-	Collects data for a given celebrity from three sources and appends data to a `celebrity_data_attributes` Pandas data frame. Intended for script execution. Sources: Celebrity Bucks API, https://www.astro-seek.com/, and https://celebritybucks.com/celebrities/. 
+	Returns the celebrities in a Celebrity Bucks API call who are new or whose ranking or price moved since a previous data set was collected.
 
 	Parameters
 	----------
-	  df : pandas.core.frame.DataFrame
-	    A Pandas data frame with column names that correspond to celebrity attributes collected in other functions.
+	  previous_df : pandas.core.frame.DataFrame
+	    A previously collected data frame of celebrity attributes.
+
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
 
-	  celebrity : str
-	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
-	
 	Returns
 	-------
-	pandas.core.frame.DataFrame
-	   A Pandas data frame containing celebrity attributes
+	list
+	   The names of the new or changed celebrities, in ranking order
 
 	Examples
 	--------
-	>>> len(df)
-	64
-	>>> df = append_to_df(df, 'Rachel McAdams')
-	>>> len(df)
-	65
-	>>> df[df['Celebrity'] == 'Rachel McAdams'].to_dict()
-	{'Celebrity': {64: 'Rachel McAdams'},
-	 'Current Ranking': {64: 65},
-	 'Current Price': {64: 51000},
-	 'Avg. 21-Day Price': {64: 3000},
-	 'Avg. 21-Day Price/Current Price': {64: 0.059000000000000004},
-	 'All-Time High Price': {64: 377000},
-	 'All-Time High Price/Current Price': {64: 7.392},
-	 'Days Since All-Time High Price': {64: 2333},
-	 'Gender': {64: 'Female'},
-	 'Age': {64: 42.0},
-	 'Upcoming Birthday': {64: 'No upcoming birthday'},
-	 'U.S. Nationality': {64: 'Foreign to U.S.'},
-	 'Living Status': {64: 'Alive'},
-	 'Celebrity Bucks Recommendation': {64: 'Buy'},
-	 'Last Update': {64: '31:02.3'}}
+	>>> get_changed_celebrities(df_previous, api_object)
+	['Donald Trump', 'Joe Biden']
 	"""
-	#Scraping Celebrity Bucks individual celebrity site
-	soup_cb = get_celebritybucks_soup_object(api_object, celebrity)
+	if not isinstance(api_object, CelebrityIndex):
+		api_object = CelebrityIndex(api_object)
 
-	#Scraping Astro Seek individual celebrity site
-	soup_as = get_astroseek_soup_object(celebrity)
+	previous = previous_df.drop_duplicates('Celebrity').set_index('Celebrity')
+	changed = []
 
-	try:
-		#Current Ranking
-		current_ranking = get_celebritybucks_ranking(api_object, celebrity)
+	for celebrity in get_celebrity_list(api_object):
+		entry = api_object.lookup(celebrity)
+		if celebrity not in previous.index:
+			changed.append(celebrity)
+			continue
 
-		#Current Price
-		current_price = get_celebritybucks_price(api_object, celebrity)
+		previous_ranking = previous.at[celebrity, 'Current Ranking']
+		previous_price = previous.at[celebrity, 'Current Price']
+		if pd.isna(previous_ranking) or pd.isna(previous_price) or previous_ranking != entry['rank'] or previous_price != entry['price']:
+			changed.append(celebrity)
 
-		#Avg. 21-Day Price
-		twenty_one_day_price = get_avg_21_day_price(soup_cb)
+	return(changed)
 
-		#Avg. 21-Day Price/Current Price
-		ratio_21d = round(twenty_one_day_price/current_price,3)
 
-		#All-Time High Price
-		all_time_high_price = get_all_time_high_price(soup_cb)
+def refresh_celeb_data(previous_df, api_object, **kwargs):
+	"""
+	Brings a previously collected data frame of celebrity attributes up to date with a new Celebrity Bucks API call. Only new celebrities and celebrities whose ranking or price moved are scraped again, and their Astro Seek attributes are carried forward from the previous data frame instead of being fetched. Rows of unchanged celebrities, and of changed celebrities who could not be scraped again, are carried forward as they are, keeping their original 'Last Update'. Intended for refreshes within the same day, as 'Age' and 'Upcoming Birthday' are not recomputed for carried rows.
 
-		#All-Time High Price/Current Price
-		ratio_ath = round(all_time_high_price/current_price,3)
+	Parameters
+	----------
+	  previous_df : pandas.core.frame.DataFrame
+	    A previously collected data frame of celebrity attributes.
 
-		#Days Since All-Time High Price
-		duration_since_ath = get_days_since_ath(soup_cb)
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
 
-		#Gender
-		gender = get_gender(soup_as)
+	  **kwargs
+	    Options passed on to `collect_celeb_data`.
 
-		#Age
-		age = get_age(soup_as)
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	   A Pandas data frame containing celebrity attributes for every celebrity in the API call, in ranking order
 
-		#Upcoming Birthday
-		birthday_next_7_days = upcoming_birthday(soup_as)
+	Examples
+	--------
+	>>> df_previous = pd.read_csv(find_latest_snapshot('../data'))
+	>>> df = refresh_celeb_data(df_previous, api_object)
+	"""
+	if not isinstance(api_object, CelebrityIndex):
+		api_object = CelebrityIndex(api_object)
 
-		#U.S. Nationality
-		nationality = us_nationality(soup_as)
+	previous = previous_df.drop_duplicates('Celebrity').set_index('Celebrity', drop=False)
+	changed = get_changed_celebrities(previous_df, api_object)
 
-		#Living Status
-		living = living_status(soup_as)
+	astroseek_attributes = _get_carried_astroseek_attributes(previous, changed)
+	df_changed = collect_celeb_data(api_object, changed, astroseek_attributes=astroseek_attributes, **kwargs)
+	refreshed = {record['Celebrity']:record for record in df_changed.to_dict('records')}
 
-		#Celebrity Bucks Recommendation
-		cb_rec = get_cb_rec(soup_cb)
+	buffer = CelebRecordBuffer()
+	for celebrity in get_celebrity_list(api_object):
+		if celebrity in refreshed:
+			buffer.append(refreshed[celebrity])
+		elif celebrity in previous.index:
+			buffer.append(previous.loc[celebrity].to_dict())
 
-		#Last Update
-		current_time = datetime.now()
+	return(buffer.to_frame())
 
-		#Appending row to dataframe
-		df = df.append({'Celebrity':celebrity, 
-						'Current Ranking':current_ranking,
-						'Current Price':current_price,
-						'Avg. 21-Day Price':twenty_one_day_price,
-						'Avg. 21-Day Price/Current Price':ratio_21d,
-						'All-Time High Price':all_time_high_price,
-						'All-Time High Price/Current Price':ratio_ath,
-						'Days Since All-Time High Price':duration_since_ath,
-						'Gender':gender,
-						'Age':age,
-						'Upcoming Birthday':birthday_next_7_days,
-						'U.S. Nationality':nationality,
-						'Living Status':living,
-						'Celebrity Bucks Recommendation':cb_rec,
-						'Last Update':current_time},  
-						ignore_index = True) 
-	except:
-		print(f'Unable to add record for {celebrity} to data frame.')
 
-	return(df)
+def _get_carried_astroseek_attributes(previous, celebrities):
+	#Only data sets collected with `birth_dates` carry birth dates
+	columns = ASTROSEEK_COLUMNS + (['Birth Date'] if 'Birth Date' in previous.columns else [])
+	return({celebrity:{column:previous.at[celebrity, column] for column in columns} for celebrity in celebrities if celebrity in previous.index})
 
 
-def get_celeb_data(api_object, soup_cb, soup_as, celebrity):
+#Functions for scheduling budgeted crawls
+def prioritise_celebrities(api_object, priority='rank', previous_df=None):
 	"""
-	Collects data for a given celebrity from three sources and returns data as a single row in a Pandas data frame. Intended for interactive usage. Sources: Celebrity Bucks API, https://www.astro-seek.com/, and https://celebritybucks.com/celebrities/. 
+	Orders the celebrities in a Celebrity Bucks API call by how valuable it is to scrape them first: by ranking, by how far their price moved since a previous data set, or by how long ago they were last scraped. New celebrities come first when ordering by price movement or staleness, and ties keep ranking order.
 
 	Parameters
 	----------
-	  api_object : dict
-	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API.
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
 
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Celebrity Bucks webpage corresponding to a given celebrity.
+	  priority : str, optional
+	    One of `CRAWL_PRIORITIES`: 'rank', 'price_movement' or 'staleness'.
 
-	  soup_object: bs4.BeautifulSoup
-	    A BeautifulSoup object containing HTML from the Astro Seek birth chart webpage corresponding to a given celebrity. 
+	  previous_df : pandas.core.frame.DataFrame, optional
+	    A previously collected data frame of celebrity attributes. Required when ordering by price movement or staleness.
 
-	  celebrity : str
-	    A celebrity's first and last name encapsulated in single or double quotes. Not case sensitive.
-	
 	Returns
 	-------
-	pandas.core.frame.DataFrame
-	   A Pandas data frame containing attributes for a given celebrity
+	list
+	   The names of the celebrities, most valuable first
 
 	Examples
 	--------
-	>>> get_celeb_data(api_object, soup_cb, soup_as, celebrity='Rachel McAdams')
-	>>> df[df['Celebrity'] == 'Rachel McAdams'].to_dict()
-	{'Celebrity': {0: 'Rachel McAdams'},
-	 'Current Ranking': {0: 65},
-	 'Current Price': {0: 51000},
-	 'Avg. 21-Day Price': {0: 3000},
-	 'Avg. 21-Day Price/Current Price': {0: 0.059000000000000004},
-	 'All-Time High Price': {0: 377000},
-	 'All-Time High Price/Current Price': {0: 7.392},
-	 'Days Since All-Time High Price': {0: 2333},
-	 'Gender': {0: 'Female'},
-	 'Age': {0: 42.0},
-	 'Upcoming Birthday': {0: 'No upcoming birthday'},
-	 'U.S. Nationality': {0: 'Foreign to U.S.'},
-	 'Living Status': {0: 'Alive'},
-	 'Celebrity Bucks Recommendation': {0: 'Buy'},
-	 'Last Update': {0: '31:02.3'}}
+	>>> prioritise_celebrities(api_object, 'price_movement', df_previous)[0:2]
+	['Joe Biden', 'Donald Trump']
 	"""
-	df = create_celeb_df()
+	assert priority in CRAWL_PRIORITIES, f"Priority must be one of {CRAWL_PRIORITIES}."
+	assert priority == 'rank' or previous_df is not None, "Ordering by price movement or staleness requires a previous data frame."
+
+	celebrities = list(dict.fromkeys(get_celebrity_list(api_object)))
+	if priority == 'rank':
+		return(celebrities)
+
+	previous = previous_df.drop_duplicates('Celebrity').set_index('Celebrity').reindex(celebrities)
+	if priority == 'price_movement':
+		previous_price = _to_number(previous['Current Price']).to_numpy()
+		current_price = lookup_celebrities(api_object, celebrities)['Current Price'].astype('float64').to_numpy()
+		score = pd.Series(abs(current_price - previous_price) / previous_price, index=celebrities).fillna(float('inf'))
+		order = score.sort_values(ascending=False, kind='stable')
+	else:
+		last_update = pd.to_datetime(previous['Last Update'].where(previous['Last Update'] != 'NaN'), errors='coerce', format='ISO8601')
+		order = last_update.sort_values(na_position='first', kind='stable')
 
-	#Current Ranking
-	try:
-		current_ranking = get_celebritybucks_ranking(api_object, celebrity)
-	except:
-		current_ranking = 'NaN'
+	return(order.index.tolist())
 
-	#Current Price
-	try:
-		current_price = get_celebritybucks_price(api_object, celebrity)
-	except:
-		current_price = 'NaN'
 
-	#Avg. 21-Day Price
-	try:
-		twenty_one_day_price = get_avg_21_day_price(soup_cb)
-	except:
-		twenty_one_day_price = 'NaN'
+def schedule_crawl(api_object, priority='rank', previous_df=None, time_budget=None, request_budget=None, **kwargs):
+	"""
+	Scrapes celebrities in order of priority until a time or request budget runs out, so that a bounded crawl always collects the most valuable rows first. Rows of celebrities not reached are carried forward from a previous data frame, if given, and every row is marked with its freshness in a 'Freshness' column: 'Fresh' if it was scraped in this crawl and 'Stale' if it was carried forward. Celebrities neither reached nor in the previous data frame are left out. Astro Seek attributes are carried forward from the previous data frame instead of being fetched, as in `refresh_celeb_data`.
 
-	#Avg. 21-Day Price/Current Price
-	try:
-		ratio_21d = round(twenty_one_day_price/current_price,3)
-	except:
-		ratio_21d = 'NaN'
+	Parameters
+	----------
+	  api_object : dict or CelebrityIndex
+	    A JSON object containing celebrity rankings and price values from the Celebrity Bucks API, or a CelebrityIndex built from one.
 
-	#All-Time High Price
-	try:
-		all_time_high_price = get_all_time_high_price(soup_cb)
-	except:
-		all_time_high_price = 'NaN'
+	  priority : str, optional
+	    The order in which celebrities are scraped, one of `CRAWL_PRIORITIES`.
 
-	#All-Time High Price/Current Price
-	try:
-		ratio_ath = round(all_time_high_price/current_price,3)
-	except:
-		ratio_ath = 'NaN'
+	  previous_df : pandas.core.frame.DataFrame, optional
+	    A previously collected data frame of celebrity attributes.
 
-	#Days Since All-Time High Price
-	try:
-		duration_since_ath = get_days_since_ath(soup_cb)
-	except:
-		duration_since_ath = 'NaN'
+	  time_budget : float, optional
+	    The number of seconds after which no further celebrities are started. Unbounded by default.
 
-	#Gender
-	try:
-		gender = get_gender(soup_as)
-	except:
-		gender = 'NaN'
+	  request_budget : int, optional
+	    The maximum number of webpage requests, counted as in `collect_celeb_data`. Unbounded by default.
 
-	#Age
-	try:
-		age = get_age(soup_as)
-	except:
-		age = 'NaN'
+	  **kwargs
+	    Options passed on to `collect_celeb_data`.
 
-	#Upcoming Birthday
-	try:
-		birthday_next_7_days = upcoming_birthday(soup_as)
-	except:
-		birthday_next_7_days = 'NaN'
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	   A Pandas data frame containing celebrity attributes and their freshness, in ranking order
 
-	#U.S. Nationality
-	try:
-		nationality = us_nationality(soup_as)
-	except:
-		nationality = 'NaN'
+	Examples
+	--------
+	>>> df = schedule_crawl(api_object, 'price_movement', df_previous, time_budget=10*60)
+	>>> df['Freshness'].value_counts()
+	Fresh    412
+	Stale    305
+	"""
+	if not isinstance(api_object, CelebrityIndex):
+		api_object = CelebrityIndex(api_object)
 
-	#Living Status
-	try:
-		living = living_status(soup_as)
-	except:
-		living = 'NaN'
+	celebrities = prioritise_celebrities(api_object, priority, previous_df)
 
-	#Celebrity Bucks Recommendation
-	try:
-		cb_rec = get_cb_rec(soup_cb)
-	except:
-		cb_rec = 'NaN'
+	previous = pd.DataFrame(columns=CELEB_COLUMNS) if previous_df is None else previous_df.drop_duplicates('Celebrity').set_index('Celebrity', drop=False)
+	astroseek_attributes = _get_carried_astroseek_attributes(previous, celebrities)
+	df_fresh = collect_celeb_data(api_object, celebrities, astroseek_attributes=astroseek_attributes, time_budget=time_budget, request_budget=request_budget, **kwargs)
+	fresh = {record['Celebrity']:record for record in df_fresh.to_dict('records')}
 
-	#Last Update
-	try:
-		current_time = datetime.now()
-	except:
-		current_time = 'NaN'
+	buffer = CelebRecordBuffer(CELEB_COLUMNS + ['Freshness'])
+	for celebrity in dict.fromkeys(get_celebrity_list(api_object)):
+		if celebrity in fresh:
+			buffer.append(dict(fresh[celebrity], Freshness='Fresh'))
+		elif celebrity in previous.index:
+			buffer.append(dict(previous.loc[celebrity].to_dict(), Freshness='Stale'))
 
-	#Appending row to dataframe
-	df = df.append({'Celebrity':celebrity, 
-					'Current Ranking':current_ranking,
-					'Current Price':current_price,
-					'Avg. 21-Day Price':twenty_one_day_price,
-					'Avg. 21-Day Price/Current Price':ratio_21d,
-					'All-Time High Price':all_time_high_price,
-					'All-Time High Price/Current Price':ratio_ath,
-					'Days Since All-Time High Price':duration_since_ath,
-					'Gender':gender,
-					'Age':age,
-					'Upcoming Birthday':birthday_next_7_days,
-					'U.S. Nationality':nationality,
-					'Living Status':living,
-					'Celebrity Bucks Recommendation':cb_rec,
-					'Last Update':current_time},  
-					ignore_index = True) 
+	return(buffer.to_frame())
 
-	return(df)
 
+#Functions for re-running the extractors over archived crawls
+def reextract_crawl(archive, crawl_id=None, **kwargs):
+	"""
+	Re-runs every extractor over the API call and webpages archived during a past crawl, without touching the network, and returns the resulting data frame of celebrity attributes. The response cache, rate limiter, slug index and archive in use are bypassed while re-extracting and restored afterwards. Intended for debugging and backfilling after an extractor is fixed.
+
+	Parameters
+	----------
+	  archive : PageArchive
+	    The archive holding the crawl.
+
+	  crawl_id : str, optional
+	    The ID of the crawl. Defaults to the latest archived crawl.
+
+	  **kwargs
+	    Options passed on to `collect_celeb_data`.
+
+	Returns
+	-------
+	pandas.core.frame.DataFrame
+	   A Pandas data frame containing celebrity attributes for every celebrity in the archived API call
+
+	Examples
+	--------
+	>>> df = reextract_crawl(PageArchive('../data/archive'), '2020-12-11_19_46_49', progress=False)
+	"""
+	if crawl_id is None:
+		crawls = archive.get_crawls()
+		assert crawls, "The archive holds no crawls."
+		crawl_id = crawls[-1]
+
+	#Answering every request from the crawl alone, without caching, pacing, skipping known misses or archiving again
+	global _response_cache, _rate_limiter, _slug_index, _archive, _crawl_id
+	in_use = (_response_cache, _rate_limiter, _slug_index, _archive, _crawl_id)
+	_response_cache, _rate_limiter, _slug_index, _archive, _crawl_id = None, None, None, None, None
+
+	try:
+		session = ArchiveReplaySession(archive, crawl_id)
+		api_object = get_celebritybucks_api_object(session)
+		return(collect_celeb_data(api_object, session=session, **kwargs))
+	finally:
+		_response_cache, _rate_limiter, _slug_index, _archive, _crawl_id = in_use
 
 
 if __name__ == "__main__":
 
-	#Celebrity Bucks API call
-	api_object = get_celebritybucks_api_object()
+	arg_parser = argparse.ArgumentParser(description='Creates a data set of celebrity attributes for every celebrity in the Celebrity Bucks API.')
+	arg_parser.add_argument('--workers-per-host', type=int, default=4, help='Maximum number of concurrent requests to each scraped host.')
+	arg_parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Number of seconds to wait for a server before giving up.')
+	arg_parser.add_argument('--parser', default=DEFAULT_PARSER, help="HTML parser backend passed to bs4.BeautifulSoup, such as 'html.parser' or 'lxml'.")
+	arg_parser.add_argument('--requests-per-second', type=float, default=None, help='Maximum sustained number of requests per second to each scraped host. Unpaced by default.')
+	arg_parser.add_argument('--cache', default=None, help='Path of a SQLite response cache to read from and write to.')
+	arg_parser.add_argument('--record', default=None, help='Directory in which every fetched response is recorded for offline replay.')
+	arg_parser.add_argument('--replay', default=None, help='Directory of recorded responses to answer every request from, without touching the network.')
+	arg_parser.add_argument('--slug-index', default=None, help='Path of a SQLite index of resolved Astro Seek slugs and known misses to read from and write to.')
+	arg_parser.add_argument('--archive', default=None, help='Directory of a compressed page archive in which the API call and every fetched webpage of this run are stored.')
+	arg_parser.add_argument('--parse-workers', type=int, default=None, help='Number of worker processes that parse webpages, leaving the threads to fetching. Parses in the fetching threads by default.')
+	arg_parser.add_argument('--parse-only', action='store_true', help='Parse only the webpage elements read by the attribute extractors.')
+	arg_parser.add_argument('--checkpoint-dir', default='../data/checkpoint', help='Directory in which collected records are saved as the run progresses.')
+	arg_parser.add_argument('--checkpoint-every', type=int, default=50, help='Number of collected records to save to the checkpoint at a time.')
+	arg_parser.add_argument('--resume', action='store_true', help='Resume the run saved in the checkpoint directory, reusing its Celebrity Bucks API call.')
+	arg_parser.add_argument('--metrics', default=None, help="Path to which this run's stage timings and counters are written, as Prometheus text if the path ends in .prom and as JSON otherwise.")
+	arg_parser.add_argument('--history', default=None, help="Path of a SQLite price history store to which this run's prices and rankings are appended.")
+	arg_parser.add_argument('--format', choices=['csv', 'parquet'], default='csv', help='File format of the saved data set. Parquet files use compact dtypes and require pyarrow.')
+	arg_parser.add_argument('--priority', choices=CRAWL_PRIORITIES, default='rank', help='Order in which celebrities are scraped. Ordering by price movement or staleness compares against the previous data set given by --incremental.')
+	arg_parser.add_argument('--time-budget', type=float, default=None, help='Number of seconds after which no further celebrities are scraped. Rows not reached are carried from the previous data set and marked stale.')
+	arg_parser.add_argument('--request-budget', type=int, default=None, help='Maximum number of webpage requests. Rows not reached are carried from the previous data set and marked stale.')
+	arg_parser.add_argument('--incremental', nargs='?', const='latest', default=None, help='Re-scrape only new celebrities and celebrities whose ranking or price moved since a previous data set, given by path or defaulting to the latest one in ../data. With --time-budget, --request-budget or --priority, every celebrity is scraped in order of priority instead, and the previous data set supplies the rows not reached.')
+	args = arg_parser.parse_args()
+
+	#Previous data set to refresh or to order and fill in a scheduled crawl
+	previous_snapshot = find_latest_snapshot('../data') if args.incremental == 'latest' else args.incremental
+	if args.priority != 'rank' and args.incremental is None:
+		arg_parser.error(f'--priority {args.priority} requires --incremental, with the path of a previous data set or with no path to use the latest one in ../data.')
+	if args.priority != 'rank' and previous_snapshot is None:
+		arg_parser.error(f'--priority {args.priority} found no previous data set in ../data for --incremental.')
+
+	#Shared HTTP session and response cache for every request in the run
+	session = create_session(pool_maxsize=args.workers_per_host)
+	if args.replay is not None:
+		session = ReplaySession(args.replay)
+	elif args.record is not None:
+		session = RecordingSession(args.record, session)
+	if args.archive is not None:
+		set_archive(PageArchive(args.archive))
+	if args.cache is not None:
+		set_response_cache(ResponseCache(args.cache))
+	if args.slug_index is not None:
+		set_slug_index(SlugIndex(args.slug_index))
+	if args.requests_per_second is not None:
+		set_rate_limiter(HostRateLimiter(requests_per_second=args.requests_per_second, max_in_flight=args.workers_per_host))
+	if args.metrics is not None:
+		set_metrics(CrawlMetrics())
+
+	#Celebrity Bucks API call, indexed once for constant-time lookups
+	checkpoint_api_object = load_checkpoint(args.checkpoint_dir)[0] if args.resume else None
+	if checkpoint_api_object is not None:
+		api_object = CelebrityIndex(checkpoint_api_object)
+	else:
+		try:
+			api_object = CelebrityIndex(get_celebritybucks_api_object(session, args.timeout))
+		except requests.exceptions.HTTPError as error:
+			sys.exit(str(error))
+
+	#Recording prices and rankings in the price history store
+	if args.history is not None:
+		PriceHistoryStore(args.history).append_snapshot(api_object)
 
 	#Creating a list of celebrities based on the results of the API call
 	celebrities = get_celebrity_list(api_object)
 
 	print(f'There are {len(celebrities)} celebrities who have Celebrity Bucks values!')
 
-	#Creating the celebrity attribute data frame
-	df_celeb = create_celeb_df()
-
 	#Filling in the data frame
-	for num in range(len(celebrities)):
-	    celebrity = celebrities[num]
-	    df_celeb = append_to_df(df_celeb, celebrity)
-	    
-	    #Progress tracker
-	    if num%10==0:
-	        print(f'{num} celebrities out of {len(celebrities)} collected!')
-	    if num+1==len(celebrities):
-	        print('Done!')
+	collect_options = {'workers_per_host':args.workers_per_host, 'session':session, 'timeout':args.timeout, 'parser':args.parser, 'parse_only':args.parse_only,
+					   'checkpoint_dir':args.checkpoint_dir, 'checkpoint_every':args.checkpoint_every, 'resume':args.resume, 'parse_workers':args.parse_workers}
+
+	if args.time_budget is not None or args.request_budget is not None or args.priority != 'rank':
+		previous_df = None if previous_snapshot is None else read_snapshot(previous_snapshot)
+		if previous_df is not None:
+			print(f'Scraping every celebrity in order of {args.priority}, carrying rows not reached from {previous_snapshot}.')
+		df_celeb = schedule_crawl(api_object, args.priority, previous_df, args.time_budget, args.request_budget, **collect_options)
+	elif previous_snapshot is not None:
+		print(f'Refreshing {previous_snapshot}.')
+		df_celeb = refresh_celeb_data(read_snapshot(previous_snapshot), api_object, **collect_options)
+	else:
+		df_celeb = collect_celeb_data(api_object, celebrities, **collect_options)
 
 	#Saving the data frame
 	current_time = datetime.now()
-	df_celeb.to_csv(f'../data/celebrity_data_attributes_{current_time.year}-{current_time.month}-{current_time.day}_{current_time.hour}_{current_time.minute}_{current_time.second}.csv',index=False)
\ No newline at end of file
+	write_snapshot(df_celeb, f'../data/celebrity_data_attributes_{current_time.year}-{current_time.month}-{current_time.day}_{current_time.hour}_{current_time.minute}_{current_time.second}.{args.format}')
+
+	#Saving the run's stage timings and counters
+	if args.metrics is not None:
+		if args.metrics.endswith('.prom'):
+			_metrics.to_prometheus(args.metrics)
+		else:
+			_metrics.to_json(args.metrics)
@@ -0,0 +1,34 @@
+#Importing dependencies
+import importlib
+
+
+class LazyModule:
+	"""
+	A stand-in for a module that imports it on first attribute access, so that importing the package stays fast for tools and worker processes that only look up prices and rankings. After the first access it behaves like the module itself.
+
+	Parameters
+	----------
+	  name : str
+	    The absolute name of the module.
+
+	Examples
+	--------
+	>>> pd = LazyModule('pandas')
+	>>> 'pandas' in sys.modules
+	False
+	>>> pd.DataFrame(columns=CELEB_COLUMNS).shape
+	(0, 15)
+	"""
+	def __init__(self, name):
+		self._name = name
+		self._module = None
+
+	def __getattr__(self, attribute):
+		#Only called for attributes missing from the stand-in itself
+		if self._module is None:
+			self._module = importlib.import_module(self._name)
+		return(getattr(self._module, attribute))
+
+	def __repr__(self):
+		state = 'unloaded' if self._module is None else 'loaded'
+		return(f'<LazyModule {self._name!r} ({state})>')
@@ -0,0 +1,149 @@
+#Importing dependencies
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+
+class CrawlMetrics:
+	"""
+	Collects the latencies and counters of a crawl run: time spent in each stage, labelled by host or extractor, the time taken to assemble each celebrity's record, and counts of cache hits, retries, requests and 'NaN' fallbacks. Metrics are exportable as JSON or in the Prometheus text exposition format. Safe to share between threads.
+
+	Examples
+	--------
+	>>> metrics = CrawlMetrics()
+	>>> set_metrics(metrics)
+	>>> df = collect_celeb_data(api_object)
+	>>> metrics.get_timing('parse', host='www.astro-seek.com')
+	{'count': 717, 'total_seconds': 12.408, 'max_seconds': 0.094}
+	>>> metrics.to_json('../data/metrics.json')
+	"""
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._timings = {}
+		self._counters = {}
+		self._celebrities = {}
+
+	@contextmanager
+	def time(self, stage, **labels):
+		"""
+		A context manager that records the time spent inside it under a stage and labels.
+		"""
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.observe(stage, time.perf_counter() - start, **labels)
+
+	def observe(self, stage, seconds, **labels):
+		"""
+		Records a number of seconds spent in a stage, under the given labels.
+		"""
+		key = (stage, _freeze(labels))
+		with self._lock:
+			timing = self._timings.setdefault(key, [0, 0.0, 0.0])
+			timing[0] += 1
+			timing[1] += seconds
+			timing[2] = max(timing[2], seconds)
+
+	def observe_celebrity(self, celebrity, seconds):
+		"""
+		Records the number of seconds taken to assemble a celebrity's record.
+		"""
+		with self._lock:
+			self._celebrities[celebrity] = seconds
+
+	def increment(self, name, amount=1, **labels):
+		"""
+		Adds an amount to a counter, under the given labels.
+		"""
+		key = (name, _freeze(labels))
+		with self._lock:
+			self._counters[key] = self._counters.get(key, 0) + amount
+
+	def get_count(self, name, **labels):
+		"""
+		Returns the value of a counter under the given labels, or the total over every label if none are given.
+		"""
+		with self._lock:
+			if labels:
+				return(self._counters.get((name, _freeze(labels)), 0))
+			return(sum(value for (counter, counter_labels), value in self._counters.items() if counter == name))
+
+	def get_timing(self, stage, **labels):
+		"""
+		Returns the number of observations, total seconds and longest observation of a stage under the given labels.
+		"""
+		with self._lock:
+			count, total, longest = self._timings.get((stage, _freeze(labels)), [0, 0.0, 0.0])
+		return({'count':count, 'total_seconds':total, 'max_seconds':longest})
+
+	def get_slowest_celebrities(self, n=10):
+		"""
+		Returns the n celebrities whose records took longest to assemble, as (celebrity, seconds) tuples, slowest first.
+		"""
+		with self._lock:
+			return(sorted(self._celebrities.items(), key=lambda item: item[1], reverse=True)[0:n])
+
+	def to_dict(self):
+		"""
+		Returns every metric as a dictionary of plain values.
+		"""
+		with self._lock:
+			return({'timings':[{'stage':stage, 'labels':dict(labels), 'count':count, 'total_seconds':total, 'max_seconds':longest}
+							   for (stage, labels), (count, total, longest) in sorted(self._timings.items())],
+					'counters':[{'name':name, 'labels':dict(labels), 'value':value} for (name, labels), value in sorted(self._counters.items())],
+					'celebrities':dict(self._celebrities)})
+
+	def to_json(self, path=None):
+		"""
+		Returns every metric as a JSON string, also writing it to a file if a path is given.
+		"""
+		text = json.dumps(self.to_dict(), indent=1)
+		if path is not None:
+			with open(path, 'w') as metrics_file:
+				metrics_file.write(text)
+		return(text)
+
+	def to_prometheus(self, path=None, prefix='celebrity_bucks'):
+		"""
+		Returns the stage timings and counters in the Prometheus text exposition format, also writing them to a file if a path is given. Per-celebrity timings are left out to keep the number of series bounded.
+		"""
+		metrics = self.to_dict()
+		lines = []
+
+		if metrics['timings']:
+			lines.append(f'# HELP {prefix}_stage_seconds Time spent in each crawl stage.')
+			lines.append(f'# TYPE {prefix}_stage_seconds summary')
+			for timing in metrics['timings']:
+				labels = _format_labels(dict(stage=timing['stage'], **timing['labels']))
+				lines.append(f"{prefix}_stage_seconds_count{labels} {timing['count']}")
+				lines.append(f"{prefix}_stage_seconds_sum{labels} {timing['total_seconds']!r}")
+			lines.append(f'# HELP {prefix}_stage_seconds_max Longest time spent in each crawl stage.')
+			lines.append(f'# TYPE {prefix}_stage_seconds_max gauge')
+			for timing in metrics['timings']:
+				labels = _format_labels(dict(stage=timing['stage'], **timing['labels']))
+				lines.append(f"{prefix}_stage_seconds_max{labels} {timing['max_seconds']!r}")
+
+		for name in sorted({counter['name'] for counter in metrics['counters']}):
+			lines.append(f'# TYPE {prefix}_{name}_total counter')
+			for counter in metrics['counters']:
+				if counter['name'] == name:
+					lines.append(f"{prefix}_{name}_total{_format_labels(counter['labels'])} {counter['value']}")
+
+		text = '\n'.join(lines) + '\n'
+		if path is not None:
+			with open(path, 'w') as metrics_file:
+				metrics_file.write(text)
+		return(text)
+
+
+def _freeze(labels):
+	return(tuple(sorted((label, str(value)) for label, value in labels.items())))
+
+
+def _format_labels(labels):
+	if not labels:
+		return('')
+	escaped = {label:str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for label, value in labels.items()}
+	return('{' + ','.join(f'{label}="{value}"' for label, value in escaped.items()) + '}')
@@ -0,0 +1,216 @@
+#Importing dependencies
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from celebrity_bucks_game_player_advantage.lazy_import import LazyModule
+
+pd = LazyModule('pandas')
+
+
+class PriceHistoryStore:
+	"""
+	An append-only store of Celebrity Bucks prices and rankings kept in a SQLite database, one row per celebrity per API call. Rows are clustered by celebrity ID and time, so the history of a celebrity over any date range is read without scanning the rest of the store.
+
+	Parameters
+	----------
+	  path : str
+	    The path of the SQLite database file. Use ':memory:' for a store that is not persisted.
+
+	Examples
+	--------
+	>>> store = PriceHistoryStore('../data/price_history.sqlite')
+	>>> store.append_snapshot(api_object)
+	717
+	>>> store.get_history('2488', start=datetime(2020, 12, 1)).columns.tolist()
+	['Recorded At', 'Current Price', 'Current Ranking']
+	"""
+	def __init__(self, path):
+		self.path = path
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(path, check_same_thread=False)
+		with self._connection:
+			self._connection.execute('''CREATE TABLE IF NOT EXISTS prices (
+										celeb_id TEXT,
+										recorded_at TEXT,
+										celebrity TEXT,
+										price INTEGER,
+										ranking INTEGER,
+										PRIMARY KEY (celeb_id, recorded_at)) WITHOUT ROWID''')
+			self._connection.execute('CREATE INDEX IF NOT EXISTS prices_recorded_at ON prices (recorded_at)')
+
+	def __len__(self):
+		with self._lock:
+			return(self._connection.execute('SELECT COUNT(*) FROM prices').fetchone()[0])
+
+	def append_snapshot(self, api_object, recorded_at=None):
+		"""
+		Appends the price and ranking of every celebrity in a Celebrity Bucks API call, recorded at a given time, and returns the number of rows added. A celebrity already recorded at the same time is left unchanged.
+		"""
+		if hasattr(api_object, 'api_object'):
+			api_object = api_object.api_object
+		if recorded_at is None:
+			recorded_at = datetime.now()
+
+		timestamp = _format_timestamp(recorded_at)
+		rows = [(value['celebId'], timestamp, value['name'], value['price'], rank)
+				for rank, value in enumerate(api_object['CelebrityValues'], start=1)]
+
+		with self._lock:
+			with self._connection:
+				before = self._connection.total_changes
+				self._connection.executemany('INSERT OR IGNORE INTO prices VALUES (?, ?, ?, ?, ?)', rows)
+				return(self._connection.total_changes - before)
+
+	def get_history(self, celeb_id, start=None, end=None):
+		"""
+		Returns the recorded prices and rankings of a celebrity, given by Celebrity Bucks ID, between two times inclusive, oldest first.
+		"""
+		query = 'SELECT recorded_at, price, ranking FROM prices WHERE celeb_id = ?'
+		parameters = [str(celeb_id)]
+		query, parameters = _add_time_range(query, parameters, start, end)
+
+		with self._lock:
+			rows = self._connection.execute(query + ' ORDER BY recorded_at', parameters).fetchall()
+		return(_history_frame(rows, ['Recorded At', 'Current Price', 'Current Ranking']))
+
+	def get_snapshots(self, start=None, end=None):
+		"""
+		Returns the recorded prices and rankings of every celebrity between two times inclusive, ordered by time and ranking.
+		"""
+		query = 'SELECT recorded_at, celeb_id, celebrity, price, ranking FROM prices WHERE 1 = 1'
+		query, parameters = _add_time_range(query, [], start, end)
+
+		with self._lock:
+			rows = self._connection.execute(query + ' ORDER BY recorded_at, ranking', parameters).fetchall()
+		return(_history_frame(rows, ['Recorded At', 'celebId', 'Celebrity', 'Current Price', 'Current Ranking']))
+
+	def get_celeb_ids(self, celebrity):
+		"""
+		Returns the Celebrity Bucks IDs recorded for a celebrity name.
+		"""
+		with self._lock:
+			rows = self._connection.execute('SELECT DISTINCT celeb_id FROM prices WHERE celebrity = ? ORDER BY celeb_id', (celebrity,)).fetchall()
+		return([row[0] for row in rows])
+
+	def close(self):
+		"""
+		Closes the underlying database connection.
+		"""
+		with self._lock:
+			self._connection.close()
+
+
+def get_rolling_average_price(store, celeb_id, days=21, end=None):
+	"""
+	Returns the average recorded Celebrity Bucks price of a celebrity over a number of days, computed from a PriceHistoryStore without fetching any webpage.
+
+	Parameters
+	----------
+	  store : PriceHistoryStore
+	    The price history store.
+
+	  celeb_id : str
+	    The celebrity's Celebrity Bucks ID.
+
+	  days : int, optional
+	    The length of the window, in days.
+
+	  end : datetime.datetime, optional
+	    The end of the window. Defaults to now.
+
+	Returns
+	-------
+	float
+	   The average price, or 'NaN' if no price was recorded in the window
+
+	Examples
+	--------
+	>>> get_rolling_average_price(store, '2488', days=21)
+	13500.0
+	"""
+	if end is None:
+		end = datetime.now()
+
+	history = store.get_history(celeb_id, start=end - timedelta(days=days), end=end)
+	if history.empty:
+		return('NaN')
+	return(float(history['Current Price'].mean()))
+
+
+def get_all_time_high(store, celeb_id):
+	"""
+	Returns the highest recorded Celebrity Bucks price of a celebrity and when it was first recorded.
+
+	Parameters
+	----------
+	  store : PriceHistoryStore
+	    The price history store.
+
+	  celeb_id : str
+	    The celebrity's Celebrity Bucks ID.
+
+	Returns
+	-------
+	tuple
+	   The highest price and its time as a pandas.Timestamp, or ('NaN', 'NaN') if no price was recorded
+
+	Examples
+	--------
+	>>> get_all_time_high(store, '2488')
+	(21000, Timestamp('2020-12-11 19:46:49'))
+	"""
+	history = store.get_history(celeb_id)
+	if history.empty:
+		return('NaN', 'NaN')
+
+	peak = history.loc[history['Current Price'].idxmax()]
+	return(int(peak['Current Price']), peak['Recorded At'])
+
+
+def get_drawdown(store, celeb_id):
+	"""
+	Returns how far the latest recorded Celebrity Bucks price of a celebrity sits below its highest recorded price, as a fraction of the highest price.
+
+	Parameters
+	----------
+	  store : PriceHistoryStore
+	    The price history store.
+
+	  celeb_id : str
+	    The celebrity's Celebrity Bucks ID.
+
+	Returns
+	-------
+	float
+	   The drawdown between 0 and 1, or 'NaN' if no positive price was recorded
+
+	Examples
+	--------
+	>>> get_drawdown(store, '2488')
+	0.333
+	"""
+	history = store.get_history(celeb_id)
+	if history.empty or history['Current Price'].max() <= 0:
+		return('NaN')
+	return(round(1 - history['Current Price'].iloc[-1] / history['Current Price'].max(), 3))
+
+
+def _format_timestamp(value):
+	return(pd.Timestamp(value).strftime('%Y-%m-%d %H:%M:%S.%f'))
+
+
+def _add_time_range(query, parameters, start, end):
+	if start is not None:
+		query += ' AND recorded_at >= ?'
+		parameters.append(_format_timestamp(start))
+	if end is not None:
+		query += ' AND recorded_at <= ?'
+		parameters.append(_format_timestamp(end))
+	return(query, parameters)
+
+
+def _history_frame(rows, columns):
+	df = pd.DataFrame(rows, columns=columns)
+	df['Recorded At'] = pd.to_datetime(df['Recorded At'], format='%Y-%m-%d %H:%M:%S.%f')
+	return(df)
@@ -0,0 +1,170 @@
+#Importing dependencies
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+
+#Default pacing for each scraped host
+DEFAULT_REQUESTS_PER_SECOND = {'celebritybucks.com':4,
+							   'www.astro-seek.com':4}
+DEFAULT_MAX_IN_FLIGHT = {'celebritybucks.com':4,
+						 'www.astro-seek.com':4}
+
+#Response status codes worth retrying
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class _TokenBucket:
+	"""
+	A token bucket refilled at a given rate, holding at most one second's worth of tokens.
+	"""
+	def __init__(self, rate):
+		self.max_rate = rate
+		self.rate = rate
+		self.tokens = max(rate, 1)
+		self.updated_at = time.monotonic()
+		self.lock = threading.Lock()
+
+	def take(self):
+		"""
+		Takes a token and returns the number of seconds to wait before using it.
+		"""
+		with self.lock:
+			now = time.monotonic()
+			self.tokens = min(max(self.rate, 1), self.tokens + (now - self.updated_at) * self.rate)
+			self.updated_at = now
+			self.tokens -= 1
+			if self.tokens >= 0:
+				return(0)
+			return(-self.tokens / self.rate)
+
+
+class HostRateLimiter:
+	"""
+	Paces requests separately for each host with a token bucket that enforces a number of requests per second, and bounds the number of requests in flight to each host. The rate of a host is halved whenever it signals throttling and recovers gradually as requests succeed.
+
+	Parameters
+	----------
+	  requests_per_second : float or dict, optional
+	    The sustained number of requests per second, either as a single value for every host or as a dictionary mapping host names to values. Defaults to `DEFAULT_REQUESTS_PER_SECOND`.
+
+	  max_in_flight : int or dict, optional
+	    The maximum number of concurrent requests, either as a single value for every host or as a dictionary mapping host names to values. Defaults to `DEFAULT_MAX_IN_FLIGHT`.
+
+	  min_requests_per_second : float, optional
+	    The lowest rate a host is slowed to when it signals throttling.
+
+	Examples
+	--------
+	>>> limiter = HostRateLimiter(requests_per_second={'celebritybucks.com': 2, 'www.astro-seek.com': 5})
+	>>> with limiter.limit('https://www.astro-seek.com/birth-chart/Gwen-Stefani-horoscope'):
+	...     response = session.get('https://www.astro-seek.com/birth-chart/Gwen-Stefani-horoscope')
+	"""
+	def __init__(self, requests_per_second=None, max_in_flight=None, min_requests_per_second=0.1):
+		self.requests_per_second = _per_host(DEFAULT_REQUESTS_PER_SECOND if requests_per_second is None else requests_per_second)
+		self.max_in_flight = _per_host(DEFAULT_MAX_IN_FLIGHT if max_in_flight is None else max_in_flight)
+		self.min_requests_per_second = min_requests_per_second
+
+		assert all(rate > 0 for rate in self.requests_per_second.values()), "Requests per second must be positive."
+		assert all(limit >= 1 for limit in self.max_in_flight.values()), "Maximum requests in flight must be at least 1."
+
+		self._buckets = {host:_TokenBucket(rate) for host, rate in self.requests_per_second.items()}
+		self._semaphores = {host:threading.BoundedSemaphore(limit) for host, limit in self.max_in_flight.items()}
+
+	def get_rate(self, host):
+		"""
+		Returns the current number of requests per second allowed for a given host, or None if the host is not paced.
+		"""
+		bucket = self._buckets.get(host)
+		return(None if bucket is None else bucket.rate)
+
+	@contextmanager
+	def limit(self, url):
+		"""
+		A context manager that waits until a request to a given URL is allowed and holds an in-flight slot for its host until exiting.
+		"""
+		host = urlsplit(url).hostname
+		semaphore = self._semaphores.get(host)
+		bucket = self._buckets.get(host)
+
+		if semaphore is not None:
+			semaphore.acquire()
+		try:
+			if bucket is not None:
+				delay = bucket.take()
+				if delay > 0:
+					time.sleep(delay)
+			yield
+		finally:
+			if semaphore is not None:
+				semaphore.release()
+
+	def throttle(self, url):
+		"""
+		Halves the request rate of a URL's host, down to the minimum rate, after the host signals throttling.
+		"""
+		bucket = self._buckets.get(urlsplit(url).hostname)
+		if bucket is not None:
+			with bucket.lock:
+				bucket.rate = max(self.min_requests_per_second, bucket.rate / 2)
+
+	def recover(self, url):
+		"""
+		Raises the request rate of a URL's host by a tenth of its configured rate, up to the configured rate, after a successful request.
+		"""
+		bucket = self._buckets.get(urlsplit(url).hostname)
+		if bucket is not None:
+			with bucket.lock:
+				bucket.rate = min(bucket.max_rate, bucket.rate + bucket.max_rate / 10)
+
+
+def get_retry_delay(attempt, response=None, backoff=1.0, max_backoff=60.0):
+	"""
+	Returns the number of seconds to wait before retrying a request, honouring a Retry-After header when the server sends one and otherwise using exponential backoff with full jitter.
+
+	Parameters
+	----------
+	  attempt : int
+	    The number of attempts made so far, starting at 1.
+
+	  response : requests.Response, optional
+	    The response to the failed attempt, if there was one.
+
+	  backoff : float, optional
+	    The base delay, in seconds, of the exponential backoff.
+
+	  max_backoff : float, optional
+	    The longest delay, in seconds, to wait.
+
+	Returns
+	-------
+	float
+	    The number of seconds to wait
+
+	Examples
+	--------
+	>>> get_retry_delay(3, backoff=1.0) <= 4.0
+	True
+	"""
+	if response is not None and 'Retry-After' in response.headers:
+		retry_after = response.headers['Retry-After'].strip()
+		try:
+			return(min(max_backoff, max(0.0, float(retry_after))))
+		except ValueError:
+			try:
+				retry_at = parsedate_to_datetime(retry_after)
+				return(min(max_backoff, max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())))
+			except (TypeError, ValueError):
+				pass
+
+	return(random.uniform(0, min(max_backoff, backoff * 2 ** (attempt - 1))))
+
+
+def _per_host(value):
+	if isinstance(value, dict):
+		return(dict(value))
+	return({host:value for host in DEFAULT_REQUESTS_PER_SECOND})
@@ -0,0 +1,257 @@
+#Importing dependencies
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from celebrity_bucks_game_player_advantage.lazy_import import LazyModule
+from celebrity_bucks_game_player_advantage.response_cache import build_response
+
+requests = LazyModule('requests')
+
+
+#Response headers that describe the transfer of the recorded body rather than the body itself
+_TRANSFER_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+def record_response(directory, url, response):
+	"""
+	Saves the status code, headers and body of a response to a given URL in a fixture directory, replacing any previous recording of the URL.
+
+	Parameters
+	----------
+	  directory : str
+	    The fixture directory.
+
+	  url : str
+	    The requested URL.
+
+	  response : requests.Response
+	    The response to save.
+
+	Examples
+	--------
+	>>> record_response('tests/fixtures', url, requests.get(url))
+	"""
+	os.makedirs(directory, exist_ok=True)
+	name = get_fixture_name(url)
+	headers = {header:value for header, value in response.headers.items() if header.lower() not in _TRANSFER_HEADERS}
+
+	with open(os.path.join(directory, name + '.body'), 'wb') as body_file:
+		body_file.write(response.content)
+	with open(os.path.join(directory, name + '.json'), 'w') as metadata_file:
+		json.dump({'url':url, 'status_code':response.status_code, 'headers':headers}, metadata_file, indent=1, sort_keys=True)
+
+
+def load_response(directory, url):
+	"""
+	Returns the response to a given URL saved in a fixture directory, or None if the URL was not recorded. Recordings are matched on host, path and query, so a response recorded over HTTPS is also returned for the same page requested through a local stub server.
+
+	Parameters
+	----------
+	  directory : str
+	    The fixture directory.
+
+	  url : str
+	    The requested URL.
+
+	Returns
+	-------
+	requests.Response
+	    The recorded response, or None
+
+	Examples
+	--------
+	>>> load_response('tests/fixtures', 'https://celebritybucks.com/developers/export/JSON').status_code
+	200
+	"""
+	name = get_fixture_name(url)
+	try:
+		with open(os.path.join(directory, name + '.json')) as metadata_file:
+			metadata = json.load(metadata_file)
+		with open(os.path.join(directory, name + '.body'), 'rb') as body_file:
+			content = body_file.read()
+	except FileNotFoundError:
+		return(None)
+
+	return(build_response(url, metadata['status_code'], metadata['headers'], content))
+
+
+def get_fixture_name(url):
+	"""
+	Returns the file name, without extension, under which the response to a given URL is recorded: a readable form of its host, path and query followed by a short hash of them.
+
+	Parameters
+	----------
+	  url : str
+	    The requested URL.
+
+	Returns
+	-------
+	str
+	    The fixture file name
+
+	Examples
+	--------
+	>>> get_fixture_name('https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope')
+	'www.astro-seek.com_birth-chart_Barack-Obama-horoscope_a1b2c3d4'
+	"""
+	key = _get_fixture_key(url)
+	readable = re.sub(r'[^A-Za-z0-9.-]+', '_', key).strip('_')[:100]
+	return(f"{readable}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:8]}")
+
+
+class RecordingSession:
+	"""
+	A session that sends every request through a wrapped requests.Session and records each response to a fixture directory, for later replay with `ReplaySession` or `StubServer`.
+
+	Parameters
+	----------
+	  directory : str
+	    The fixture directory.
+
+	  session : requests.Session, optional
+	    The session to send requests through. Defaults to a new session.
+
+	Examples
+	--------
+	>>> set_session(RecordingSession('tests/fixtures'))
+	>>> soup_as = get_astroseek_soup_object('Barack Obama')
+	"""
+	def __init__(self, directory, session=None):
+		self.directory = directory
+		self.session = requests.Session() if session is None else session
+
+	def get(self, url, timeout=None, headers=None):
+		response = self.session.get(url, timeout=timeout, headers=headers)
+		if response.status_code != 304:
+			record_response(self.directory, url, response)
+		return(response)
+
+
+class ReplaySession:
+	"""
+	A session that answers requests from the responses recorded in a fixture directory without touching the network. Requests for URLs that were not recorded are answered with an empty 404 response.
+
+	Parameters
+	----------
+	  directory : str
+	    The fixture directory.
+
+	Examples
+	--------
+	>>> set_session(ReplaySession('tests/fixtures'))
+	>>> api_object = get_celebritybucks_api_object()
+	"""
+	def __init__(self, directory):
+		self.directory = directory
+
+	def get(self, url, timeout=None, headers=None):
+		response = load_response(self.directory, url)
+		if response is None:
+			return(build_response(url, 404, {}, b''))
+		return(response)
+
+
+class StubServer:
+	"""
+	A local HTTP server that serves the responses recorded in a fixture directory, so that the whole collection pipeline, including its HTTP sessions, can run offline. Each scraped host is served under its own path prefix, given by `get_base_url`. URLs that were not recorded are answered with an empty 404 response.
+
+	Parameters
+	----------
+	  directory : str
+	    The fixture directory.
+
+	  address : str, optional
+	    The address to listen on.
+
+	  port : int, optional
+	    The port to listen on. Defaults to any free port.
+
+	Examples
+	--------
+	>>> with StubServer('tests/fixtures') as server:
+	...     set_base_url(CELEBRITYBUCKS_HOST, server.get_base_url(CELEBRITYBUCKS_HOST))
+	...     api_object = get_celebritybucks_api_object()
+	"""
+	def __init__(self, directory, address='127.0.0.1', port=0):
+		self.directory = directory
+		self._server = ThreadingHTTPServer((address, port), _make_stub_handler(directory))
+		self._server.daemon_threads = True
+		self._thread = None
+
+	def __enter__(self):
+		self.start()
+		return(self)
+
+	def __exit__(self, *exc_info):
+		self.stop()
+
+	@property
+	def url(self):
+		"""
+		The root URL of the server.
+		"""
+		address, port = self._server.server_address[0:2]
+		return(f'http://{address}:{port}')
+
+	def get_base_url(self, host):
+		"""
+		Returns the base URL under which the recorded pages of a given host are served.
+		"""
+		return(f'{self.url}/{host}')
+
+	def start(self):
+		"""
+		Starts serving in a background thread.
+		"""
+		if self._thread is None:
+			self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+			self._thread.start()
+
+	def stop(self):
+		"""
+		Stops serving and closes the listening socket.
+		"""
+		if self._thread is not None:
+			self._server.shutdown()
+			self._thread.join()
+			self._thread = None
+		self._server.server_close()
+
+
+def _get_fixture_key(url):
+	parts = urlsplit(url)
+	key = f'{parts.hostname}{parts.path}'
+	if parts.query:
+		key += f'?{parts.query}'
+	return(key)
+
+
+def _make_stub_handler(directory):
+	class StubHandler(BaseHTTPRequestHandler):
+		def do_GET(self):
+			#The first path segment names the host whose recording is served
+			host, _, path = self.path.lstrip('/').partition('/')
+			response = load_response(directory, f'https://{host}/{path}')
+
+			if response is None:
+				self.send_response(404)
+				self.send_header('Content-Length', '0')
+				self.end_headers()
+				return
+
+			self.send_response(response.status_code)
+			for header, value in response.headers.items():
+				self.send_header(header, value)
+			self.send_header('Content-Length', str(len(response.content)))
+			self.end_headers()
+			self.wfile.write(response.content)
+
+		def log_message(self, format, *args):
+			pass
+
+	return(StubHandler)
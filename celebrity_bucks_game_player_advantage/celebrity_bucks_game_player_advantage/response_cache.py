@@ -0,0 +1,214 @@
+#Importing dependencies
+import json
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+from celebrity_bucks_game_player_advantage.lazy_import import LazyModule
+
+requests = LazyModule('requests')
+
+
+#Default time-to-live in seconds for cached responses from each host
+DEFAULT_TTLS = {'celebritybucks.com':60*60,
+				'www.astro-seek.com':30*24*60*60}
+DEFAULT_TTL = 60*60
+
+
+class ResponseCache:
+	"""
+	A persistent, size-bounded cache of HTTP responses stored in a SQLite database. Responses expire after a time-to-live set per host, are revalidated with ETag and Last-Modified headers once expired, and are evicted least recently used first when the cache grows past its limits.
+
+	Parameters
+	----------
+	  path : str
+	    The path of the SQLite database file. Use ':memory:' for a cache that is not persisted.
+
+	  ttls : dict, optional
+	    A dictionary mapping host names to the number of seconds their responses stay fresh. Defaults to `DEFAULT_TTLS`.
+
+	  default_ttl : float, optional
+	    The number of seconds responses from hosts missing from `ttls` stay fresh.
+
+	  max_entries : int, optional
+	    The maximum number of responses to keep. Unbounded by default.
+
+	  max_bytes : int, optional
+	    The maximum total size of the cached response bodies, in bytes. Unbounded by default.
+
+	Examples
+	--------
+	>>> cache = ResponseCache('../data/response_cache.sqlite', max_bytes=500*1024*1024)
+	>>> set_response_cache(cache)
+	>>> soup_as = get_astroseek_soup_object('Gwen Stefani')
+	>>> len(cache)
+	1
+	"""
+	def __init__(self, path, ttls=None, default_ttl=DEFAULT_TTL, max_entries=None, max_bytes=None):
+		assert max_entries is None or max_entries >= 1, "Maximum number of entries must be at least 1."
+		assert max_bytes is None or max_bytes >= 1, "Maximum size must be at least 1 byte."
+
+		self.path = path
+		self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+		self.default_ttl = default_ttl
+		self.max_entries = max_entries
+		self.max_bytes = max_bytes
+
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(path, check_same_thread=False)
+		with self._connection:
+			self._connection.execute('''CREATE TABLE IF NOT EXISTS responses (
+										url TEXT PRIMARY KEY,
+										status_code INTEGER,
+										headers TEXT,
+										content BLOB,
+										size INTEGER,
+										fetched_at REAL,
+										accessed_at REAL)''')
+			self._connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+	def __len__(self):
+		with self._lock:
+			return(self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0])
+
+	def get_ttl(self, url):
+		"""
+		Returns the number of seconds a response for a given URL stays fresh.
+		"""
+		return(self.ttls.get(urlsplit(url).hostname, self.default_ttl))
+
+	def get(self, url):
+		"""
+		Returns a tuple of the cached requests.Response for a given URL and whether it is still fresh, or (None, False) if the URL is not cached.
+		"""
+		now = time.time()
+		with self._lock:
+			row = self._connection.execute('SELECT status_code, headers, content, fetched_at FROM responses WHERE url = ?', (url,)).fetchone()
+			if row is None:
+				return(None, False)
+			with self._connection:
+				self._connection.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (now, url))
+
+		status_code, headers, content, fetched_at = row
+		response = build_response(url, status_code, json.loads(headers), content)
+		return(response, now - fetched_at < self.get_ttl(url))
+
+	def store(self, url, response):
+		"""
+		Stores a successful requests.Response for a given URL, evicting the least recently used responses if the cache is over its limits.
+		"""
+		if response.status_code != 200:
+			return
+
+		now = time.time()
+		content = response.content
+		with self._lock:
+			with self._connection:
+				self._connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+										 (url, response.status_code, json.dumps(dict(response.headers)), content, len(content), now, now))
+				self._evict()
+
+	def refresh(self, url):
+		"""
+		Marks the cached response for a given URL as fresh again, after the server confirmed it has not changed.
+		"""
+		now = time.time()
+		with self._lock:
+			with self._connection:
+				self._connection.execute('UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?', (now, now, url))
+
+	def clear(self):
+		"""
+		Removes every cached response.
+		"""
+		with self._lock:
+			with self._connection:
+				self._connection.execute('DELETE FROM responses')
+
+	def close(self):
+		"""
+		Closes the underlying database connection.
+		"""
+		with self._lock:
+			self._connection.close()
+
+	def _evict(self):
+		if self.max_entries is not None:
+			self._connection.execute('''DELETE FROM responses WHERE url IN (
+										SELECT url FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)''', (self.max_entries,))
+
+		if self.max_bytes is not None:
+			total = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+			if total > self.max_bytes:
+				evicted = []
+				for url, size in self._connection.execute('SELECT url, size FROM responses ORDER BY accessed_at ASC').fetchall():
+					if total <= self.max_bytes:
+						break
+					evicted.append((url,))
+					total -= size
+				self._connection.executemany('DELETE FROM responses WHERE url = ?', evicted)
+
+
+def get_revalidation_headers(response):
+	"""
+	Returns the conditional request headers that ask a server whether a previously fetched response has changed.
+
+	Parameters
+	----------
+	  response : requests.Response
+	    A previously fetched response.
+
+	Returns
+	-------
+	dict
+	    A dictionary with If-None-Match and/or If-Modified-Since headers, empty if the response carries neither an ETag nor a Last-Modified header.
+
+	Examples
+	--------
+	>>> get_revalidation_headers(response)
+	{'If-None-Match': '"5f3c-1a2b"'}
+	"""
+	headers = {}
+	if 'ETag' in response.headers:
+		headers['If-None-Match'] = response.headers['ETag']
+	if 'Last-Modified' in response.headers:
+		headers['If-Modified-Since'] = response.headers['Last-Modified']
+	return(headers)
+
+
+def build_response(url, status_code, headers, content):
+	"""
+	Builds a requests.Response from a stored status code, headers and body, as returned by a server.
+
+	Parameters
+	----------
+	  url : str
+	    The requested URL.
+
+	  status_code : int
+	    The HTTP status code of the response.
+
+	  headers : dict
+	    The response headers.
+
+	  content : bytes
+	    The response body.
+
+	Returns
+	-------
+	requests.Response
+	    The rebuilt response
+
+	Examples
+	--------
+	>>> build_response('https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope', 404, {}, b'').status_code
+	404
+	"""
+	response = requests.Response()
+	response.url = url
+	response.status_code = status_code
+	response.headers = requests.structures.CaseInsensitiveDict(headers)
+	response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+	response._content = content
+	return(response)
@@ -0,0 +1,172 @@
+#Importing dependencies
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+
+#Resolution statuses of the names in a slug index
+CONFIRMED = 'confirmed'
+MISS = 'miss'
+OVERRIDE = 'override'
+
+
+class SlugIndex:
+	"""
+	A persistent index of how celebrity names resolve to Astro Seek birth chart slugs, stored in a SQLite database. It records slugs confirmed by a collection run, names whose birth chart could not be found and manual overrides for names the default slug rules get wrong. Names are matched after normalisation, so 'Samuel L Jackson' and 'samuel l. jackson' share an entry, and further aliases can point at the entry of another name. Known misses are skipped on later runs without any request.
+
+	Parameters
+	----------
+	  path : str
+	    The path of the SQLite database file. Use ':memory:' for an index that is not persisted.
+
+	  miss_ttl : float, optional
+	    The number of seconds after which a known miss is retried. Misses are never retried by default.
+
+	Examples
+	--------
+	>>> index = SlugIndex('../data/slug_index.sqlite')
+	>>> index.set_override('Prince', 'Prince-Rogers-Nelson')
+	>>> set_slug_index(index)
+	>>> get_astroseek_url('Prince')
+	'https://www.astro-seek.com/birth-chart/Prince-Rogers-Nelson-horoscope'
+	"""
+	def __init__(self, path, miss_ttl=None):
+		assert miss_ttl is None or miss_ttl >= 0, "Miss time-to-live must be non-negative."
+
+		self.path = path
+		self.miss_ttl = miss_ttl
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(path, check_same_thread=False)
+		with self._connection:
+			self._connection.execute('''CREATE TABLE IF NOT EXISTS slugs (
+										name_key TEXT PRIMARY KEY,
+										celebrity TEXT,
+										slug TEXT,
+										status TEXT,
+										checked_at REAL)''')
+			self._connection.execute('''CREATE TABLE IF NOT EXISTS aliases (
+										alias_key TEXT PRIMARY KEY,
+										name_key TEXT)''')
+
+	def __len__(self):
+		with self._lock:
+			return(self._connection.execute('SELECT COUNT(*) FROM slugs').fetchone()[0])
+
+	def get(self, celebrity):
+		"""
+		Returns a dictionary with the slug, status and check time recorded for a celebrity name or one of its aliases, or None if the name has not been resolved. The slug of a miss is None.
+		"""
+		with self._lock:
+			row = self._connection.execute('SELECT slug, status, checked_at FROM slugs WHERE name_key = ?', (self._get_key(celebrity),)).fetchone()
+		if row is None:
+			return(None)
+		return({'slug':row[0], 'status':row[1], 'checked_at':row[2]})
+
+	def get_slug(self, celebrity):
+		"""
+		Returns the confirmed or overridden slug of a celebrity name, or None if there is none.
+		"""
+		entry = self.get(celebrity)
+		if entry is None or entry['status'] == MISS:
+			return(None)
+		return(entry['slug'])
+
+	def is_miss(self, celebrity):
+		"""
+		Returns whether a celebrity name is a known miss that has not yet expired.
+		"""
+		entry = self.get(celebrity)
+		if entry is None or entry['status'] != MISS:
+			return(False)
+		return(self.miss_ttl is None or time.time() - entry['checked_at'] < self.miss_ttl)
+
+	def record_hit(self, celebrity, slug):
+		"""
+		Records the slug under which a celebrity's birth chart was found, leaving manual overrides unchanged.
+		"""
+		self._record(celebrity, slug, CONFIRMED)
+
+	def record_miss(self, celebrity):
+		"""
+		Records that no birth chart was found for a celebrity, leaving manual overrides unchanged.
+		"""
+		self._record(celebrity, None, MISS)
+
+	def set_override(self, celebrity, slug):
+		"""
+		Sets the slug of a celebrity name by hand, replacing any confirmed slug or miss. Overrides are never replaced by collection runs.
+		"""
+		with self._lock:
+			with self._connection:
+				self._connection.execute('INSERT OR REPLACE INTO slugs VALUES (?, ?, ?, ?, ?)', (self._get_key(celebrity), celebrity, slug, OVERRIDE, time.time()))
+
+	def add_alias(self, alias, celebrity):
+		"""
+		Makes another name, such as a stage name or a former name, resolve to the entry of a celebrity name.
+		"""
+		alias_key = normalise_name(alias)
+		with self._lock:
+			key = self._get_key(celebrity)
+			assert alias_key != key, "An alias must differ from the name it points at."
+			with self._connection:
+				self._connection.execute('INSERT OR REPLACE INTO aliases VALUES (?, ?)', (alias_key, key))
+
+	def forget(self, celebrity):
+		"""
+		Removes the entry of a celebrity name, so that it is resolved again on the next run.
+		"""
+		with self._lock:
+			with self._connection:
+				self._connection.execute('DELETE FROM slugs WHERE name_key = ?', (self._get_key(celebrity),))
+
+	def close(self):
+		"""
+		Closes the underlying database connection.
+		"""
+		with self._lock:
+			self._connection.close()
+
+	def _get_key(self, celebrity):
+		key = normalise_name(celebrity)
+		row = self._connection.execute('SELECT name_key FROM aliases WHERE alias_key = ?', (key,)).fetchone()
+		return(key if row is None else row[0])
+
+	def _record(self, celebrity, slug, status):
+		with self._lock:
+			key = self._get_key(celebrity)
+			with self._connection:
+				self._connection.execute('''INSERT INTO slugs VALUES (?, ?, ?, ?, ?)
+											ON CONFLICT (name_key) DO UPDATE SET celebrity = excluded.celebrity, slug = excluded.slug, status = excluded.status, checked_at = excluded.checked_at
+											WHERE slugs.status != ?''', (key, celebrity, slug, status, time.time(), OVERRIDE))
+
+
+def normalise_name(celebrity):
+	"""
+	Returns the form of a celebrity name under which it is stored in a SlugIndex: accents removed, lower case, with punctuation dropped and whitespace collapsed.
+
+	Parameters
+	----------
+	  celebrity : str
+	    A celebrity's name.
+
+	Returns
+	-------
+	str
+	    The normalised name
+
+	Examples
+	--------
+	>>> normalise_name("  Beyoncé  Knowles-Carter ")
+	'beyonce knowles carter'
+	>>> normalise_name('Samuel L. Jackson')
+	'samuel l jackson'
+	"""
+	assert type(celebrity) == str, "Input value must be of type string."
+
+	name = unicodedata.normalize('NFKD', celebrity)
+	name = ''.join(character for character in name if not unicodedata.combining(character))
+	name = name.replace('.', '').replace("'", '').replace('’', '')
+	name = re.sub(r'[^0-9a-z]+', ' ', name.casefold())
+	return(name.strip())
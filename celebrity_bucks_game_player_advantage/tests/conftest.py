@@ -0,0 +1,15 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import replay
+import os
+import pytest
+
+
+#Initializing parameter values for unit tests
+fixtures_dir = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+#Serving recorded responses from a local stub server for the whole session. The fixtures are hand-built pages holding the elements read by the extractors.
+@pytest.fixture(scope='session')
+def stub_server():
+	with replay.StubServer(fixtures_dir) as server:
+		yield server
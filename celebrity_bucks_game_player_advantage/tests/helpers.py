@@ -0,0 +1,32 @@
+#Importing dependencies
+import requests
+
+
+#Helpers shared by the unit tests
+def make_response(status_code=200, content=b'<html></html>', headers=None, url='https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope'):
+	response = requests.Response()
+	response.url = url
+	response.status_code = status_code
+	response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+	response._content = content
+	return(response)
+
+
+class FakeSession:
+	"""
+	Answers requests with the given responses in order, raising those that are exceptions, and keeps the headers of every request.
+	"""
+	def __init__(self, responses):
+		self.responses = list(responses)
+		self.requests = []
+
+	@property
+	def calls(self):
+		return(len(self.requests))
+
+	def get(self, url, timeout=None, headers=None):
+		self.requests.append(headers or {})
+		response = self.responses.pop(0)
+		if isinstance(response, Exception):
+			raise response
+		return(response)
@@ -0,0 +1,87 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import archive
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import replay
+from celebrity_bucks_game_player_advantage import response_cache
+import os
+import pytest
+
+
+#Initializing parameter values for unit tests
+fixtures_dir = os.path.join(os.path.dirname(__file__), 'fixtures')
+url = 'https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope'
+
+
+@pytest.fixture
+def page_archive(tmp_path):
+	page_archive = archive.PageArchive(str(tmp_path))
+	create_celebrity_data_set.set_archive(page_archive, crawl_id='crawl')
+	yield page_archive
+	create_celebrity_data_set.set_archive(None)
+
+
+#Unit tests
+def test_page_archive_store_and_load(tmp_path):
+	page_archive = archive.PageArchive(str(tmp_path), compression='gzip')
+	digest = page_archive.store(b'birth chart')
+	assert page_archive.load(digest) == b'birth chart'
+	assert page_archive.load('0' * 64) is None
+
+def test_page_archive_deduplicates(tmp_path):
+	page_archive = archive.PageArchive(str(tmp_path), compression='gzip')
+	assert page_archive.store(b'birth chart') == page_archive.store(b'birth chart')
+	assert sum(len(files) for root, dirs, files in os.walk(str(tmp_path / 'objects'))) == 1
+
+def test_page_archive_zstd(tmp_path):
+	pytest.importorskip('zstandard')
+	page_archive = archive.PageArchive(str(tmp_path), compression='zstd')
+	assert page_archive.load(page_archive.store(b'birth chart')) == b'birth chart'
+
+def test_page_archive_unknown_compression(tmp_path):
+	with pytest.raises(AssertionError):
+		archive.PageArchive(str(tmp_path), compression='bz2')
+
+def test_fetch_url_archives_crawl(page_archive):
+	create_celebrity_data_set.fetch_url(url, session=replay.ReplaySession(fixtures_dir))
+	assert page_archive.get_crawls() == ['crawl']
+	assert page_archive.get_response('crawl', url).content == replay.load_response(fixtures_dir, url).content
+
+def test_archive_replay_session_unarchived_url(page_archive):
+	create_celebrity_data_set.fetch_url(url, session=replay.ReplaySession(fixtures_dir))
+	assert archive.ArchiveReplaySession(page_archive, 'crawl').get(url + '?page=2').status_code == 404
+
+def test_reextract_crawl(page_archive):
+	session = replay.ReplaySession(fixtures_dir)
+	api_object = create_celebrity_data_set.get_celebritybucks_api_object(session)
+	df = create_celebrity_data_set.collect_celeb_data(api_object, ['Barack Obama'], session=session, progress=False)
+	df_backfill = create_celebrity_data_set.reextract_crawl(page_archive, celebrities=['Barack Obama'], progress=False)
+	assert df_backfill.drop(columns='Last Update').equals(df.drop(columns='Last Update'))
+
+def test_reextract_crawl_bypasses_cache_and_archive(page_archive):
+	session = replay.ReplaySession(fixtures_dir)
+	api_object = create_celebrity_data_set.get_celebritybucks_api_object(session)
+	create_celebrity_data_set.collect_celeb_data(api_object, ['Barack Obama'], session=session, progress=False)
+	manifest_path = os.path.join(page_archive.path, 'crawls', 'crawl.jsonl')
+	with open(manifest_path) as manifest_file:
+		entries = len(manifest_file.readlines())
+
+	cache = response_cache.ResponseCache(':memory:')
+	cache.store(url, response_cache.build_response(url, 200, {}, b'<html></html>'))
+	create_celebrity_data_set.set_response_cache(cache)
+	try:
+		df_backfill = create_celebrity_data_set.reextract_crawl(page_archive, 'crawl', celebrities=['Barack Obama'], progress=False)
+	finally:
+		create_celebrity_data_set.set_response_cache(None)
+	assert df_backfill.loc[0, 'Gender'] == 'Male'
+	with open(manifest_path) as manifest_file:
+		assert len(manifest_file.readlines()) == entries
+
+	create_celebrity_data_set.fetch_url(url, session=session)
+	with open(manifest_path) as manifest_file:
+		assert len(manifest_file.readlines()) == entries + 1
+
+def test_fetch_url_archives_cached_responses(page_archive):
+	cache = response_cache.ResponseCache(':memory:')
+	cache.store(url, replay.load_response(fixtures_dir, url))
+	create_celebrity_data_set.fetch_url(url, session=replay.ReplaySession(str(page_archive.path)), cache=cache)
+	assert page_archive.get_response('crawl', url).content == replay.load_response(fixtures_dir, url).content
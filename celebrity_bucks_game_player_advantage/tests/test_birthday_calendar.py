@@ -0,0 +1,53 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import birthday_calendar
+import pandas as pd
+from datetime import date
+from datetime import datetime
+
+
+#Initializing parameter values for unit tests
+birth_dates = {'Barack Obama':date(1961, 8, 4),
+			   'Taylor Swift':date(1989, 12, 13),
+			   'Kim Kardashian':date(1980, 10, 21),
+			   'Leap Day':date(1996, 2, 29),
+			   'Unknown':'NaN'}
+
+
+#Unit tests
+def test_birthday_calendar_skips_missing_birth_dates():
+	birthdays = birthday_calendar.BirthdayCalendar(birth_dates)
+	assert len(birthdays) == 4
+	assert birthdays.get_birth_date('Unknown') is None
+
+def test_get_upcoming_birthdays_window():
+	birthdays = birthday_calendar.BirthdayCalendar(birth_dates)
+	assert birthdays.get_upcoming_birthdays(7, today=date(2020, 8, 1)) == [('Barack Obama', 3)]
+	assert birthdays.get_upcoming_birthdays(2, today=date(2020, 8, 1)) == []
+
+def test_get_upcoming_birthdays_wraps_year():
+	birthdays = birthday_calendar.BirthdayCalendar(birth_dates)
+	assert birthdays.get_upcoming_birthdays(59, today=date(2020, 12, 30)) == []
+	assert birthdays.get_upcoming_birthdays(60, today=date(2020, 12, 30)) == [('Leap Day', 60)]
+	assert [celebrity for celebrity, days in birthdays.get_upcoming_birthdays(365, today=date(2020, 12, 30))] == ['Leap Day', 'Barack Obama', 'Kim Kardashian', 'Taylor Swift']
+
+def test_get_upcoming_birthdays_leap_day():
+	birthdays = birthday_calendar.BirthdayCalendar(birth_dates)
+	assert birthdays.get_upcoming_birthdays(0, today=date(2021, 2, 28)) == [('Leap Day', 0)]
+	assert birthdays.get_upcoming_birthdays(1, today=date(2020, 2, 28)) == [('Leap Day', 1)]
+
+def test_get_upcoming_birthdays_each_birthday_once():
+	birthdays = birthday_calendar.BirthdayCalendar(birth_dates)
+	for today in [date(2020, 2, 29), date(2021, 3, 1), date(2023, 3, 1)]:
+		upcoming = [celebrity for celebrity, days in birthdays.get_upcoming_birthdays(1000, today=today)]
+		assert sorted(upcoming) == sorted(birthdays._birth_dates)
+
+def test_birthday_calendar_from_frame():
+	df = pd.DataFrame({'Celebrity':['Barack Obama', 'Unknown'], 'Birth Date':[datetime(1961, 8, 4), 'NaN']})
+	birthdays = birthday_calendar.BirthdayCalendar.from_frame(df)
+	assert birthdays.get_birthdays_on(date(2021, 8, 4)) == ['Barack Obama']
+
+def test_birthday_calendar_add_replaces():
+	birthdays = birthday_calendar.BirthdayCalendar(birth_dates)
+	birthdays.add('Barack Obama', date(1961, 8, 5))
+	assert birthdays.get_birthdays_on(date(2021, 8, 4)) == []
+	assert birthdays.get_birthdays_on(date(2021, 8, 5)) == ['Barack Obama']
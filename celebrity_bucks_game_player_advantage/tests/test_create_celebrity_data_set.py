@@ -1,10 +1,13 @@
 #Importing dependencies
 from celebrity_bucks_game_player_advantage import __version__
+from celebrity_bucks_game_player_advantage import birthday_calendar
 from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import response_cache
+from tests.helpers import FakeSession, make_response
 import pytest
+import asyncio
 import bs4
 import json
-import os
 import pandas as pd
 import requests
 import sys
@@ -14,9 +17,31 @@ from datetime import date
 
 #Initializing parameter values for unit tests
 celebrity = 'Barack Obama'
-api_object = create_celebrity_data_set.get_celebritybucks_api_object()
-soup_cb = create_celebrity_data_set.get_celebritybucks_soup_object(api_object, celebrity)
-soup_as = create_celebrity_data_set.get_astroseek_soup_object(celebrity)
+
+
+#Answering every request from the stub server, which serves the recorded responses so the tests run offline
+@pytest.fixture(scope='module', autouse=True)
+def stub_base_urls(stub_server):
+	for host in create_celebrity_data_set.DEFAULT_BASE_URLS:
+		create_celebrity_data_set.set_base_url(host, stub_server.get_base_url(host))
+	yield
+	for host in create_celebrity_data_set.DEFAULT_BASE_URLS:
+		create_celebrity_data_set.set_base_url(host)
+
+
+@pytest.fixture(scope='module')
+def api_object(stub_base_urls):
+	return(create_celebrity_data_set.get_celebritybucks_api_object())
+
+
+@pytest.fixture(scope='module')
+def soup_cb(api_object):
+	return(create_celebrity_data_set.get_celebritybucks_soup_object(api_object, celebrity))
+
+
+@pytest.fixture(scope='module')
+def soup_as(stub_base_urls):
+	return(create_celebrity_data_set.get_astroseek_soup_object(celebrity))
 
 
 #Unit tests
@@ -27,11 +52,19 @@ def test_get_celebritybucks_api_object_type_dict():
 	api_object = create_celebrity_data_set.get_celebritybucks_api_object()
 	assert type(api_object) == dict
 
-def test_get_celebrity_list_type_list():
+def test_get_celebritybucks_api_object_unsuccessful():
+	class NotFoundSession:
+		def get(self, url, timeout=None, headers=None):
+			return(response_cache.build_response(url, 404, {}, b''))
+
+	with pytest.raises(requests.exceptions.HTTPError):
+		create_celebrity_data_set.get_celebritybucks_api_object(NotFoundSession())
+
+def test_get_celebrity_list_type_list(api_object):
 	celebrities = create_celebrity_data_set.get_celebrity_list(api_object)
 	assert type(celebrities) == list 
 
-def test_get_celebritybucks_soup_object_type_bs4():
+def test_get_celebritybucks_soup_object_type_bs4(api_object):
 	soup_cb = create_celebrity_data_set.get_celebritybucks_soup_object(api_object, celebrity)
 	assert type(soup_cb) == bs4.BeautifulSoup
 
@@ -56,6 +89,9 @@ def test_get_astroseek_soup_object_string_conversion_period():
 	celeb_name = '-'.join(celeb_name_split)
 	assert celeb_name == "Samuel-L-Jackson"
 
+def test_get_astroseek_url():
+	assert create_celebrity_data_set.get_astroseek_url("Conan O'Brien").endswith('/birth-chart/Conan-O-Brien-horoscope')
+
 def test_create_celeb_df_type_pandas():
 	df = create_celebrity_data_set.create_celeb_df()
 	assert type(df) == pd.core.frame.DataFrame
@@ -64,23 +100,23 @@ def test_create_celeb_df_number_of_columns():
 	df = create_celebrity_data_set.create_celeb_df()
 	assert len(df.columns) == 15
 
-def test_get_celebritybucks_ranking_wrong_input_type_int():
+def test_get_celebritybucks_ranking_wrong_input_type_int(api_object):
 	with pytest.raises(AssertionError):
 		create_celebrity_data_set.get_celebritybucks_ranking(api_object, celebrity=24)
 
-def test_get_celebritybucks_price_no_celeb_found():
+def test_get_celebritybucks_price_no_celeb_found(api_object):
 	actual = create_celebrity_data_set.get_celebritybucks_price(api_object, celebrity='Not a celebrity')
 	expected = 'Not a celebrity not found within CelebrityBucks data set.'
 	assert actual == expected
 
-def test_get_celebritybucks_ID_wrong_input_type_list():
+def test_get_celebritybucks_ID_wrong_input_type_list(api_object):
 	with pytest.raises(AssertionError):
 		create_celebrity_data_set.get_celebritybucks_ID(api_object, celebrity=['Taylor Swift','Donald Trump'])
 
-def test_get_gender():
+def test_get_gender(soup_as):
 	assert create_celebrity_data_set.get_gender(soup_as) == 'Male'
 
-def test_get_age_type_int():
+def test_get_age_type_int(soup_as):
 	assert type(create_celebrity_data_set.get_age(soup_as)) == int 
 
 def test_get_year_minimum_value():
@@ -107,26 +143,370 @@ def test_upcoming_birthday_today():
 	delta = other_date - current_date
 	assert delta.days == 0
 
-def test_us_nationality():
+def test_us_nationality(soup_as):
 	assert create_celebrity_data_set.us_nationality(soup_as) == 'U.S. national'
 
-def test_living_status():
+def test_living_status(soup_as):
 	assert create_celebrity_data_set.living_status(soup_as) == 'Alive'
 
-def test_get_avg_21_day_price_type_int():
+def test_get_avg_21_day_price_type_int(soup_cb):
 	assert type(create_celebrity_data_set.get_avg_21_day_price(soup_cb)) == int
 
-def test_get_all_time_high_price_type_int():
+def test_get_all_time_high_price_type_int(soup_cb):
 	assert type(create_celebrity_data_set.get_all_time_high_price(soup_cb)) == int
 
-def test_get_days_since_ath_non_negative():
+def test_get_days_since_ath_non_negative(soup_cb):
 	assert create_celebrity_data_set.get_days_since_ath(soup_cb) >= 0
 
-def test_get_cb_rec_result():
+def test_get_cb_rec_result(soup_cb):
 	assert create_celebrity_data_set.get_cb_rec(soup_cb) in ['Hold','Buy','Sell']
 
-def test_get_celeb_data_df_shape():
+def test_get_celeb_data_df_shape(api_object, soup_cb, soup_as):
 	df = create_celebrity_data_set.get_celeb_data(api_object, soup_cb, soup_as, celebrity)
 	actual = df.shape
 	expected = (1,15)
-	assert actual == expected
\ No newline at end of file
+	assert actual == expected
+
+def test_get_celeb_record_keys_match_columns(api_object):
+	record = create_celebrity_data_set.get_celeb_record(api_object, celebrity)
+	assert list(record.keys()) == list(create_celebrity_data_set.create_celeb_df().columns) + create_celebrity_data_set.DERIVED_SOURCE_COLUMNS
+
+def test_collect_celeb_data_df_shape(api_object):
+	df = create_celebrity_data_set.collect_celeb_data(api_object, [celebrity, 'Not a celebrity'], workers_per_host=1, progress=False)
+	assert df.shape == (1,15)
+
+def test_collect_celeb_data_zero_workers(api_object):
+	with pytest.raises(AssertionError):
+		create_celebrity_data_set.collect_celeb_data(api_object, [celebrity], workers_per_host=0)
+
+def test_create_session_pool_sizes():
+	session = create_celebrity_data_set.create_session(pool_maxsize={'celebritybucks.com':8, 'www.astro-seek.com':4})
+	assert session.get_adapter('https://celebritybucks.com/developers/export/JSON')._pool_maxsize == 8
+	assert session.get_adapter('https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope')._pool_maxsize == 4
+
+def test_create_session_zero_pool_size():
+	with pytest.raises(AssertionError):
+		create_celebrity_data_set.create_session(pool_maxsize=0)
+
+def test_get_session_shared():
+	assert create_celebrity_data_set.get_session() is create_celebrity_data_set.get_session()
+
+def test_celebrity_index_matches_linear_lookups(api_object):
+	index = create_celebrity_data_set.CelebrityIndex(api_object)
+	assert create_celebrity_data_set.get_celebritybucks_ranking(index, celebrity) == create_celebrity_data_set.get_celebritybucks_ranking(api_object, celebrity)
+	assert create_celebrity_data_set.get_celebritybucks_price(index, celebrity) == create_celebrity_data_set.get_celebritybucks_price(api_object, celebrity)
+	assert create_celebrity_data_set.get_celebritybucks_ID(index, celebrity) == create_celebrity_data_set.get_celebritybucks_ID(api_object, celebrity)
+
+def test_celebrity_index_no_celeb_found(api_object):
+	index = create_celebrity_data_set.CelebrityIndex(api_object)
+	assert index.lookup('Not a celebrity') is None
+	assert create_celebrity_data_set.get_celebritybucks_ranking(index, celebrity='Not a celebrity') == 'Not a celebrity not found within CelebrityBucks data set.'
+
+def test_celebrity_index_keeps_first_duplicate():
+	index = create_celebrity_data_set.CelebrityIndex({'CelebrityValues':[{'name':'A', 'price':2, 'celebId':'1'}, {'name':'A', 'price':1, 'celebId':'2'}]})
+	assert index.lookup('A') == {'rank':1, 'price':2, 'celebId':'1'}
+
+def test_celebrity_index_celebrity_list(api_object):
+	index = create_celebrity_data_set.CelebrityIndex(api_object)
+	assert create_celebrity_data_set.get_celebrity_list(index) == create_celebrity_data_set.get_celebrity_list(api_object)
+
+def test_celebrity_index_to_frame_cached(api_object):
+	index = create_celebrity_data_set.CelebrityIndex(api_object)
+	assert index.to_frame() is index.to_frame()
+	assert index.to_frame().loc[celebrity, 'Current Price'] == create_celebrity_data_set.get_celebritybucks_price(api_object, celebrity)
+
+def test_lookup_celebrities_matches_linear_lookups(api_object):
+	names = [value['name'] for value in api_object['CelebrityValues']]
+	df = create_celebrity_data_set.lookup_celebrities(api_object, names)
+	assert df['Current Ranking'].tolist() == [create_celebrity_data_set.get_celebritybucks_ranking(api_object, name) for name in names]
+	assert df['Current Price'].tolist() == [create_celebrity_data_set.get_celebritybucks_price(api_object, name) for name in names]
+	assert df['celebId'].tolist() == [create_celebrity_data_set.get_celebritybucks_ID(api_object, name) for name in names]
+
+def test_lookup_celebrities_unknown_names(api_object):
+	df = create_celebrity_data_set.lookup_celebrities(create_celebrity_data_set.CelebrityIndex(api_object), ['Not a celebrity', celebrity])
+	assert df['Celebrity'].tolist() == ['Not a celebrity', celebrity]
+	assert df.loc[0, ['Current Ranking', 'Current Price', 'celebId']].isna().all()
+	assert {column:str(dtype) for column, dtype in df.dtypes.items()} == {'Celebrity':'string', 'Current Ranking':'Int32', 'Current Price':'Int32', 'celebId':'string'}
+
+def test_lookup_celebrities_keeps_first_duplicate():
+	api = {'CelebrityValues':[{'name':'A', 'price':1, 'celebId':'1'}, {'name':'A', 'price':2, 'celebId':'2'}]}
+	assert create_celebrity_data_set.lookup_celebrities(api, ['A'])['celebId'].tolist() == ['1']
+
+def test_celeb_record_buffer_column_order():
+	buffer = create_celebrity_data_set.CelebRecordBuffer()
+	buffer.append({'Last Update':datetime.now(), 'Celebrity':celebrity})
+	assert list(buffer.to_frame().columns) == list(create_celebrity_data_set.create_celeb_df().columns)
+
+def test_celeb_record_buffer_chunks():
+	buffer = create_celebrity_data_set.CelebRecordBuffer(chunk_size=2)
+	for num in range(5):
+		buffer.append({'Celebrity':str(num), 'Current Price':num})
+	df = buffer.to_frame()
+	assert len(buffer) == 5
+	assert list(df.index) == [0, 1, 2, 3, 4]
+	assert df['Current Price'].tolist() == [0, 1, 2, 3, 4]
+
+def test_celeb_record_buffer_empty():
+	assert create_celebrity_data_set.CelebRecordBuffer().to_frame().shape == (0,15)
+
+def test_get_astroseek_attributes_matches_extractors(soup_as):
+	attributes = create_celebrity_data_set.get_astroseek_attributes(soup_as)
+	assert attributes == {'Gender':create_celebrity_data_set.get_gender(soup_as),
+						  'Age':create_celebrity_data_set.get_age(soup_as),
+						  'Upcoming Birthday':create_celebrity_data_set.upcoming_birthday(soup_as),
+						  'U.S. Nationality':create_celebrity_data_set.us_nationality(soup_as),
+						  'Living Status':create_celebrity_data_set.living_status(soup_as),
+						  'Birth Date':create_celebrity_data_set.get_birth_date(soup_as)}
+
+def test_get_astroseek_attributes_empty_page():
+	attributes = create_celebrity_data_set.get_astroseek_attributes(bs4.BeautifulSoup('', 'html.parser'))
+	assert set(attributes.values()) == {'NaN'}
+
+def test_get_celebritybucks_attributes_matches_extractors(soup_cb):
+	attributes = create_celebrity_data_set.get_celebritybucks_attributes(soup_cb)
+	assert attributes['Avg. 21-Day Price'] == create_celebrity_data_set.get_avg_21_day_price(soup_cb)
+	assert attributes['All-Time High Price'] == create_celebrity_data_set.get_all_time_high_price(soup_cb)
+	assert attributes['Days Since All-Time High Price'] == create_celebrity_data_set.get_days_since_ath(soup_cb)
+	assert attributes['Celebrity Bucks Recommendation'] == create_celebrity_data_set.get_cb_rec(soup_cb)
+	assert type(attributes['All-Time High Date']) == date
+
+def test_get_celebritybucks_attributes_empty_page():
+	attributes = create_celebrity_data_set.get_celebritybucks_attributes(bs4.BeautifulSoup('', 'html.parser'))
+	assert set(attributes.values()) == {'NaN'}
+
+def test_parse_page_parse_only_astroseek(soup_as):
+	soup_as_partial = create_celebrity_data_set.parse_page(str(soup_as), create_celebrity_data_set.ASTROSEEK_HOST, parse_only=True)
+	assert create_celebrity_data_set.get_astroseek_attributes(soup_as_partial) == create_celebrity_data_set.get_astroseek_attributes(soup_as)
+
+def test_parse_page_parse_only_celebritybucks(soup_cb):
+	soup_cb_partial = create_celebrity_data_set.parse_page(str(soup_cb), create_celebrity_data_set.CELEBRITYBUCKS_HOST, parse_only=True)
+	assert create_celebrity_data_set.get_celebritybucks_attributes(soup_cb_partial) == create_celebrity_data_set.get_celebritybucks_attributes(soup_cb)
+
+def test_parse_page_parse_only_smaller_tree(soup_cb, soup_as):
+	for soup, host in [(soup_as, create_celebrity_data_set.ASTROSEEK_HOST), (soup_cb, create_celebrity_data_set.CELEBRITYBUCKS_HOST)]:
+		soup_partial = create_celebrity_data_set.parse_page(str(soup), host, parse_only=True)
+		assert 0 < len(soup_partial.find_all(True)) < len(soup.find_all(True))
+
+def test_get_parse_only_unknown_host():
+	with pytest.raises(ValueError):
+		create_celebrity_data_set.get_parse_only('example.com')
+
+def test_find_latest_snapshot(tmp_path):
+	for file_name in ['celebrity_data_attributes_2020-12-9_19_46_49.csv', 'celebrity_data_attributes_2020-12-11_8_0_0.csv', 'notes.csv']:
+		(tmp_path / file_name).write_text('')
+	assert create_celebrity_data_set.find_latest_snapshot(str(tmp_path)).endswith('celebrity_data_attributes_2020-12-11_8_0_0.csv')
+
+def test_find_latest_snapshot_none(tmp_path):
+	assert create_celebrity_data_set.find_latest_snapshot(str(tmp_path)) is None
+
+def test_get_changed_celebrities():
+	api = {'CelebrityValues':[{'name':'A', 'price':10, 'celebId':'1'}, {'name':'B', 'price':5, 'celebId':'2'}, {'name':'C', 'price':1, 'celebId':'3'}]}
+	df_previous = pd.DataFrame({'Celebrity':['A', 'B'], 'Current Ranking':[1, 2], 'Current Price':[10, 6]})
+	assert create_celebrity_data_set.get_changed_celebrities(df_previous, api) == ['B', 'C']
+
+def test_get_snapshot_id_changes_with_price():
+	api = {'CelebrityValues':[{'name':'A', 'price':10, 'celebId':'1'}]}
+	api_moved = {'CelebrityValues':[{'name':'A', 'price':11, 'celebId':'1'}]}
+	assert create_celebrity_data_set.get_snapshot_id(api) == create_celebrity_data_set.get_snapshot_id(create_celebrity_data_set.CelebrityIndex(api))
+	assert create_celebrity_data_set.get_snapshot_id(api) != create_celebrity_data_set.get_snapshot_id(api_moved)
+
+def test_checkpoint_resume_same_snapshot(tmp_path):
+	api = {'CelebrityValues':[{'name':'A', 'price':10, 'celebId':'1'}]}
+	create_celebrity_data_set.start_checkpoint(str(tmp_path), api)
+	create_celebrity_data_set.append_to_checkpoint(str(tmp_path), [{'Celebrity':'A', 'Current Price':10, 'Last Update':datetime.now()}])
+	checkpointed = create_celebrity_data_set.start_checkpoint(str(tmp_path), api, resume=True)
+	assert list(checkpointed.keys()) == ['A']
+	assert create_celebrity_data_set.load_checkpoint(str(tmp_path))[0] == api
+
+def test_checkpoint_restarts_on_new_snapshot(tmp_path):
+	api = {'CelebrityValues':[{'name':'A', 'price':10, 'celebId':'1'}]}
+	create_celebrity_data_set.start_checkpoint(str(tmp_path), api)
+	create_celebrity_data_set.append_to_checkpoint(str(tmp_path), [{'Celebrity':'A', 'Current Price':10, 'Last Update':datetime.now()}])
+	api_moved = {'CelebrityValues':[{'name':'A', 'price':11, 'celebId':'1'}]}
+	assert create_celebrity_data_set.start_checkpoint(str(tmp_path), api_moved, resume=True) == {}
+	assert len(create_celebrity_data_set.load_checkpoint(str(tmp_path))[1]) == 0
+
+def test_iter_celebrity_records_yields_records(api_object):
+	records = list(create_celebrity_data_set.iter_celebrity_records(api_object, [celebrity, 'Not a celebrity'], workers_per_host=1))
+	assert [record['Celebrity'] for record in records] == [celebrity]
+	assert list(records[0]) == create_celebrity_data_set.CELEB_COLUMNS
+	assert records[0]['Avg. 21-Day Price/Current Price'] == round(255000/262000, 3)
+
+def test_iter_celebrity_records_max_pending(api_object):
+	with pytest.raises(AssertionError):
+		next(create_celebrity_data_set.iter_celebrity_records(api_object, [celebrity], max_pending=0))
+
+def test_aiter_celebrity_records_yields_records(api_object):
+	async def collect():
+		return([record async for record in create_celebrity_data_set.aiter_celebrity_records(api_object, [celebrity])])
+	assert len(asyncio.run(collect())) == 1
+
+def test_to_typed_frame_dtypes(api_object):
+	df = create_celebrity_data_set.collect_celeb_data(api_object, [celebrity], workers_per_host=1, progress=False, birth_dates=True)
+	df_typed = create_celebrity_data_set.to_typed_frame(df)
+	assert {column:str(dtype) for column, dtype in df_typed.dtypes.items()} == create_celebrity_data_set.CELEB_DTYPES
+
+def test_to_typed_frame_nan_placeholders():
+	df = pd.DataFrame({'Current Price':[1000, 'NaN'], 'Gender':['Male', 'NaN']})
+	df_typed = create_celebrity_data_set.to_typed_frame(df)
+	assert df_typed['Current Price'].isna().tolist() == [False, True]
+	assert df_typed['Gender'].isna().tolist() == [False, True]
+	assert list(df_typed['Gender'].cat.categories) == ['Male']
+
+def test_write_snapshot_parquet_round_trip(api_object, soup_cb, soup_as, tmp_path):
+	pytest.importorskip('pyarrow')
+	df = create_celebrity_data_set.get_celeb_data(api_object, soup_cb, soup_as, celebrity)
+	path = str(tmp_path / 'celebrity_data_attributes_2020-12-11_19_46_49.parquet')
+	create_celebrity_data_set.write_snapshot(df, path)
+	assert create_celebrity_data_set.read_snapshot(path).equals(create_celebrity_data_set.to_typed_frame(df))
+
+def test_birthday_calendar_from_written_snapshot(api_object, soup_as, tmp_path):
+	df = create_celebrity_data_set.collect_celeb_data(api_object, [celebrity], workers_per_host=1, progress=False, birth_dates=True)
+	assert list(df.columns) == create_celebrity_data_set.CELEB_COLUMNS + ['Birth Date']
+	path = str(tmp_path / 'celebrity_data_attributes_2020-12-11_19_46_49.csv')
+	create_celebrity_data_set.write_snapshot(df, path)
+	birthdays = birthday_calendar.BirthdayCalendar.from_frame(create_celebrity_data_set.read_snapshot(path))
+	assert birthdays.get_birth_date(celebrity) == create_celebrity_data_set.get_birth_date(soup_as)
+
+def test_checkpoint_keeps_birth_date(api_object, soup_as, tmp_path):
+	create_celebrity_data_set.collect_celeb_data(api_object, [celebrity], workers_per_host=1, progress=False, checkpoint_dir=str(tmp_path))
+	birthdays = birthday_calendar.BirthdayCalendar.from_frame(create_celebrity_data_set.load_checkpoint(str(tmp_path))[1])
+	assert birthdays.get_birth_date(celebrity) == create_celebrity_data_set.get_birth_date(soup_as)
+
+def test_get_birth_date_type_date(soup_as):
+	assert type(create_celebrity_data_set.get_birth_date(soup_as)) == date
+
+def make_derived_frame(records):
+	buffer = create_celebrity_data_set.CelebRecordBuffer(create_celebrity_data_set.CELEB_COLUMNS + create_celebrity_data_set.DERIVED_SOURCE_COLUMNS)
+	for record in records:
+		buffer.append(record)
+	return(buffer.to_frame())
+
+def test_add_derived_metrics_ratios():
+	df = make_derived_frame([{'Current Price':1000, 'Avg. 21-Day Price':500, 'All-Time High Price':3000},
+							 {'Current Price':0, 'Avg. 21-Day Price':500, 'All-Time High Price':3000},
+							 {'Current Price':'NaN', 'Avg. 21-Day Price':'NaN', 'All-Time High Price':3000}])
+	df = create_celebrity_data_set.add_derived_metrics(df)
+	assert df['Avg. 21-Day Price/Current Price'].tolist()[0] == 0.5
+	assert df['All-Time High Price/Current Price'].tolist()[0] == 3.0
+	assert df['Avg. 21-Day Price/Current Price'].iloc[1:].isna().all()
+
+def test_add_derived_metrics_days_since_ath():
+	df = make_derived_frame([{'Current Price':1, 'All-Time High Date':date(2020, 12, 1)},
+							 {'Current Price':1, 'All-Time High Date':'NaN', 'Days Since All-Time High Price':5}])
+	df = create_celebrity_data_set.add_derived_metrics(df, today=date(2020, 12, 11))
+	assert df['Days Since All-Time High Price'].tolist() == [10, 5]
+
+def test_add_derived_metrics_birthday_window_wraps_year():
+	df = make_derived_frame([{'Current Price':1, 'Birth Date':date(1990, 1, 2)},
+							 {'Current Price':1, 'Birth Date':date(1990, 12, 20)},
+							 {'Current Price':1, 'Birth Date':date(2000, 2, 29)}])
+	df = create_celebrity_data_set.add_derived_metrics(df, today=date(2020, 12, 30))
+	assert df['Upcoming Birthday'].tolist() == ['Upcoming birthday', 'No upcoming birthday', 'No upcoming birthday']
+	df = create_celebrity_data_set.add_derived_metrics(df, today=date(2021, 2, 25))
+	assert df['Upcoming Birthday'].tolist()[2] == 'Upcoming birthday'
+
+def test_add_derived_metrics_age_buckets():
+	df = make_derived_frame([{'Current Price':1, 'Age':29}, {'Current Price':1, 'Age':30}, {'Current Price':1, 'Age':'NaN'}])
+	df = create_celebrity_data_set.add_derived_metrics(df, age_bins=[0, 30, 120], age_labels=['Under 30', '30+'])
+	assert df['Age Bucket'].tolist()[0:2] == ['Under 30', '30+']
+	assert pd.isna(df['Age Bucket'].tolist()[2])
+
+def test_get_page_attributes_matches_extractors(soup_as):
+	content_as = create_celebrity_data_set.fetch_url(create_celebrity_data_set.get_astroseek_url(celebrity)).content
+	attributes = create_celebrity_data_set.get_page_attributes(content_as, create_celebrity_data_set.ASTROSEEK_HOST)
+	assert attributes == create_celebrity_data_set.get_astroseek_attributes(soup_as)
+
+def test_get_page_attributes_unknown_host():
+	with pytest.raises(ValueError):
+		create_celebrity_data_set.get_page_attributes(b'<html></html>', 'example.com')
+
+def test_get_celeb_record_parse_pool_matches_in_thread(api_object):
+	record = create_celebrity_data_set.get_celeb_record(api_object, celebrity)
+	with create_celebrity_data_set.create_parse_pool(1) as parse_pool:
+		record_pool = create_celebrity_data_set.get_celeb_record(api_object, celebrity, parse_pool=parse_pool)
+	assert {key:value for key, value in record_pool.items() if key != 'Last Update'} == {key:value for key, value in record.items() if key != 'Last Update'}
+
+def test_collect_celeb_data_parse_workers(api_object):
+	df = create_celebrity_data_set.collect_celeb_data(api_object, [celebrity, 'Not a celebrity'], workers_per_host=2, progress=False, parse_workers=2)
+	assert df['Celebrity'].tolist() == [celebrity]
+
+def test_create_parse_pool_zero_workers():
+	with pytest.raises(AssertionError):
+		create_celebrity_data_set.create_parse_pool(0)
+
+def make_previous_frame(api_object):
+	names = [value['name'] for value in api_object['CelebrityValues']]
+	prices = {value['name']:value['price'] for value in api_object['CelebrityValues']}
+	df = create_celebrity_data_set.collect_celeb_data(api_object, [celebrity], progress=False)
+	buffer = create_celebrity_data_set.CelebRecordBuffer()
+	for num, name in enumerate(names[0:4]):
+		row = df.iloc[0].to_dict() if name == celebrity else {'Celebrity':name, 'Gender':'Female'}
+		buffer.append(dict(row, **{'Current Price':prices[name] * (2 if name == celebrity else 1), 'Last Update':datetime(2020, 12, 1 + num)}))
+	return(buffer.to_frame())
+
+def test_refresh_celeb_data_keeps_failed_rows(api_object):
+	df_previous = make_previous_frame(api_object)
+	df = create_celebrity_data_set.refresh_celeb_data(df_previous, api_object, progress=False)
+	assert df['Celebrity'].tolist() == df_previous['Celebrity'].tolist()
+	assert df.loc[1, 'Current Price'] == create_celebrity_data_set.get_celebritybucks_price(api_object, celebrity)
+	assert df.loc[0, 'Last Update'] == df_previous.loc[0, 'Last Update']
+
+def test_prioritise_celebrities_rank(api_object):
+	assert create_celebrity_data_set.prioritise_celebrities(api_object) == create_celebrity_data_set.get_celebrity_list(api_object)
+
+def test_prioritise_celebrities_price_movement(api_object):
+	order = create_celebrity_data_set.prioritise_celebrities(api_object, 'price_movement', make_previous_frame(api_object))
+	assert order[0:2] == ["Conan O'Brien", celebrity]
+
+def test_prioritise_celebrities_staleness(api_object):
+	order = create_celebrity_data_set.prioritise_celebrities(api_object, 'staleness', make_previous_frame(api_object))
+	assert order == ["Conan O'Brien", 'Taylor Swift', celebrity, 'Kim Kardashian', 'Samuel L. Jackson']
+
+def test_prioritise_celebrities_requires_previous_frame(api_object):
+	with pytest.raises(AssertionError):
+		create_celebrity_data_set.prioritise_celebrities(api_object, 'staleness')
+
+def test_collect_celeb_data_request_budget(api_object):
+	df = create_celebrity_data_set.collect_celeb_data(api_object, [celebrity, celebrity], progress=False, request_budget=3)
+	assert len(df) == 1
+
+def test_schedule_crawl_request_budget(api_object):
+	df = create_celebrity_data_set.schedule_crawl(api_object, 'price_movement', make_previous_frame(api_object), request_budget=3, progress=False)
+	assert df['Celebrity'].tolist() == ['Taylor Swift', celebrity, 'Kim Kardashian', 'Samuel L. Jackson']
+	assert df['Freshness'].tolist() == ['Stale', 'Fresh', 'Stale', 'Stale']
+	assert df.loc[1, 'Current Price'] == create_celebrity_data_set.get_celebritybucks_price(api_object, celebrity)
+
+def test_schedule_crawl_time_budget_spent(api_object):
+	df = create_celebrity_data_set.schedule_crawl(api_object, 'rank', make_previous_frame(api_object), time_budget=0, progress=False)
+	assert set(df['Freshness']) == {'Stale'}
+	assert len(df) == 4
+
+def test_collect_celeb_data_survives_failed_fetch(api_object, monkeypatch):
+	class FailingSession:
+		def get(self, url, timeout=None, headers=None):
+			if 'Taylor' in url:
+				raise requests.exceptions.ConnectionError('Connection refused')
+			return(create_celebrity_data_set.get_session().get(url, timeout=timeout, headers=headers))
+
+	monkeypatch.setattr(create_celebrity_data_set, 'DEFAULT_RETRIES', 0)
+	df = create_celebrity_data_set.collect_celeb_data(api_object, ['Taylor Swift', celebrity], progress=False, session=FailingSession())
+	assert df['Celebrity'].tolist() == [celebrity]
+
+def test_get_celeb_record_missing_prices_keep_record(api_object, soup_as):
+	astroseek_attributes = create_celebrity_data_set.get_astroseek_attributes(soup_as)
+	session = FakeSession([make_response(url=create_celebrity_data_set.get_celebritybucks_url(api_object, celebrity))])
+	record = create_celebrity_data_set.get_celeb_record(api_object, celebrity, session=session, astroseek_attributes=astroseek_attributes)
+	assert record['Avg. 21-Day Price'] == 'NaN'
+	assert record['Avg. 21-Day Price/Current Price'] == 'NaN'
+	assert record['Current Price'] == create_celebrity_data_set.get_celebritybucks_price(api_object, celebrity)
+
+def test_get_celeb_record_unknown_celebrity_not_fetched(api_object):
+	session = FakeSession([])
+	assert create_celebrity_data_set.get_celeb_record(api_object, 'Not a celebrity', session=session) is None
+	assert session.calls == 0
+
+def test_get_celeb_record_error_page_no_record(api_object):
+	assert create_celebrity_data_set.get_celeb_record(api_object, 'Taylor Swift') is None
+	df = create_celebrity_data_set.collect_celeb_data(api_object, ['Taylor Swift', celebrity], progress=False)
+	assert df['Celebrity'].tolist() == [celebrity]
@@ -0,0 +1,54 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import lazy_import
+import json
+import subprocess
+import sys
+
+
+#Initializing parameter values for unit tests
+heavy_modules = ['pandas', 'bs4', 'requests']
+
+#Seconds allowed for importing the package's core module in a fresh interpreter, well below the time taken with eager imports
+import_time_budget = 0.4
+
+
+def run_in_fresh_interpreter(code):
+	result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+	return(json.loads(result.stdout))
+
+
+#Unit tests
+def test_lazy_module_imports_on_first_use():
+	module = lazy_import.LazyModule('json')
+	assert 'unloaded' in repr(module)
+	assert module.dumps([1]) == '[1]'
+	assert 'loaded' in repr(module) and 'unloaded' not in repr(module)
+
+def test_import_defers_heavy_modules():
+	loaded = run_in_fresh_interpreter(f"""
+import json, sys
+import celebrity_bucks_game_player_advantage.create_celebrity_data_set
+print(json.dumps([module for module in {heavy_modules!r} if module in sys.modules]))
+""")
+	assert loaded == []
+
+def test_index_lookups_defer_heavy_modules():
+	loaded = run_in_fresh_interpreter(f"""
+import json, sys
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+index = create_celebrity_data_set.CelebrityIndex({{'CelebrityValues':[{{'celebId':'2488', 'name':'Barack Obama', 'price':262000}}]}})
+assert create_celebrity_data_set.get_celebritybucks_price(index, 'Barack Obama') == 262000
+assert create_celebrity_data_set.get_celebritybucks_ranking(index, 'Barack Obama') == 1
+create_celebrity_data_set.get_astroseek_url('Barack Obama')
+print(json.dumps([module for module in {heavy_modules!r} if module in sys.modules]))
+""")
+	assert loaded == []
+
+def test_import_time_budget():
+	import_times = [run_in_fresh_interpreter("""
+import time
+start = time.perf_counter()
+import celebrity_bucks_game_player_advantage.create_celebrity_data_set
+print(time.perf_counter() - start)
+""") for attempt in range(3)]
+	assert min(import_times) < import_time_budget
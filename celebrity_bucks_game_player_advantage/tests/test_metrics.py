@@ -0,0 +1,101 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import metrics
+from celebrity_bucks_game_player_advantage import replay
+from celebrity_bucks_game_player_advantage import response_cache
+from tests.helpers import FakeSession, make_response
+import json
+import os
+import pytest
+
+
+#Initializing parameter values for unit tests
+url = 'https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope'
+fixtures_dir = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+@pytest.fixture
+def crawl_metrics():
+	crawl_metrics = metrics.CrawlMetrics()
+	create_celebrity_data_set.set_metrics(crawl_metrics)
+	yield crawl_metrics
+	create_celebrity_data_set.set_metrics(None)
+
+
+#Unit tests
+def test_crawl_metrics_timing():
+	crawl_metrics = metrics.CrawlMetrics()
+	crawl_metrics.observe('parse', 0.5, host='celebritybucks.com')
+	crawl_metrics.observe('parse', 1.5, host='celebritybucks.com')
+	assert crawl_metrics.get_timing('parse', host='celebritybucks.com') == {'count':2, 'total_seconds':2.0, 'max_seconds':1.5}
+	assert crawl_metrics.get_timing('parse')['count'] == 0
+
+def test_crawl_metrics_time_context_manager():
+	crawl_metrics = metrics.CrawlMetrics()
+	with crawl_metrics.time('record'):
+		pass
+	assert crawl_metrics.get_timing('record')['count'] == 1
+
+def test_crawl_metrics_counters():
+	crawl_metrics = metrics.CrawlMetrics()
+	crawl_metrics.increment('retries', host='celebritybucks.com')
+	crawl_metrics.increment('retries', 2, host='www.astro-seek.com')
+	assert crawl_metrics.get_count('retries', host='www.astro-seek.com') == 2
+	assert crawl_metrics.get_count('retries') == 3
+
+def test_crawl_metrics_slowest_celebrities():
+	crawl_metrics = metrics.CrawlMetrics()
+	for celebrity, seconds in [('A', 1.0), ('B', 3.0), ('C', 2.0)]:
+		crawl_metrics.observe_celebrity(celebrity, seconds)
+	assert crawl_metrics.get_slowest_celebrities(2) == [('B', 3.0), ('C', 2.0)]
+
+def test_crawl_metrics_to_json(tmp_path):
+	crawl_metrics = metrics.CrawlMetrics()
+	crawl_metrics.increment('cache_hits', host='celebritybucks.com')
+	path = str(tmp_path / 'metrics.json')
+	crawl_metrics.to_json(path)
+	with open(path) as metrics_file:
+		assert json.load(metrics_file)['counters'] == [{'name':'cache_hits', 'labels':{'host':'celebritybucks.com'}, 'value':1}]
+
+def test_crawl_metrics_to_prometheus():
+	crawl_metrics = metrics.CrawlMetrics()
+	crawl_metrics.observe('parse', 0.25, host='celebritybucks.com')
+	crawl_metrics.increment('nan_fallbacks', column='Age "years"')
+	text = crawl_metrics.to_prometheus()
+	assert 'celebrity_bucks_stage_seconds_count{stage="parse",host="celebritybucks.com"} 1' in text
+	assert 'celebrity_bucks_stage_seconds_sum{stage="parse",host="celebritybucks.com"} 0.25' in text
+	assert 'celebrity_bucks_nan_fallbacks_total{column="Age \\"years\\""} 1' in text
+
+def test_fetch_url_counts_cache_hits(crawl_metrics):
+	cache = response_cache.ResponseCache(':memory:')
+	session = FakeSession([make_response()])
+	create_celebrity_data_set.fetch_url(url, session, cache=cache)
+	create_celebrity_data_set.fetch_url(url, session, cache=cache)
+	assert crawl_metrics.get_count('cache_misses', host='www.astro-seek.com') == 1
+	assert crawl_metrics.get_count('cache_hits', host='www.astro-seek.com') == 1
+	assert crawl_metrics.get_count('requests', host='www.astro-seek.com', status=200) == 1
+
+def test_fetch_url_counts_retries(crawl_metrics, monkeypatch):
+	monkeypatch.setattr(create_celebrity_data_set.time, 'sleep', lambda seconds: None)
+	session = FakeSession([make_response(503), make_response(200)])
+	create_celebrity_data_set.fetch_url(url, session, retries=1)
+	assert crawl_metrics.get_count('retries', host='www.astro-seek.com') == 1
+	assert crawl_metrics.get_timing('fetch', host='www.astro-seek.com')['count'] == 2
+
+def test_extractors_timed(crawl_metrics):
+	soup_as = create_celebrity_data_set.parse_page('<div class="fl">Obama</div><div class="fl">Male</div>', create_celebrity_data_set.ASTROSEEK_HOST)
+	create_celebrity_data_set.get_astroseek_attributes(soup_as)
+	assert crawl_metrics.get_timing('parse', host='www.astro-seek.com')['count'] == 1
+	assert crawl_metrics.get_timing('extract', extractor='gender')['count'] == 1
+
+def test_get_celeb_record_counts_nan_fallbacks(crawl_metrics):
+	session = replay.ReplaySession(fixtures_dir)
+	api_object = replay.load_response(fixtures_dir, 'https://celebritybucks.com/developers/export/JSON').json()
+	astroseek_attributes = {'Gender':'Male', 'Age':'NaN', 'Upcoming Birthday':'NaN', 'U.S. Nationality':'U.S. national', 'Living Status':'Alive'}
+	create_celebrity_data_set.get_celeb_record(api_object, 'Barack Obama', session=session, astroseek_attributes=astroseek_attributes)
+	create_celebrity_data_set.get_celeb_record(api_object, 'Not a celebrity', session=session)
+	assert crawl_metrics.get_count('nan_fallbacks', column='Age') == 1
+	assert crawl_metrics.get_count('nan_fallbacks', column='Gender') == 0
+	assert crawl_metrics.get_count('failed_records') == 1
+	assert crawl_metrics.get_timing('record')['count'] == 2
+	assert len(crawl_metrics.get_slowest_celebrities()) == 2
@@ -0,0 +1,64 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import price_history
+from datetime import datetime
+import pytest
+
+
+#Initializing parameter values for unit tests
+def make_api_object(eminem_price):
+	return({'CelebrityValues':[{'name':'Taylor Swift', 'price':929000, 'celebId':'1093'},
+							   {'name':'Eminem', 'price':eminem_price, 'celebId':'2488'}]})
+
+
+@pytest.fixture
+def store():
+	store = price_history.PriceHistoryStore(':memory:')
+	store.append_snapshot(make_api_object(12000), datetime(2020, 12, 1))
+	store.append_snapshot(make_api_object(21000), datetime(2020, 12, 5))
+	store.append_snapshot(make_api_object(14000), datetime(2020, 12, 11))
+	return(store)
+
+
+#Unit tests
+def test_append_snapshot_row_count(store):
+	assert len(store) == 6
+
+def test_append_snapshot_same_time_ignored(store):
+	assert store.append_snapshot(make_api_object(1), datetime(2020, 12, 11)) == 0
+
+def test_append_snapshot_celebrity_index():
+	store = price_history.PriceHistoryStore(':memory:')
+	assert store.append_snapshot(create_celebrity_data_set.CelebrityIndex(make_api_object(12000))) == 2
+
+def test_get_history_range(store):
+	history = store.get_history('2488', start=datetime(2020, 12, 2), end=datetime(2020, 12, 11))
+	assert history['Current Price'].tolist() == [21000, 14000]
+	assert history['Current Ranking'].tolist() == [2, 2]
+	assert list(history.columns) == ['Recorded At', 'Current Price', 'Current Ranking']
+
+def test_get_snapshots(store):
+	df = store.get_snapshots(start=datetime(2020, 12, 11))
+	assert df['Celebrity'].tolist() == ['Taylor Swift', 'Eminem']
+
+def test_get_celeb_ids(store):
+	assert store.get_celeb_ids('Eminem') == ['2488']
+
+def test_get_rolling_average_price(store):
+	assert price_history.get_rolling_average_price(store, '2488', days=7, end=datetime(2020, 12, 11)) == 17500
+
+def test_get_rolling_average_price_no_history(store):
+	assert price_history.get_rolling_average_price(store, '9999') == 'NaN'
+
+def test_get_all_time_high(store):
+	assert price_history.get_all_time_high(store, '2488') == (21000, datetime(2020, 12, 5))
+
+def test_get_drawdown(store):
+	assert price_history.get_drawdown(store, '2488') == 0.333
+
+def test_price_history_persists(tmp_path):
+	path = str(tmp_path / 'price_history.sqlite')
+	store = price_history.PriceHistoryStore(path)
+	store.append_snapshot(make_api_object(12000), datetime(2020, 12, 1))
+	store.close()
+	assert len(price_history.PriceHistoryStore(path)) == 2
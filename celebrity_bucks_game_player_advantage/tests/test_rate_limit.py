@@ -0,0 +1,82 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import rate_limit
+from tests.helpers import FakeSession, make_response
+import pytest
+import requests
+import time
+
+
+#Initializing parameter values for unit tests
+url = 'https://celebritybucks.com/developers/export/JSON'
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+	delays = []
+	monkeypatch.setattr(time, 'sleep', delays.append)
+	return(delays)
+
+
+#Unit tests
+def test_get_retry_delay_retry_after_seconds():
+	assert rate_limit.get_retry_delay(1, make_response(429, headers={'Retry-After':'7'})) == 7
+
+def test_get_retry_delay_retry_after_capped():
+	assert rate_limit.get_retry_delay(1, make_response(429, headers={'Retry-After':'600'}), max_backoff=60) == 60
+
+def test_get_retry_delay_retry_after_date_in_past():
+	assert rate_limit.get_retry_delay(1, make_response(503, headers={'Retry-After':'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0
+
+def test_get_retry_delay_exponential_bounds():
+	for attempt in range(1, 6):
+		assert 0 <= rate_limit.get_retry_delay(attempt, backoff=1.0) <= 2 ** (attempt - 1)
+
+def test_host_rate_limiter_paces_requests(sleeps):
+	limiter = rate_limit.HostRateLimiter(requests_per_second=2)
+	for num in range(4):
+		with limiter.limit(url):
+			pass
+	assert len(sleeps) == 2
+	assert sleeps[-1] == pytest.approx(1.0, abs=0.1)
+
+def test_host_rate_limiter_ignores_other_hosts(sleeps):
+	limiter = rate_limit.HostRateLimiter(requests_per_second=1)
+	for num in range(3):
+		with limiter.limit('https://example.com/'):
+			pass
+	assert sleeps == []
+
+def test_host_rate_limiter_throttle_and_recover():
+	limiter = rate_limit.HostRateLimiter(requests_per_second=4)
+	limiter.throttle(url)
+	assert limiter.get_rate('celebritybucks.com') == 2
+	for num in range(10):
+		limiter.recover(url)
+	assert limiter.get_rate('celebritybucks.com') == 4
+
+def test_host_rate_limiter_zero_in_flight():
+	with pytest.raises(AssertionError):
+		rate_limit.HostRateLimiter(max_in_flight=0)
+
+def test_fetch_url_retries_server_errors(sleeps):
+	session = FakeSession([make_response(503), make_response(429, headers={'Retry-After':'2'}), make_response(200)])
+	response = create_celebrity_data_set.fetch_url(url, session, retries=3)
+	assert response.status_code == 200
+	assert session.calls == 3
+	assert sleeps[-1] == 2
+
+def test_fetch_url_gives_up_after_retries(sleeps):
+	session = FakeSession([make_response(503), make_response(503)])
+	assert create_celebrity_data_set.fetch_url(url, session, retries=1).status_code == 503
+	assert session.calls == 2
+
+def test_fetch_url_retries_connection_errors(sleeps):
+	session = FakeSession([requests.exceptions.ConnectionError(), make_response(200)])
+	assert create_celebrity_data_set.fetch_url(url, session, retries=1).status_code == 200
+
+def test_fetch_url_throttles_on_429(sleeps):
+	limiter = rate_limit.HostRateLimiter(requests_per_second=4)
+	session = FakeSession([make_response(429), make_response(404)])
+	create_celebrity_data_set.fetch_url(url, session, rate_limiter=limiter, retries=1)
+	assert limiter.get_rate('celebritybucks.com') < 4
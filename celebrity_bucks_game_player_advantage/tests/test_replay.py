@@ -0,0 +1,55 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import replay
+from tests.helpers import FakeSession, make_response
+import pytest
+import requests
+
+
+#Initializing parameter values for unit tests
+url = 'https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope'
+
+
+#Unit tests
+def test_record_and_load_response(tmp_path):
+	replay.record_response(str(tmp_path), url, make_response(content=b'birth chart', headers={'Content-Type':'text/html', 'Content-Length':'11'}))
+	response = replay.load_response(str(tmp_path), url)
+	assert response.content == b'birth chart'
+	assert dict(response.headers) == {'Content-Type':'text/html'}
+
+def test_load_response_missing(tmp_path):
+	assert replay.load_response(str(tmp_path), url) is None
+
+def test_get_fixture_name_ignores_scheme_and_port():
+	assert replay.get_fixture_name(url) == replay.get_fixture_name('http://www.astro-seek.com:8000/birth-chart/Barack-Obama-horoscope')
+	assert replay.get_fixture_name(url) != replay.get_fixture_name(url + '?page=2')
+
+def test_recording_session(tmp_path):
+	session = replay.RecordingSession(str(tmp_path), FakeSession([make_response(content=b'recorded')]))
+	assert session.get(url).content == b'recorded'
+	assert replay.ReplaySession(str(tmp_path)).get(url).content == b'recorded'
+
+def test_replay_session_unrecorded_url(tmp_path):
+	assert replay.ReplaySession(str(tmp_path)).get(url).status_code == 404
+
+def test_stub_server(tmp_path):
+	replay.record_response(str(tmp_path), url, make_response(content=b'birth chart'))
+	with replay.StubServer(str(tmp_path)) as server:
+		base_url = server.get_base_url(create_celebrity_data_set.ASTROSEEK_HOST)
+		assert requests.get(f'{base_url}/birth-chart/Barack-Obama-horoscope').content == b'birth chart'
+		assert requests.get(f'{base_url}/birth-chart/Not-a-celebrity-horoscope').status_code == 404
+
+def test_set_base_url(tmp_path):
+	replay.record_response(str(tmp_path), url, make_response(content=b'<div class="fl">Obama</div><div class="fl">Male</div>'))
+	base_url = create_celebrity_data_set.get_base_url(create_celebrity_data_set.ASTROSEEK_HOST)
+	with replay.StubServer(str(tmp_path)) as server:
+		create_celebrity_data_set.set_base_url(create_celebrity_data_set.ASTROSEEK_HOST, server.get_base_url(create_celebrity_data_set.ASTROSEEK_HOST))
+		try:
+			soup_as = create_celebrity_data_set.get_astroseek_soup_object('Barack Obama', session=requests.Session())
+		finally:
+			create_celebrity_data_set.set_base_url(create_celebrity_data_set.ASTROSEEK_HOST, base_url)
+	assert create_celebrity_data_set.get_gender(soup_as) == 'Male'
+
+def test_set_base_url_unknown_host():
+	with pytest.raises(AssertionError):
+		create_celebrity_data_set.set_base_url('example.com', 'http://127.0.0.1')
@@ -0,0 +1,80 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import response_cache
+from tests.helpers import FakeSession, make_response
+
+
+#Initializing parameter values for unit tests
+url = 'https://www.astro-seek.com/birth-chart/Barack-Obama-horoscope'
+
+
+#Unit tests
+def test_response_cache_miss():
+	cache = response_cache.ResponseCache(':memory:')
+	assert cache.get(url) == (None, False)
+
+def test_response_cache_store_and_get():
+	cache = response_cache.ResponseCache(':memory:')
+	cache.store(url, make_response(content=b'birth chart', headers={'ETag':'"abc"'}))
+	cached_response, fresh = cache.get(url)
+	assert fresh
+	assert cached_response.content == b'birth chart'
+	assert cached_response.headers['etag'] == '"abc"'
+
+def test_response_cache_skips_errors():
+	cache = response_cache.ResponseCache(':memory:')
+	cache.store(url, make_response(status_code=404))
+	assert len(cache) == 0
+
+def test_response_cache_ttl_per_host():
+	cache = response_cache.ResponseCache(':memory:', ttls={'www.astro-seek.com':0})
+	cache.store(url, make_response())
+	assert cache.get(url)[1] == False
+	assert cache.get_ttl('https://celebritybucks.com/developers/export/JSON') == response_cache.DEFAULT_TTL
+
+def test_response_cache_lru_eviction_by_entries():
+	cache = response_cache.ResponseCache(':memory:', max_entries=2)
+	cache.store('https://celebritybucks.com/a', make_response())
+	cache.store('https://celebritybucks.com/b', make_response())
+	cache.get('https://celebritybucks.com/a')
+	cache.store('https://celebritybucks.com/c', make_response())
+	assert len(cache) == 2
+	assert cache.get('https://celebritybucks.com/b') == (None, False)
+
+def test_response_cache_lru_eviction_by_bytes():
+	cache = response_cache.ResponseCache(':memory:', max_bytes=10)
+	cache.store('https://celebritybucks.com/a', make_response(content=b'123456'))
+	cache.store('https://celebritybucks.com/b', make_response(content=b'123456'))
+	assert len(cache) == 1
+	assert cache.get('https://celebritybucks.com/b')[0].content == b'123456'
+
+def test_response_cache_persists(tmp_path):
+	path = str(tmp_path / 'cache.sqlite')
+	cache = response_cache.ResponseCache(path)
+	cache.store(url, make_response(content=b'birth chart'))
+	cache.close()
+	assert response_cache.ResponseCache(path).get(url)[0].content == b'birth chart'
+
+def test_get_revalidation_headers():
+	response = make_response(headers={'ETag':'"abc"', 'Last-Modified':'Wed, 21 Oct 2015 07:28:00 GMT'})
+	assert response_cache.get_revalidation_headers(response) == {'If-None-Match':'"abc"', 'If-Modified-Since':'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+def test_fetch_url_fresh_cache_hit():
+	cache = response_cache.ResponseCache(':memory:')
+	cache.store(url, make_response(content=b'cached'))
+	session = FakeSession([])
+	assert create_celebrity_data_set.fetch_url(url, session, cache=cache).content == b'cached'
+	assert session.requests == []
+
+def test_fetch_url_revalidates_expired_entry():
+	cache = response_cache.ResponseCache(':memory:', ttls={'www.astro-seek.com':0})
+	cache.store(url, make_response(content=b'cached', headers={'ETag':'"abc"'}))
+	session = FakeSession([make_response(status_code=304)])
+	assert create_celebrity_data_set.fetch_url(url, session, cache=cache).content == b'cached'
+	assert session.requests == [{'If-None-Match':'"abc"'}]
+
+def test_fetch_url_stores_response():
+	cache = response_cache.ResponseCache(':memory:')
+	session = FakeSession([make_response(content=b'fetched')])
+	create_celebrity_data_set.fetch_url(url, session, cache=cache)
+	assert cache.get(url)[0].content == b'fetched'
@@ -0,0 +1,103 @@
+#Importing dependencies
+from celebrity_bucks_game_player_advantage import create_celebrity_data_set
+from celebrity_bucks_game_player_advantage import replay
+from celebrity_bucks_game_player_advantage import response_cache
+from celebrity_bucks_game_player_advantage import slug_index
+import os
+import pytest
+import re
+
+
+#Initializing parameter values for unit tests
+fixtures_dir = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class CountingSession(replay.ReplaySession):
+	"""
+	Answers requests from the recorded fixtures and keeps the requested URLs. Every celebrity gets the recorded Celebrity Bucks webpage of Barack Obama, so records are assembled for celebrities without an Astro Seek birth chart.
+	"""
+	def __init__(self, directory):
+		super().__init__(directory)
+		self.urls = []
+
+	def get(self, url, timeout=None, headers=None):
+		self.urls.append(url)
+		url = re.sub(r'/celebrity/\d+/[^/]+$', '/celebrity/2488/Barack-Obama', url)
+		return(super().get(url, timeout=timeout, headers=headers))
+
+
+@pytest.fixture
+def index():
+	index = slug_index.SlugIndex(':memory:')
+	create_celebrity_data_set.set_slug_index(index)
+	yield index
+	create_celebrity_data_set.set_slug_index(None)
+
+
+#Unit tests
+def test_normalise_name():
+	assert slug_index.normalise_name('  Beyoncé  Knowles-Carter ') == 'beyonce knowles carter'
+	assert slug_index.normalise_name('Samuel L. Jackson') == slug_index.normalise_name('samuel l jackson')
+
+def test_slug_index_record_hit_and_miss():
+	index = slug_index.SlugIndex(':memory:')
+	index.record_hit('Barack Obama', 'Barack-Obama')
+	index.record_miss('Not a celebrity')
+	assert index.get_slug('barack obama') == 'Barack-Obama'
+	assert index.is_miss('Not a Celebrity')
+	assert index.get('Unknown') is None
+	assert len(index) == 2
+
+def test_slug_index_override_not_replaced():
+	index = slug_index.SlugIndex(':memory:')
+	index.set_override('Prince', 'Prince-Rogers-Nelson')
+	index.record_miss('Prince')
+	assert index.get_slug('Prince') == 'Prince-Rogers-Nelson'
+	assert not index.is_miss('Prince')
+
+def test_slug_index_alias():
+	index = slug_index.SlugIndex(':memory:')
+	index.record_hit('Stefani Germanotta', 'Lady-Gaga')
+	index.add_alias('Lady Gaga', 'Stefani Germanotta')
+	assert index.get_slug('lady gaga') == 'Lady-Gaga'
+
+def test_slug_index_miss_ttl():
+	index = slug_index.SlugIndex(':memory:', miss_ttl=0)
+	index.record_miss('Not a celebrity')
+	assert not index.is_miss('Not a celebrity')
+
+def test_slug_index_persists(tmp_path):
+	path = str(tmp_path / 'slug_index.sqlite')
+	index = slug_index.SlugIndex(path)
+	index.record_miss('Not a celebrity')
+	index.close()
+	assert slug_index.SlugIndex(path).is_miss('Not a celebrity')
+
+def test_get_astroseek_url_uses_override(index):
+	index.set_override('Prince', 'Prince-Rogers-Nelson')
+	assert create_celebrity_data_set.get_astroseek_url('Prince') == 'https://www.astro-seek.com/birth-chart/Prince-Rogers-Nelson-horoscope'
+
+def test_get_celeb_record_skips_known_misses(index):
+	api_object = create_celebrity_data_set.get_celebritybucks_api_object(replay.ReplaySession(fixtures_dir))
+	session = CountingSession(fixtures_dir)
+	create_celebrity_data_set.get_celeb_record(api_object, 'Taylor Swift', session=session)
+	create_celebrity_data_set.get_celeb_record(api_object, 'Barack Obama', session=session)
+	assert index.is_miss('Taylor Swift')
+	assert index.get_slug('Barack Obama') == 'Barack-Obama'
+
+	session.urls = []
+	create_celebrity_data_set.get_celeb_record(api_object, 'Taylor Swift', session=session)
+	assert not any(create_celebrity_data_set.ASTROSEEK_HOST in url for url in session.urls)
+
+def test_get_celeb_record_server_errors_not_recorded(index, monkeypatch):
+	class UnavailableSession(replay.ReplaySession):
+		def get(self, url, timeout=None, headers=None):
+			if create_celebrity_data_set.ASTROSEEK_HOST in url:
+				return(response_cache.build_response(url, 503, {}, b''))
+			return(super().get(url, timeout=timeout, headers=headers))
+
+	monkeypatch.setattr(create_celebrity_data_set, 'DEFAULT_RETRIES', 0)
+	api_object = create_celebrity_data_set.get_celebritybucks_api_object(replay.ReplaySession(fixtures_dir))
+	create_celebrity_data_set.get_celeb_record(api_object, 'Barack Obama', session=UnavailableSession(fixtures_dir))
+	assert not index.is_miss('Barack Obama')
+	assert index.get('Barack Obama') is None